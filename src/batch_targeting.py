@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Recomputes the LOB/CUT/FIX targets of logged engagements with the headless
+targeting engine, in parallel, and writes the results to CSV or JSONL.
+
+Inputs are EW-targeting-log-*.csv files written by the GUI (or directories
+holding them) and JSONL files with one engagement per line, either a log row
+or a set of LOB reports:
+
+    {"id": "A1", "frequency_MHz": 34.25, "min_erp_w": 0.005, "max_erp_w": 50, "path_loss_coeff": 4,
+     "reports": [{"mgrs": "32UQV0029959483", "bearing": 130, "power_received_dBm": -68}, ...]}
+
+Run from the repository root, e.g.:  python src/batch_targeting.py logs/targeting --output results.csv
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from utilities import read_csv, read_json, write_csv
+
+conf = read_json(os.path.join(os.path.dirname(os.path.abspath(__file__)), "config_files", "conf.json"))
+# EWT columns of the GUI targeting log
+LOG_EWT_NUMBERS = (1, 2, 3)
+LOG_FILE_PATTERN = "EW-targeting-log-*.csv"
+
+
+def parse_number(value) -> float:
+    """Returns a logged number (e.g. '1,234.50') as a float, or None if blank."""
+    if value is None or str(value).strip() == "": return None
+    return float(str(value).replace(",", ""))
+
+
+def find_input_files(paths: list[str]) -> list[str]:
+    """Expands directories into their targeting logs and JSONL files."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, LOG_FILE_PATTERN))) + sorted(glob.glob(os.path.join(path, "*.jsonl"))))
+        else:
+            files.append(path)
+    return files
+
+
+def read_jobs(paths: list[str]) -> list[dict]:
+    """Returns one job per logged engagement: the raw "record" with its "source" file and "row" number."""
+    jobs = []
+    for file_path in find_input_files(paths):
+        if file_path.endswith(".jsonl"):
+            with open(file_path, "r", encoding="utf-8") as file:
+                records = [json.loads(line) for line in file if line.strip()]
+        else:
+            records = read_csv(file_path)
+        jobs.extend({"source": os.path.basename(file_path), "row": row, "record": record} for row, record in enumerate(records, start=1))
+    return jobs
+
+
+def get_log_reports(record: dict) -> tuple[list[dict], list[int]]:
+    """Returns the LOB reports of a targeting log row and the EWT number of each."""
+    from coords import convert_mgrs_to_coords
+    reports, ewt_numbers = [], []
+    for n in LOG_EWT_NUMBERS:
+        mgrs = str(record.get(f"EWT_{n}_MGRS") or "").strip().replace(" ", "")
+        if not mgrs: continue
+        reports.append({
+            "coord": convert_mgrs_to_coords(mgrs),
+            "bearing": parse_number(record.get(f"EWT_{n}_LOB_DEGREES")),
+            "power_received_dBm": parse_number(record.get(f"EWT_{n}_PWR_REC_DbM")),
+            "receiver_height_m": conf[f"DEFAULT_SENSOR_{n}_HEIGHT_M"],
+        })
+        ewt_numbers.append(n)
+    return reports, ewt_numbers
+
+
+def get_job_inputs(record: dict) -> dict:
+    """Returns the get_targets inputs of a targeting log row or a JSONL engagement."""
+    from coords import convert_mgrs_to_coords
+    if "reports" in record:
+        reports = [dict(report) for report in record["reports"]]
+        for report in reports:
+            if "coord" not in report: report["coord"] = convert_mgrs_to_coords(str(report["mgrs"]).replace(" ", ""))
+        ewt_numbers = list(range(1, len(reports) + 1))
+        frequency_MHz, min_P_t_watts, max_P_t_watts = record["frequency_MHz"], record["min_erp_w"], record["max_erp_w"]
+        path_loss_coeff = record.get("path_loss_coeff", 4)
+    else:
+        reports, ewt_numbers = get_log_reports(record)
+        frequency_MHz, min_P_t_watts, max_P_t_watts = (parse_number(record.get(key)) for key in ("FREQ_MHz", "MIN_ERP_W", "MAX_ERP_W"))
+        path_loss_coeff = parse_number(record.get("PATH_LOSS_COEFF"))
+    assert None not in (frequency_MHz, min_P_t_watts, max_P_t_watts, path_loss_coeff), "Frequency, ERP and path-loss coefficient are required."
+    return {"reports": reports, "ewt_numbers": ewt_numbers, "frequency_MHz": float(frequency_MHz), "min_P_t_watts": float(min_P_t_watts),
+            "max_P_t_watts": float(max_P_t_watts), "path_loss_coeff": float(path_loss_coeff)}
+
+
+def recompute_job(job: dict, bayesian_fallback: bool = False) -> dict:
+    """Recomputes the targets of one job; failures are reported in the "ERROR" field instead of raised."""
+    from targeting import get_targets
+    record = job["record"]
+    result = {"SOURCE": job["source"], "ROW": job["row"], "ID": record.get("id", record.get("DTG_LOCAL", ""))}
+    try:
+        inputs = get_job_inputs(record)
+        targets = get_targets(inputs["reports"], inputs["frequency_MHz"], inputs["min_P_t_watts"], inputs["max_P_t_watts"],
+                              conf["DEFAULT_TX_GAIN_dBi"], conf["DEFAULT_TX_HEIGHT_M"], conf["DEFAULT_TEMP_F"], inputs["path_loss_coeff"],
+                              bayesian_fallback=bayesian_fallback)
+    except (AssertionError, KeyError, TypeError, ValueError) as e:
+        result["ERROR"] = f"{type(e).__name__}: {e}"
+        return result
+    result.update({
+        "FREQ_MHz": inputs["frequency_MHz"], "MIN_ERP_W": inputs["min_P_t_watts"], "MAX_ERP_W": inputs["max_P_t_watts"],
+        "PATH_LOSS_COEFF": inputs["path_loss_coeff"],
+        "TGT_CLASS": targets["target_class"], "TGT_MGRS": targets["target_mgrs"], "TGT_LATLON": targets["target_coord"],
+        "TGT_ERROR_ACRES": round(targets["target_error_acres"], 2),
+    })
+    for index, n in enumerate(inputs["ewt_numbers"]):
+        lob, band = targets["lobs"][index], targets["distance_bands_km"][index]
+        result[f"EWT_{n}_LOB_TGT_MGRS"] = lob["target_mgrs"] if lob is not None else ""
+        result[f"EWT_{n}_DIST2TGT_KM"] = round(targets["distances_m"][index] / 1000, 3)
+        result[f"EWT_{n}_BEARING_DEGREES"] = targets["bearings_deg"][index]
+        result[f"EWT_{n}_MIN_DIST_KM"] = round(band[0], 3) if band is not None else ""
+        result[f"EWT_{n}_MAX_DIST_KM"] = round(band[1], 3) if band is not None else ""
+    # keep the logged targets next to the recomputed ones for review
+    for key in ("TGT_MGRS", "TGT_MGRS_ACTUAL"):
+        if record.get(key): result[f"LOGGED_{key}"] = record[key]
+    result["ERROR"] = ""
+    return result
+
+
+def run_batch(jobs: list[dict], workers: int = 1, chunksize: int = 16, bayesian_fallback: bool = False) -> list[dict]:
+    """Recomputes every job, in a process pool when workers > 1; results keep the job order."""
+    recompute = partial(recompute_job, bayesian_fallback=bayesian_fallback)
+    if workers <= 1 or len(jobs) <= 1:
+        return [recompute(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(recompute, jobs, chunksize=chunksize))
+
+
+def write_results(results: list[dict], output_path: str) -> None:
+    """Writes the results as JSONL (.jsonl) or CSV (any other extension), with the union of their columns."""
+    if output_path.endswith(".jsonl"):
+        with open(output_path, "w", encoding="utf-8") as file:
+            for result in results:
+                file.write(json.dumps(result) + "\n")
+        return
+    fieldnames = list(dict.fromkeys(key for result in results for key in result))
+    rows = [{key: (", ".join(str(x) for x in result[key]) if isinstance(result.get(key), list) else result.get(key, "")) for key in fieldnames}
+            for result in results]
+    write_csv(output_path, rows)
+
+
+def parse_arguments() -> argparse.Namespace:
+    default_log_directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), conf["DIR_RELATIVE_LOGS_TARGETING"])
+    parser = argparse.ArgumentParser(description="Batch LOB/CUT/FIX recomputation of targeting logs")
+    parser.add_argument("inputs", nargs="*", default=[default_log_directory], help="Targeting log CSV / JSONL files or directories (default: ./logs/targeting)")
+    parser.add_argument("--output", default="batch-targeting-results.csv", help="Results file, .csv or .jsonl (default: batch-targeting-results.csv)")
+    parser.add_argument("--workers", default=os.cpu_count() or 1, type=int, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", default=16, type=int, help="Rows sent to a worker at a time (default: 16)")
+    parser.add_argument("--bayesian", action="store_true", help="Fall back on the Bayesian grid fix when three CUTs do not overlap")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    jobs = read_jobs(args.inputs)
+    if not jobs:
+        print(f"[WARN] No engagements found in {', '.join(os.path.abspath(path) for path in args.inputs)}")
+        return
+    print(f"[INFO] Recomputing {len(jobs):,} engagements on {args.workers} worker(s)")
+    start = time.perf_counter()
+    results = run_batch(jobs, args.workers, args.chunksize, args.bayesian)
+    seconds = time.perf_counter() - start
+    write_results(results, args.output)
+    errors = [result for result in results if result["ERROR"]]
+    for result in errors[:10]:
+        print(f"[WARN] {result['SOURCE']} row {result['ROW']}: {result['ERROR']}")
+    classes = {}
+    for result in results:
+        if not result["ERROR"]: classes[result["TGT_CLASS"]] = classes.get(result["TGT_CLASS"], 0) + 1
+    print(f"[INFO] {', '.join(f'{count:,} {target_class}' for target_class, count in sorted(classes.items()))}, {len(errors):,} failed")
+    print(f"[INFO] Recomputed {len(results):,} rows in {seconds:,.2f} s ({len(results) / seconds:,.0f} rows/s)")
+    print(f"[INFO] Wrote {os.path.abspath(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
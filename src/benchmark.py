@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for the terrain and targeting math.
+
+Run from the repository root, e.g.:  python src/benchmark.py dted
+
+Benchmarks run against the tiles in ./dted when they are present; pass
+--synthetic to generate a temporary DTED level 2 tile instead.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+import numpy as np
+
+
+def time_call(func: Callable, repeat: int = 5) -> float:
+    """Returns the best wall-clock time (seconds) of several calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, seconds: float, count: int = 1) -> None:
+    per_item = f" ({seconds / count * 1e9:,.0f} ns each, {count / seconds:,.0f}/s)" if count > 1 else ""
+    print(f"[INFO] {label:<48} {seconds * 1000:>10,.2f} ms{per_item}")
+
+
+def write_synthetic_dted(dted_dir: str, lat: int = 49, lon: int = 11, size: int = 3601) -> str:
+    """Writes a DTED level 2 tile of rolling synthetic terrain and returns its path."""
+    import rasterio
+    import rasterio.shutil
+    from rasterio.io import MemoryFile
+    from rasterio.transform import from_origin
+    lon_dir = f"e{lon:03d}" if lon >= 0 else f"w{abs(lon):03d}"
+    lat_dir = f"n{lat:02d}" if lat >= 0 else f"s{abs(lat):02d}"
+    file_path = os.path.join(dted_dir, lon_dir, f"{lat_dir}.dt2")
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    y, x = np.mgrid[0:size, 0:size] / size
+    terrain = 400 + 150 * np.sin(x * 23) * np.cos(y * 17) + 60 * np.sin(x * 97 + y * 61)
+    res = 1 / (size - 1)
+    transform = from_origin(lon - res / 2, lat + 1 + res / 2, res, res)
+    with MemoryFile() as memfile:
+        with memfile.open(driver="GTiff", width=size, height=size, count=1, dtype="int16", crs="EPSG:4326", transform=transform) as ds:
+            ds.write(terrain.astype(np.int16), 1)
+        with memfile.open() as ds:
+            rasterio.shutil.copy(ds, file_path, driver="DTED")
+    return file_path
+
+
+def find_dted_files(dted_dir: str) -> list[str]:
+    from dted import DTED_EXTENSIONS
+    files = []
+    for root, _, names in os.walk(dted_dir):
+        files.extend(os.path.join(root, n) for n in names if os.path.splitext(n)[1].lower() in DTED_EXTENSIONS)
+    return sorted(files)
+
+
+def random_points_in_tile(tile, count: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Uniform random coordinates inside the posts of a DTED tile."""
+    a, _, c, _, e, f = tile.transform
+    rows, cols = tile.elevation.shape
+    rng = np.random.default_rng(seed)
+    lons = rng.uniform(c - a / 2 + abs(a), c + a * cols - abs(a), count)
+    lats = rng.uniform(f + e * rows + abs(e), f - abs(e), count)
+    return lats, lons
+
+
+def prepare_dted_directory(args: argparse.Namespace, temp_dir: str) -> list[str]:
+    """Points dted.py at the synthetic or real DTED tree and returns the tiles to benchmark."""
+    import dted
+    dted_dir = temp_dir if args.synthetic else dted.DTED_DIRECTORY
+    if args.synthetic:
+        write_synthetic_dted(temp_dir)
+    files = find_dted_files(dted_dir)[:args.max_tiles]
+    if not files:
+        print(f"[WARN] No DTED files found in {os.path.abspath(dted_dir)}; re-run with --synthetic.")
+    dted.DTED_DIRECTORY = dted_dir
+    dted.DTEDTileCache.clear_cache()
+    return files
+
+
+def tile_center(tile) -> list[float]:
+    a, _, c, _, e, f = tile.transform
+    rows, cols = tile.elevation.shape
+    return [f + e * rows / 2, c + a * cols / 2]
+
+
+def benchmark_dted(args: argparse.Namespace) -> None:
+    """Built-in memory-mapped DTED reader vs. the rasterio path on the same tiles."""
+    import dted
+
+    python = sys.executable
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    for module in ["numpy", "rasterio"]:
+        seconds = time_call(lambda: subprocess.run([python, "-c", f"import {module}"], check=True, cwd=src_dir), repeat=3)
+        report(f"cold interpreter + import {module}", seconds)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = prepare_dted_directory(args, temp_dir)
+        dted_dir = dted.DTED_DIRECTORY
+        for file_path in files:
+            print(f"[INFO] Tile: {os.path.relpath(file_path, dted_dir)}")
+            report("rasterio open + read(1)", time_call(lambda: dted.read_dted_rasterio(file_path), args.repeat))
+            report("memory-mapped open", time_call(lambda: dted.open_dted_memmap(file_path), args.repeat))
+            tile = dted.open_dted_memmap(file_path)
+            report("memory-mapped full decode", time_call(tile.read_array, args.repeat))
+            reference = dted.read_dted_rasterio(file_path).elevation
+            if not np.array_equal(tile.read_array(), reference):
+                print("[ERROR] Memory-mapped elevations differ from rasterio!")
+
+            if args.synthetic:
+                index = dted.build_dted_container()
+                container_path = os.path.join(dted_dir, dted.DTED_CONTAINER_FILENAME)
+                key = next(iter(index["cells"]))
+                report("container open (memory-mapped)", time_call(lambda: dted.open_dted_container_tile(f"{container_path}#{key}"), args.repeat))
+                os.remove(container_path)
+                dted.DTEDCatalog.refresh()
+
+            lats, lons = random_points_in_tile(tile, args.points)
+            dted.DTEDTileCache.clear_cache()
+            report(f"get_elevations x{args.points:,} (cold cache)", time_call(lambda: (dted.DTEDTileCache.clear_cache(), dted.get_elevations(lats, lons)), args.repeat), args.points)
+            report(f"get_elevations x{args.points:,} (warm cache)", time_call(lambda: dted.get_elevations(lats, lons), args.repeat), args.points)
+            for method in ["bilinear", "bicubic"]:
+                report(f"get_elevations x{args.points:,} ({method})", time_call(lambda: dted.get_elevations(lats, lons, method), args.repeat), args.points)
+
+            def rasterio_per_point(n: int = 20) -> None:
+                import rasterio
+                for lat, lon in zip(lats[:n], lons[:n]):
+                    with rasterio.open(file_path) as ds:
+                        row, col = ds.index(lon, lat)
+                        ds.read(1)[row, col]
+            report("legacy rasterio per-point lookup x20", time_call(rasterio_per_point, 1), 20)
+        dted.DTEDTileCache.clear_cache()
+
+
+def benchmark_profile(args: argparse.Namespace) -> None:
+    """Elevation profiles at native DTED post spacing along a LOB."""
+    import dted
+    from coords import adjust_coordinate
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = prepare_dted_directory(args, temp_dir)
+        if not files:
+            return
+        start = tile_center(dted.DTEDTileCache.get_tile(files[0]))
+        for length_km in [5, 10, 20]:
+            end = adjust_coordinate(start, 45, length_km * 1000)
+            lats, _, _, _ = dted.get_elevation_profile_arrays(start, end)
+            report(f"{length_km} km profile ({len(lats):,} points)", time_call(lambda: dted.get_elevation_profile_arrays(start, end), args.repeat), len(lats))
+        dted.DTEDTileCache.clear_cache()
+
+
+def random_points_around(center: list[float], radius_m: float, count: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Uniform random coordinates within a radius of a center coordinate (flat-earth offsets)."""
+    rng = np.random.default_rng(seed)
+    distances_m = radius_m * np.sqrt(rng.uniform(0, 1, count))
+    bearings = rng.uniform(0, 2 * np.pi, count)
+    meters_per_degree = np.radians(1) * 6371000
+    lats = center[0] + distances_m * np.cos(bearings) / meters_per_degree
+    lons = center[1] + distances_m * np.sin(bearings) / (meters_per_degree * np.cos(np.radians(center[0])))
+    return lats, lons
+
+
+def benchmark_los(args: argparse.Namespace) -> None:
+    """Line of sight from one sensor to many candidate target points."""
+    import dted
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = prepare_dted_directory(args, temp_dir)
+        if not files:
+            return
+        sensor = tile_center(dted.DTEDTileCache.get_tile(files[0]))
+        for count in [1_000, 10_000]:
+            for radius_km in [5, 20]:
+                lats, lons = random_points_around(sensor, radius_km * 1000, count)
+                seconds = time_call(lambda: dted.get_line_of_sight(sensor, lats, lons), args.repeat)
+                visible = dted.get_line_of_sight(sensor, lats, lons).mean()
+                report(f"LOS x{count:,} within {radius_km} km ({visible:.0%} visible)", seconds, count)
+        dted.DTEDTileCache.clear_cache()
+
+
+def benchmark_viewshed(args: argparse.Namespace) -> None:
+    """Radial-sweep viewshed around a sensor for 5, 10 and 20 km radii."""
+    import dted
+    from coords import convert_coords_to_mgrs
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = prepare_dted_directory(args, temp_dir)
+        if not files:
+            return
+        sensor_mgrs = convert_coords_to_mgrs(tile_center(dted.DTEDTileCache.get_tile(files[0])))
+        for radius_km in [5, 10, 20]:
+            visible, _ = dted.get_viewshed(sensor_mgrs, radius_m=radius_km * 1000)
+            seconds = time_call(lambda: dted.get_viewshed(sensor_mgrs, radius_m=radius_km * 1000), args.repeat)
+            report(f"{radius_km} km viewshed ({visible.size:,} posts, {visible.sum():,} visible)", seconds, visible.size)
+        # wide-area run on the x4 pyramid level
+        center = tile_center(dted.DTEDTileCache.get_tile(files[0]))
+        dted.build_dted_pyramid(*center)
+        visible, _ = dted.get_viewshed(sensor_mgrs, radius_m=20000, resolution_m=150)
+        seconds = time_call(lambda: dted.get_viewshed(sensor_mgrs, radius_m=20000, resolution_m=150), args.repeat)
+        report(f"20 km viewshed at 150 m ({visible.size:,} posts)", seconds, visible.size)
+        dted.DTEDTileCache.clear_cache()
+
+
+def benchmark_diffraction(args: argparse.Namespace) -> None:
+    """Knife-edge diffraction received power and distance band along a full LOB."""
+    import dted
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = prepare_dted_directory(args, temp_dir)
+        if not files:
+            return
+        sensor = tile_center(dted.DTEDTileCache.get_tile(files[0]))
+        for length_km in [10, 30]:
+            profile = dted.get_lob_diffraction_profile(sensor, 45, length_km * 1000, 150)
+            seconds = time_call(lambda: dted.get_lob_diffraction_profile(sensor, 45, length_km * 1000, 150), args.repeat)
+            report(f"{length_km} km LOB diffraction ({profile['distances_m'].size:,} ranges)", seconds, profile["distances_m"].size)
+        band = dted.get_lob_distance_band(sensor, 45, 150, 1, 10, 0, 0, -90, max_distance_m=30000)
+        seconds = time_call(lambda: dted.get_lob_distance_band(sensor, 45, 150, 1, 10, 0, 0, -90, max_distance_m=30000), args.repeat)
+        report(f"distance band ({band['matches'].sum():,} of {band['matches'].size:,} ranges match)", seconds)
+        dted.DTEDTileCache.clear_cache()
+
+
+def benchmark_ew(args: argparse.Namespace) -> None:
+    """Emission distance sweeps over ERP, path-loss coefficient and received power."""
+    import ew
+    erp_watts = np.linspace(0.5, 50, 100)
+    path_loss_coeffs = np.linspace(2, 5, 100)
+    received_power_dBm = np.linspace(-120, -40, 100)
+    sweep = lambda: ew.get_emission_distance_array(erp_watts[:, None, None], 150, 0, 0, received_power_dBm[None, None, :], 2, 2, 70, path_loss_coeffs[None, :, None])
+    count = erp_watts.size * path_loss_coeffs.size * received_power_dBm.size
+    report(f"get_emission_distance_array x{count:,}", time_call(sweep, args.repeat), count)
+
+    def scalar_sweep(n: int = 10_000) -> None:
+        for P, n_coeff, R in zip(erp_watts.repeat(100)[:n], np.tile(path_loss_coeffs, 100)[:n], np.tile(received_power_dBm, 100)[:n]):
+            ew.get_emission_distance(P, 150, 0, 0, R, 2, 2, 70, n_coeff)
+    report("get_emission_distance loop x10,000", time_call(scalar_sweep, 1), 10_000)
+
+
+def benchmark_probability(args: argparse.Namespace) -> None:
+    """Monte Carlo and Bayesian grid target probability surfaces for 1, 2 and 3 EWTs."""
+    import probability
+    sensors = [
+        {"coord": [49.5, 11.1], "bearing": 90, "bearing_error": 6, "power_received_dBm": -88, "receiver_gain_dBi": 0},
+        {"coord": [49.6, 11.3], "bearing": 180, "bearing_error": 6, "power_received_dBm": -88, "receiver_gain_dBi": 0},
+        {"coord": [49.4, 11.4], "bearing": 315, "bearing_error": 6, "power_received_dBm": -88, "receiver_gain_dBi": 0},
+    ]
+    for num_sensors in [1, 2, 3]:
+        surface = probability.get_monte_carlo_probability_surface(sensors[:num_sensors], 150, 1, 10, path_loss_coeff=3)
+        seconds = time_call(lambda: probability.get_monte_carlo_probability_surface(sensors[:num_sensors], 150, 1, 10, path_loss_coeff=3), args.repeat)
+        report(f"Monte Carlo surface, {num_sensors} EWT(s) ({surface['num_samples']:,} samples)", seconds, surface["num_samples"])
+    for num_sensors in [1, 2, 3]:
+        surface = probability.get_bayesian_probability_surface(sensors[:num_sensors], 150, 1, 10, path_loss_coeff=3)
+        seconds = time_call(lambda: probability.get_bayesian_probability_surface(sensors[:num_sensors], 150, 1, 10, path_loss_coeff=3), args.repeat)
+        report(f"Bayesian grid fix, {num_sensors} LOB(s) ({surface['density'].size:,} cells)", seconds, surface["density"].size)
+
+
+def benchmark_coords(args: argparse.Namespace) -> None:
+    """LOB wedge geometry and coordinate conversions."""
+    import coords
+    report("get_lob_coords (20 km LOB)", time_call(lambda: coords.get_lob_coords([49.5, 11.3], 45, 6, 1500, 20000), args.repeat))
+    report("get_lob_coords with 30 m center line", time_call(lambda: coords.get_lob_coords([49.5, 11.3], 45, 6, 1500, 20000, 30), args.repeat))
+    report("get_coords_from_LOBs (compatibility wrapper)", time_call(lambda: coords.get_coords_from_LOBs([49.5, 11.3], 45, 6, 1500, 20000), args.repeat))
+    rng = np.random.default_rng(0)
+    lats, lons = rng.uniform(-80, 80, args.points), rng.uniform(-180, 180, args.points)
+    azimuths, distances_m = rng.uniform(0, 360, args.points), rng.uniform(100, 100_000, args.points)
+    for model in coords.GEODESIC_MODELS:
+        report(f"get_geodesic_destinations {model} x{args.points:,}", time_call(lambda: coords.get_geodesic_destinations(lats, lons, azimuths, distances_m, model), args.repeat), args.points)
+        report(f"get_geodesic_inverse {model} x{args.points:,}", time_call(lambda: coords.get_geodesic_inverse(lats, lons, lats[::-1], lons[::-1], model), args.repeat), args.points)
+    sensors, targets = np.column_stack([lats[:100], lons[:100]]), np.column_stack([lats[:1000], lons[:1000]])
+    report("get_pairwise_geodesics 100 x 1,000 wgs84", time_call(lambda: coords.get_pairwise_geodesics(sensors, targets), args.repeat), 100_000)
+    # repeated grids, e.g. EWT positions, fit in the conversion cache
+    grids = coords.convert_coords_to_mgrs_batch(lats[:2_000], lons[:2_000])
+    report("convert_coords_to_mgrs_batch x2,000 (cached)", time_call(lambda: coords.convert_coords_to_mgrs_batch(lats[:2_000], lons[:2_000]), args.repeat), 2_000)
+    report("convert_mgrs_to_coords_batch x2,000 (cached)", time_call(lambda: coords.convert_mgrs_to_coords_batch(grids), args.repeat), 2_000)
+    mgrs_lats, mgrs_lons = rng.uniform(-80, 84, 1_000_000), rng.uniform(-180, 180, 1_000_000)
+    report("convert_coords_to_mgrs_array x1,000,000", time_call(lambda: coords.convert_coords_to_mgrs_array(mgrs_lats, mgrs_lons), args.repeat), 1_000_000)
+    converter = coords._get_mgrs_converter()
+    report("mgrs.MGRS.toMGRS loop x20,000 (uncached)", time_call(lambda: [converter.toMGRS(a, b) for a, b in zip(mgrs_lats[:20_000].tolist(), mgrs_lons[:20_000].tolist())], 1), 20_000)
+    report("get_distance_between_coords loop x10,000", time_call(lambda: [coords.get_distance_between_coords([a, b], [49.5, 11.3]) for a, b in zip(lats[:10_000], lons[:10_000])], 1), 10_000)
+
+
+def benchmark_fix(args: argparse.Namespace) -> None:
+    """Weighted least-squares (Stansfield) fixes over 3 to 1,000 LOB reports."""
+    import fix
+    from coords import get_geodesic_destinations, get_geodesic_inverse
+    rng = np.random.default_rng(0)
+    target = [49.55, 11.25]
+    for num_reports in [3, 100, 1000]:
+        lats, lons = get_geodesic_destinations(*target, rng.uniform(0, 360, num_reports), rng.uniform(5000, 20000, num_reports))
+        bearings, _ = get_geodesic_inverse(lats, lons, *target)
+        bearings += rng.normal(0, 2, num_reports)
+        result = fix.get_stansfield_fix_from_arrays(lats, lons, bearings % 360, 4)
+        seconds = time_call(lambda: fix.get_stansfield_fix_from_arrays(lats, lons, bearings % 360, 4), args.repeat)
+        report(f"Stansfield fix, {num_reports:,} LOBs ({result['iterations']} passes)", seconds, num_reports)
+
+
+def benchmark_targeting(args: argparse.Namespace) -> None:
+    """Headless LOB, CUT and FIX targeting of the default EWT reports (no GUI)."""
+    import targeting
+    from coords import convert_mgrs_to_coords
+    reports = [{"coord": convert_mgrs_to_coords(mgrs), "bearing": bearing, "power_received_dBm": power_received_dBm}
+               for mgrs, bearing, power_received_dBm in [("32UQV0029959483", 130, -68), ("32UPV9965958848", 100, -70), ("32UPV9941358054", 75, -72)]]
+    for label, subset in [("1 LOB", reports[:1]), ("CUT", reports[:2]), ("FIX", reports)]:
+        seconds = time_call(lambda: targeting.get_targets(subset, 34.25, 0.005, 50, path_loss_coeff=4), args.repeat)
+        report(f"get_targets, {label}", seconds)
+
+
+BENCHMARKS = {
+    "coords": benchmark_coords,
+    "dted": benchmark_dted,
+    "diffraction": benchmark_diffraction,
+    "ew": benchmark_ew,
+    "fix": benchmark_fix,
+    "probability": benchmark_probability,
+    "los": benchmark_los,
+    "profile": benchmark_profile,
+    "targeting": benchmark_targeting,
+    "viewshed": benchmark_viewshed,
+}
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SignalStrike performance benchmarks")
+    parser.add_argument("benchmark", choices=sorted(BENCHMARKS) + ["all"], help="Benchmark to run")
+    parser.add_argument("--synthetic", action="store_true", help="Generate a temporary DTED level 2 tile instead of using ./dted")
+    parser.add_argument("--max-tiles", default=1, type=int, help="Maximum number of DTED tiles to benchmark (default: 1)")
+    parser.add_argument("--points", default=100_000, type=int, help="Number of random lookup points (default: 100000)")
+    parser.add_argument("--repeat", default=5, type=int, help="Repetitions per measurement; best time is reported (default: 5)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_arguments()
+    names = sorted(BENCHMARKS) if args.benchmark == "all" else [args.benchmark]
+    for name in names:
+        print(f"[INFO] === {name}: {BENCHMARKS[name].__doc__} ===")
+        BENCHMARKS[name](args)
+
+
+if __name__ == "__main__":
+    main()
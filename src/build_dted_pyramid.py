@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Builds the downsampled elevation pyramid (4x and 16x post spacing by default)
+for every DTED cell, as compressed npz files under dted/pyramid/.
+
+Run from the repository root, e.g.:  python src/build_dted_pyramid.py --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def parse_arguments() -> argparse.Namespace:
+    import dted
+    parser = argparse.ArgumentParser(description="DTED elevation pyramid builder")
+    parser.add_argument("--dted-dir", default=dted.DTED_DIRECTORY, help="Root of the DTED tree (default: ./dted)")
+    parser.add_argument("--factors", nargs="+", type=int, default=list(dted.DTED_PYRAMID_FACTORS[1:]), help="Downsampling factors to build (default: 4 16)")
+    parser.add_argument("--workers", default=4, type=int, help="Number of cells built in parallel (default: 4)")
+    parser.add_argument("--overwrite", action="store_true", help="Rebuild levels that already exist")
+    return parser.parse_args()
+
+
+def main() -> None:
+    import dted
+    args = parse_arguments()
+    if any(factor < 2 for factor in args.factors):
+        raise SystemExit("[ERROR] Pyramid factors must be 2 or greater.")
+    dted.DTED_DIRECTORY = args.dted_dir
+    cells = sorted(dted.DTEDCatalog.get_cells())
+    if not cells:
+        print(f"[WARN] No DTED files found in {os.path.abspath(args.dted_dir)}")
+        return
+    print(f"[INFO] Building x{', x'.join(str(f) for f in args.factors)} levels for {len(cells)} DTED cells")
+    start = time.perf_counter()
+
+    def build(cell: tuple[int, int]) -> list[str]:
+        return dted.build_dted_pyramid(cell[0], cell[1], tuple(args.factors), args.overwrite)
+
+    written = []
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for cell, paths in zip(cells, executor.map(build, cells)):
+            written.extend(paths)
+            lat_dir, lon_dir = dted.get_dted_cell_names(*cell)
+            print(f"[INFO] {lon_dir}/{lat_dir}: {len(paths)} level(s) written")
+    size_mb = sum(os.path.getsize(path) for path in written) / 1024 / 1024
+    print(f"[INFO] Wrote {len(written)} files ({size_mb:,.1f} MB) in {time.perf_counter() - start:,.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Converts the dted/ tree into a single memory-mappable container
+(dted/dted_container.bin) that dted.py reads directly, without GDAL.
+
+Run from the repository root, e.g.:  python src/convert_dted.py --verify
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+
+def parse_arguments() -> argparse.Namespace:
+    import dted
+    parser = argparse.ArgumentParser(description="DTED to container conversion tool")
+    parser.add_argument("--dted-dir", default=dted.DTED_DIRECTORY, help="Root of the DTED tree (default: ./dted)")
+    parser.add_argument("--output", default=None, help="Container to write (default: <dted-dir>/dted_container.bin)")
+    parser.add_argument("--verify", action="store_true", help="Compare every cell in the container against its source file")
+    return parser.parse_args()
+
+
+def main() -> None:
+    import dted
+    args = parse_arguments()
+    dted.DTED_DIRECTORY = args.dted_dir
+    # build and verify from the loose files, never from a container of an earlier run
+    cells = dted.DTEDCatalog.scan(args.dted_dir, include_container=False)
+    if not cells:
+        print(f"[WARN] No DTED files found in {os.path.abspath(args.dted_dir)}")
+        return
+    source_files = {
+        (cell["lat"], cell["lon"]): os.path.join(args.dted_dir, *cell["file"].split("/"))
+        for cell in cells.values()
+    }
+    print(f"[INFO] Converting {len(cells)} DTED cells")
+    start = time.perf_counter()
+    output_path = args.output or os.path.join(args.dted_dir, dted.DTED_CONTAINER_FILENAME)
+    index = dted.build_dted_container(output_path)
+    print(f"[INFO] Wrote {output_path} in {time.perf_counter() - start:,.1f} s")
+    source_mb = sum(os.path.getsize(path) for path in source_files.values()) / 1024 / 1024
+    print(f"[INFO] {len(index['cells'])} cells: {source_mb:,.1f} MB of DTED -> {os.path.getsize(output_path) / 1024 / 1024:,.1f} MB")
+
+    if args.verify:
+        mismatches = 0
+        for key, entry in index["cells"].items():
+            source_path = source_files[(entry["lat"], entry["lon"])]
+            expected = dted.DTEDTileCache.load_tile(source_path).read_array()
+            actual = dted.open_dted_container_tile(f"{output_path}#{key}").read_array()
+            if not np.array_equal(expected, actual):
+                mismatches += 1
+                print(f"[ERROR] {key} differs from {source_path}")
+        print(f"[INFO] Verified {len(source_files)} cells, {mismatches} mismatches")
+    dted.DTEDCatalog.refresh()
+
+
+if __name__ == "__main__":
+    main()
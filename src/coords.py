@@ -1,3 +1,12 @@
+from functools import lru_cache
+
+# geodesic earth models: pyproj WGS84 ellipsoid, or the haversine package's mean-radius sphere (fast)
+GEODESIC_MODELS = ('wgs84', 'sphere')
+# mean earth radius in meters used by the haversine package
+SPHERE_RADIUS_M = 6371008.8
+# most recent coordinate/MGRS conversions kept (e.g. EWT positions and markers)
+MGRS_CACHE_SIZE = 4096
+
 def adjust_coordinate(starting_coord: list[float,float],
                       azimuth_degrees: float,
                       shift_m: float
@@ -30,29 +39,257 @@ def adjust_coordinate(starting_coord: list[float,float],
     # return adjusted coordinate
     return [new_lat,new_lon]
 
+def adjust_coordinates(starting_coord: list[float,float],
+                       azimuths_degrees,
+                       shifts_m
+                       ) -> tuple:
+    """Adjusts one lat-lon coordinate by arrays of distances and directions (array counterpart of adjust_coordinate); returns (lats, lons)."""
+    import numpy as np
+    assert len(starting_coord) == 2, 'Coordinate [lat,lon] needs to be of length 2.'
+    azimuths_radians = np.radians(np.asarray(azimuths_degrees, dtype=np.float64))
+    shifts_m = np.asarray(shifts_m, dtype=np.float64)
+    # earth radius in meters
+    earth_radius_meters = 6371000.0
+    starting_lat = float(starting_coord[0]); starting_lon = float(starting_coord[1])
+    new_lats = starting_lat + np.degrees(shifts_m * np.cos(azimuths_radians) / earth_radius_meters)
+    new_lons = starting_lon + np.degrees(shifts_m * np.sin(azimuths_radians) / earth_radius_meters) / np.cos(np.radians(starting_lat))
+    return new_lats, new_lons
+
+@lru_cache(maxsize=1)
+def _get_mgrs_converter():
+    """Returns the shared mgrs converter."""
+    import mgrs
+    return mgrs.MGRS()
+
+@lru_cache(maxsize=MGRS_CACHE_SIZE)
+def _convert_coords_to_mgrs_cached(lat: float, lon: float, precision: int) -> str:
+    return str(_get_mgrs_converter().toMGRS(lat, lon, MGRSPrecision=precision)).strip()
+
+@lru_cache(maxsize=MGRS_CACHE_SIZE)
+def _convert_mgrs_to_coords_cached(milGrid: str) -> tuple:
+    return tuple(_get_mgrs_converter().toLatLon(milGrid.encode()))
+
 def convert_coords_to_mgrs(coords: list[float,float],
                            precision:int = 5
                            ) -> str:
     """Convert location from coordinates to MGRS."""
-    import mgrs
     try:
         assert isinstance(coords,list), 'Coordinate input must be a list.'
         assert len(coords) == 2, 'Coordinate input must be of length 2.'
         coords = [float(c) for c in coords]
-        return str(mgrs.MGRS().toMGRS(coords[0], coords[1],MGRSPrecision=precision)).strip()
+        return _convert_coords_to_mgrs_cached(coords[0], coords[1], precision)
     except AssertionError:
         return None
     
 def convert_mgrs_to_coords(milGrid: str) -> list:
     """Convert location from MGRS to coordinates."""
-    import mgrs
     try:
         assert isinstance(milGrid,str), 'MGRS must be a string'
         milGrid = milGrid.replace(" ","").strip()
-        return list(mgrs.MGRS().toLatLon(milGrid.encode()))
+        return list(_convert_mgrs_to_coords_cached(milGrid))
     except AssertionError:
         return None
+
+def convert_coords_to_mgrs_batch(lats,
+                                 lons,
+                                 precision: int = 5) -> list:
+    """Converts arrays of coordinates to a list of MGRS strings (batch counterpart of convert_coords_to_mgrs)."""
+    import numpy as np
+    lats, lons = np.broadcast_arrays(np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64))
+    return [_convert_coords_to_mgrs_cached(lat, lon, precision) for lat, lon in zip(lats.ravel().tolist(), lons.ravel().tolist())]
+
+def convert_mgrs_to_coords_batch(milGrids: list[str]) -> tuple:
+    """Converts a list of MGRS strings to (lats, lons) arrays (batch counterpart of convert_mgrs_to_coords)."""
+    import numpy as np
+    coords = [_convert_mgrs_to_coords_cached(milGrid.replace(" ","").strip()) for milGrid in milGrids]
+    coords = np.array(coords, dtype=np.float64).reshape(-1, 2)
+    return coords[:, 0], coords[:, 1]
     
+@lru_cache(maxsize=1)
+def _get_transverse_mercator_constants() -> tuple:
+    """Returns the WGS84 (a, es, ebs, ap, bp, cp, dp, ep) of the transverse Mercator series used by the mgrs package (GeoTrans tranmerc.c)."""
+    a = 6378137.0
+    f = 1 / 298.257223563
+    es = 2 * f - f * f
+    ebs = (1 / (1 - es)) - 1
+    b = a * (1 - f)
+    tn = (a - b) / (a + b)
+    tn2 = tn * tn; tn3 = tn2 * tn; tn4 = tn3 * tn; tn5 = tn4 * tn
+    ap = a * (1.e0 - tn + 5.e0 * (tn2 - tn3) / 4.e0 + 81.e0 * (tn4 - tn5) / 64.e0)
+    bp = 3.e0 * a * (tn - tn2 + 7.e0 * (tn3 - tn4) / 8.e0 + 55.e0 * tn5 / 64.e0) / 2.e0
+    cp = 15.e0 * a * (tn2 - tn3 + 3.e0 * (tn4 - tn5) / 4.e0) / 16.0
+    dp = 35.e0 * a * (tn3 - tn4 + 11.e0 * tn5 / 16.e0) / 48.e0
+    ep = 315.e0 * a * (tn4 - tn5) / 512.e0
+    return a, es, ebs, ap, bp, cp, dp, ep
+
+def _get_utm_projection(lat_radians, lon_radians, zones) -> tuple:
+    """
+    Projects radians into the given UTM zones; returns (eastings, northings).
+
+    A term-for-term NumPy port of the GeoTrans series behind the mgrs package,
+    in the same operation order, so results agree with it to the last bits.
+    Longitudes are those already shifted into [0, 2 pi) by the zone selection.
+    """
+    import math
+    import numpy as np
+    pi = math.pi
+    a, es, ebs, ap, bp, cp, dp, ep = _get_transverse_mercator_constants()
+    scale = 0.9996
+    central_meridians = np.where(zones >= 31, (6 * zones - 183) * pi / 180.0, (6 * zones + 177) * pi / 180.0)
+    central_meridians = np.where(central_meridians > pi, central_meridians - (2 * pi), central_meridians)
+    false_northings = np.where(lat_radians < 0, 10000000.0, 0.0)
+    lat = lat_radians
+    lon = np.where(lon_radians > pi, lon_radians - (2 * pi), lon_radians)
+    dlam = lon - central_meridians
+    dlam = np.where(dlam > pi, dlam - (2 * pi), dlam)
+    dlam = np.where(dlam < -pi, dlam + (2 * pi), dlam)
+    dlam = np.where(np.abs(dlam) < 2.e-10, 0.0, dlam)
+    s = np.sin(lat); c = np.cos(lat)
+    c2 = c * c; c3 = c2 * c; c5 = c3 * c2; c7 = c5 * c2
+    t = np.tan(lat)
+    tan2 = t * t; tan3 = tan2 * t; tan4 = tan3 * t; tan5 = tan4 * t; tan6 = tan5 * t
+    eta = ebs * c2; eta2 = eta * eta; eta3 = eta2 * eta; eta4 = eta3 * eta
+    # radius of curvature in the prime vertical and true meridional distance (zero at the equator origin)
+    sn = a / np.sqrt(1.e0 - es * (s * s))
+    tmd = ap * lat - bp * np.sin(2.e0 * lat) + cp * np.sin(4.e0 * lat) - dp * np.sin(6.e0 * lat) + ep * np.sin(8.e0 * lat)
+    t1 = (tmd - 0.0) * scale
+    t2 = sn * s * c * scale / 2.e0
+    t3 = sn * s * c3 * scale * (5.e0 - tan2 + 9.e0 * eta + 4.e0 * eta2) / 24.e0
+    t4 = sn * s * c5 * scale * (61.e0 - 58.e0 * tan2 + tan4 + 270.e0 * eta - 330.e0 * tan2 * eta + 445.e0 * eta2
+                                + 324.e0 * eta3 - 680.e0 * tan2 * eta2 + 88.e0 * eta4 - 600.e0 * tan2 * eta3 - 192.e0 * tan2 * eta4) / 720.e0
+    t5 = sn * s * c7 * scale * (1385.e0 - 3111.e0 * tan2 + 543.e0 * tan4 - tan6) / 40320.e0
+    # products instead of pow(): within an ulp of it, far below the truncated MGRS digits, and much faster
+    dlam2 = dlam * dlam; dlam3 = dlam2 * dlam; dlam4 = dlam2 * dlam2; dlam5 = dlam4 * dlam
+    dlam6 = dlam4 * dlam2; dlam7 = dlam6 * dlam; dlam8 = dlam4 * dlam4
+    northings = false_northings + t1 + dlam2 * t2 + dlam4 * t3 + dlam6 * t4 + dlam8 * t5
+    t6 = sn * c * scale
+    t7 = sn * c3 * scale * (1.e0 - tan2 + eta) / 6.e0
+    t8 = sn * c5 * scale * (5.e0 - 18.e0 * tan2 + tan4 + 14.e0 * eta - 58.e0 * tan2 * eta + 13.e0 * eta2 + 4.e0 * eta3
+                            - 64.e0 * tan2 * eta2 - 24.e0 * tan2 * eta3) / 120.e0
+    t9 = sn * c7 * scale * (61.e0 - 479.e0 * tan2 + 179.e0 * tan4 - tan6) / 5040.e0
+    eastings = 500000.0 + dlam * t6 + dlam3 * t7 + dlam5 * t8 + dlam7 * t9
+    return eastings, northings
+
+def _get_utm_zones(lat_radians, lon_radians) -> tuple:
+    """Returns the (zones, lat_radians, lon_radians) of the UTM zone selection, including the Norway and Svalbard exceptions."""
+    import math
+    import numpy as np
+    pi = math.pi
+    lat = np.where((lat_radians > -1.0e-9) & (lat_radians < 0), 0.0, lat_radians)
+    lon = np.where(lon_radians < 0, lon_radians + ((2 * pi) + 1.0e-10), lon_radians)
+    lat_degrees = np.trunc(lat * 180.0 / pi)
+    lon_degrees = np.trunc(lon * 180.0 / pi)
+    zones = np.where(lon < pi, np.trunc(31 + ((lon * 180.0 / pi) / 6.0)), np.trunc(((lon * 180.0 / pi) / 6.0) - 29)).astype(np.int64)
+    zones[zones > 60] = 1
+    norway = (lat_degrees > 55) & (lat_degrees < 64)
+    zones[norway & (lon_degrees > -1) & (lon_degrees < 3)] = 31
+    zones[norway & (lon_degrees > 2) & (lon_degrees < 12)] = 32
+    svalbard = lat_degrees > 71
+    for zone, (west, east) in zip((31, 33, 35, 37), ((-1, 9), (8, 21), (20, 33), (32, 42))):
+        zones[svalbard & (lon_degrees > west) & (lon_degrees < east)] = zone
+    return zones, lat, lon
+
+@lru_cache(maxsize=6)
+def _get_mgrs_digit_table(precision: int):
+    """Returns the zero-padded ASCII digits of 0 to 10**precision - 1 as a (10**precision, precision) uint8 table."""
+    import numpy as np
+    numbers = np.arange(10 ** precision)
+    powers = 10 ** np.arange(precision - 1, -1, -1)
+    return (48 + (numbers[:, None] // powers) % 10).astype(np.uint8)
+
+def convert_coords_to_utm_array(lats, lons) -> tuple:
+    """
+    Converts arrays of coordinates to UTM; returns (zones, hemispheres, eastings, northings).
+
+    Zones follow the mgrs package, including the Norway and Svalbard exceptions;
+    hemispheres are 'N' or 'S'. Valid between 80.5S and 84.5N.
+    """
+    import math
+    import numpy as np
+    lats, lons = np.broadcast_arrays(np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64))
+    assert np.all((lats >= -80.5) & (lats <= 84.5)), 'UTM latitudes must be between -80.5 and 84.5 degrees.'
+    zones, lat, lon = _get_utm_zones(lats * math.pi / 180.0, lons * math.pi / 180.0)
+    eastings, northings = _get_utm_projection(lat, lon, zones)
+    return zones, np.where(lat < 0, 'S', 'N'), eastings, northings
+
+def convert_coords_to_mgrs_array(lats,
+                                 lons,
+                                 precision: int = 5):
+    """
+    Converts arrays of coordinates to MGRS strings with NumPy (vectorized counterpart of convert_coords_to_mgrs).
+
+    UTM zone selection, latitude band letters, 100 km square letters and the
+    truncated easting/northing digits all follow the mgrs package exactly.
+    Points outside the UTM latitudes (the polar UPS areas) or otherwise
+    invalid are passed to the cached converter. Returns an array of str.
+    """
+    import math
+    import numpy as np
+    assert 0 <= precision <= 5, 'MGRS precision must be between 0 and 5.'
+    pi = math.pi
+    deg_to_rad = 0.017453292519943295
+    rad_to_deg = 57.29577951308232087
+    lats, lons = np.broadcast_arrays(np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64))
+    shape = lats.shape
+    lats, lons = lats.ravel(), lons.ravel()
+    lat_radians = lats * pi / 180.0
+    lon_radians = lons * pi / 180.0
+    utm = (np.isfinite(lat_radians) & np.isfinite(lon_radians)
+           & (lat_radians >= (-80 * pi) / 180.0) & (lat_radians <= (84 * pi) / 180.0)
+           & (lon_radians >= -pi) & (lon_radians <= (2 * pi)))
+    lat_radians, lon_radians = lat_radians[utm], lon_radians[utm]
+    zones, lat, lon = _get_utm_zones(lat_radians, lon_radians)
+    eastings, northings = _get_utm_projection(lat, lon, zones)
+    # points rounding onto the (truncated) eastern edge of zone 31V are reprojected into zone 32
+    zone_31v = (zones == 31) & (lat_radians >= 56.0 * deg_to_rad) & (lat_radians < 64.0 * deg_to_rad) & ((lon_radians >= 3.0 * deg_to_rad) | (eastings >= 500000.0))
+    if zone_31v.any():
+        zones[zone_31v] = 32
+        eastings[zone_31v], northings[zone_31v] = _get_utm_projection(lat[zone_31v], lon[zone_31v], zones[zone_31v])
+    valid = (eastings >= 100000) & (eastings <= 900000) & (northings >= 0) & (northings <= 10000000)
+    # the southern false northing on the equator belongs to the N band
+    equator = (lat_radians <= 0.0) & (northings == 1.0e7)
+    lat_radians = np.where(equator, 0.0, lat_radians)
+    northings = np.where(equator, 0.0, northings)
+    # latitude band letter
+    band_letters = np.array([2, 3, 4, 5, 6, 7, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23])
+    lat_degrees = lat_radians * rad_to_deg
+    band_index = np.clip(((lat_radians + (80.0 * deg_to_rad)) / (8.0 * deg_to_rad)) + 1.0e-12, 0, 19).astype(np.int64)
+    bands = np.where(lat_degrees >= 72, 23, band_letters[band_index])
+    # 100 km square letters from the zone's set number (WGS84 uses the AA pattern)
+    set_numbers = zones % 6
+    set_numbers[set_numbers == 0] = 6
+    column_low = np.select([np.isin(set_numbers, (1, 4)), np.isin(set_numbers, (2, 5))], [0, 9], 18)
+    pattern_offsets = np.where(set_numbers % 2 == 0, 500000.0, 0.0)
+    grid_northings = np.fmod(northings, 2000000.0) + pattern_offsets
+    grid_northings = np.where(grid_northings >= 2000000.0, grid_northings - 2000000.0, grid_northings)
+    rows = np.trunc(grid_northings / 100000.0).astype(np.int64)
+    rows += rows > 7
+    rows += rows > 13
+    grid_eastings = np.where((bands == 21) & (zones == 31) & (eastings == 500000.0), eastings - 1.0, eastings)
+    columns = column_low + (np.trunc(grid_eastings / 100000.0).astype(np.int64) - 1)
+    columns += (column_low == 9) & (columns > 13)
+    # truncated easting and northing digits within the 100 km square
+    divisor = pow(10.0, (5 - precision))
+    square_eastings = np.fmod(grid_eastings, 100000.0)
+    square_northings = np.fmod(northings, 100000.0)
+    easts = np.trunc(np.where(square_eastings >= 99999.5, 99999.0, square_eastings) / divisor).astype(np.int64)
+    norths = np.trunc(np.where(square_northings >= 99999.5, 99999.0, square_northings) / divisor).astype(np.int64)
+    characters = np.empty((lat_radians.size, 5 + 2 * precision), dtype=np.uint8)
+    characters[:, 0] = 48 + zones // 10
+    characters[:, 1] = 48 + zones % 10
+    characters[:, 2] = 65 + bands
+    characters[:, 3] = 65 + columns
+    characters[:, 4] = 65 + rows
+    digits = _get_mgrs_digit_table(precision)
+    characters[:, 5:5 + precision] = digits[easts]
+    characters[:, 5 + precision:] = digits[norths]
+    width = characters.shape[1]
+    result = np.empty(lats.size, dtype=f'<U{width}')
+    result[utm] = np.where(valid, characters.view(f'S{width}').ravel().astype(f'<U{width}'), '')
+    for index in np.flatnonzero(~utm):
+        result[index] = _convert_coords_to_mgrs_cached(float(lats[index]), float(lons[index]), precision)
+    return result.reshape(shape)
+
 def check_mgrs_input(mgrs_input: str) -> bool:
     """Determine if the MGRS input is valid"""
     try:
@@ -168,49 +405,161 @@ def format_readable_mgrs(mgrs: str) -> str:
     except Exception:
         return mgrs
 
+def _get_sphere_inverse(coord1: list[float,float], coord2: list[float,float]) -> tuple:
+    """Scalar fast path of get_geodesic_inverse(..., 'sphere'); returns (bearing_degrees, distance_m)."""
+    import math
+    lat1, lat2 = math.radians(coord1[0]), math.radians(coord2[0])
+    dLon = math.radians(coord2[1] - coord1[1])
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dLon / 2) ** 2
+    distance_m = 2 * SPHERE_RADIUS_M * math.asin(math.sqrt(min(max(a, 0.0), 1.0)))
+    x = math.cos(lat2) * math.sin(dLon)
+    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(dLon)
+    return math.degrees(math.atan2(x, y)) % 360, distance_m
+
 def get_distance_between_coords(coord1: list[float,float],
                                 coord2: list[float,float], 
                                 unit: str = 'm'
                                 ) -> float:
-    """Determines distance between two coordinates in meters."""
-    import haversine
+    """Determines haversine distance between two coordinates in meters (or kilometers)."""
     unit = unit.lower()
     assert unit in ['m','km'], 'Unit must be either meters or kilometers.'
-    if isinstance(coord1,tuple):
-        coord1 = list(coord1)
-    if isinstance(coord2,tuple):
-        coord2 = list(coord2)        
-    # assert isinstance(coord1,list), 'Coordinate 1 must be a list.'
     assert len(coord1) == 2, 'Coordinate 1 must be of length 2.'
-    # assert isinstance(coord2,list), 'Coordinate 2 must be a list.'
     assert len(coord2) == 2, 'Coordinate 2 must be of length 2.'
-    if unit == 'm':
-        return haversine.haversine(coord1,coord2,unit=haversine.Unit.METERS)
-    if unit== 'km':
-        return haversine.haversine(coord1,coord2,unit=haversine.Unit.KILOMETERS)
+    _, distance_m = _get_sphere_inverse(coord1, coord2)
+    return distance_m if unit == 'm' else distance_m / 1000
 
 def get_bearing_between_coordinates(coord_origin: list[float,float],
                                     coord_tgt: list[float,float]
                                     ) -> float:
-    """Determines bearing (in degrees) between origin coordinates and target coordinate."""
-    import math
+    """Determines great-circle bearing (in degrees) between origin coordinates and target coordinate."""
+    bearing, _ = _get_sphere_inverse(coord_origin, coord_tgt)
+    return bearing
+
+def get_distances_between_coords(coord_origin: list[float,float],
+                                 lats,
+                                 lons,
+                                 unit: str = 'm'):
+    """Determines haversine distances from one coordinate to arrays of coordinates (array counterpart of get_distance_between_coords)."""
+    unit = unit.lower()
+    assert unit in ['m','km'], 'Unit must be either meters or kilometers.'
+    _, distances_m = get_geodesic_inverse(coord_origin[0], coord_origin[1], lats, lons, 'sphere')
+    return distances_m if unit == 'm' else distances_m / 1000
+
+def get_bearings_between_coordinates(coord_origin: list[float,float],
+                                     lats,
+                                     lons):
+    """Determines bearings (in degrees) from one coordinate to arrays of coordinates (array counterpart of get_bearing_between_coordinates)."""
+    bearings, _ = get_geodesic_inverse(coord_origin[0], coord_origin[1], lats, lons, 'sphere')
+    return bearings
+
+def convert_coords_to_enu(origin_coord: list[float,float],
+                          lats,
+                          lons,
+                          heights_m = 0.0) -> tuple:
+    """Projects arrays of coordinates into the WGS84 local tangent plane (east, north, up in meters) at an origin coordinate."""
+    import numpy as np
+    assert len(origin_coord) == 2, 'Origin coordinate [lat,lon] needs to be of length 2.'
+    # WGS84 semi-major axis and first eccentricity squared
+    a = 6378137.0; e2 = 6.69437999014e-3
+    def to_ecef(lat, lon, h):
+        lat, lon = np.radians(lat), np.radians(lon)
+        n = a / np.sqrt(1 - e2 * np.sin(lat) ** 2)
+        return (n + h) * np.cos(lat) * np.cos(lon), (n + h) * np.cos(lat) * np.sin(lon), (n * (1 - e2) + h) * np.sin(lat)
+    x, y, z = to_ecef(np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64), np.asarray(heights_m, dtype=np.float64))
+    x0, y0, z0 = to_ecef(float(origin_coord[0]), float(origin_coord[1]), 0.0)
+    dx, dy, dz = x - x0, y - y0, z - z0
+    sin_lat, cos_lat = np.sin(np.radians(origin_coord[0])), np.cos(np.radians(origin_coord[0]))
+    sin_lon, cos_lon = np.sin(np.radians(origin_coord[1])), np.cos(np.radians(origin_coord[1]))
+    east = -sin_lon * dx + cos_lon * dy
+    north = -sin_lat * cos_lon * dx - sin_lat * sin_lon * dy + cos_lat * dz
+    up = cos_lat * cos_lon * dx + cos_lat * sin_lon * dy + sin_lat * dz
+    return east, north, up
+
+def convert_enu_to_coords(origin_coord: list[float,float],
+                          east,
+                          north,
+                          up = 0.0) -> tuple:
+    """Maps arrays of local tangent plane offsets (meters) at an origin coordinate back to WGS84; returns (lats, lons) (inverse of convert_coords_to_enu)."""
+    import numpy as np
+    assert len(origin_coord) == 2, 'Origin coordinate [lat,lon] needs to be of length 2.'
+    # WGS84 semi-major axis, semi-minor axis and eccentricities squared
+    a = 6378137.0; b = 6356752.314245; e2 = 6.69437999014e-3; ep2 = e2 / (1 - e2)
+    east, north, up = (np.asarray(v, dtype=np.float64) for v in (east, north, up))
+    lat0, lon0 = np.radians(float(origin_coord[0])), np.radians(float(origin_coord[1]))
+    sin_lat, cos_lat, sin_lon, cos_lon = np.sin(lat0), np.cos(lat0), np.sin(lon0), np.cos(lon0)
+    n0 = a / np.sqrt(1 - e2 * sin_lat ** 2)
+    x = n0 * cos_lat * cos_lon - sin_lon * east - sin_lat * cos_lon * north + cos_lat * cos_lon * up
+    y = n0 * cos_lat * sin_lon + cos_lon * east - sin_lat * sin_lon * north + cos_lat * sin_lon * up
+    z = n0 * (1 - e2) * sin_lat + cos_lat * north + sin_lat * up
+    # Bowring's closed form, sub-millimeter for points near the surface
+    p = np.hypot(x, y)
+    theta = np.arctan2(z * a, p * b)
+    lats = np.arctan2(z + ep2 * b * np.sin(theta) ** 3, p - e2 * a * np.cos(theta) ** 3)
+    return np.degrees(lats), np.degrees(np.arctan2(y, x))
+
+@lru_cache(maxsize=1)
+def _get_wgs84_geod():
+    """Returns the shared pyproj WGS84 geodesic solver."""
+    from pyproj import Geod
+    return Geod(ellps='WGS84')
+
+def get_geodesic_destinations(lats,
+                              lons,
+                              azimuths_degrees,
+                              distances_m,
+                              model: str = 'wgs84') -> tuple:
+    """
+    Solves the direct geodesic problem for broadcast arrays of origins, azimuths and distances; returns (lats, lons).
+
+    model 'wgs84' uses one batched pyproj.Geod call on the WGS84 ellipsoid;
+    'sphere' uses the closed-form great circle on the haversine sphere.
+    """
     import numpy as np
-    # define local variables
-    long1 = coord_origin[1]; lat1 = coord_origin[0]
-    long2 = coord_tgt[1]; lat2 = coord_tgt[0]
-    dLon = (long2 - long1)
-    # translate coordinate formats
-    x = math.cos(math.radians(lat2)) * math.sin(math.radians(dLon))
-    y = math.cos(math.radians(lat1)) * math.sin(math.radians(lat2)) - math.sin(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.cos(math.radians(dLon))
-    # find bearing in radians
-    brng_radians = np.arctan2(x,y)
-    brng_degrees = np.degrees(brng_radians)
-    # adjust negative bearings (below lower bound)
-    while brng_degrees < 0:
-        brng_degrees += 360
-    # adjust large bearings (above upper bound)
-    brng_degrees = brng_degrees % 360
-    return brng_degrees
+    assert model in GEODESIC_MODELS, f'Geodesic model must be one of {GEODESIC_MODELS}.'
+    lats, lons, azimuths_degrees, distances_m = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (lats, lons, azimuths_degrees, distances_m)))
+    if model == 'wgs84':
+        new_lons, new_lats, _ = _get_wgs84_geod().fwd(lons.ravel(), lats.ravel(), azimuths_degrees.ravel(), distances_m.ravel())
+        return np.reshape(new_lats, lats.shape), np.reshape(new_lons, lats.shape)
+    lat1, lon1, azimuths = np.radians(lats), np.radians(lons), np.radians(azimuths_degrees)
+    angular_distances = distances_m / SPHERE_RADIUS_M
+    lat2 = np.arcsin(np.clip(np.sin(lat1) * np.cos(angular_distances) + np.cos(lat1) * np.sin(angular_distances) * np.cos(azimuths), -1, 1))
+    lon2 = lon1 + np.arctan2(np.sin(azimuths) * np.sin(angular_distances) * np.cos(lat1), np.cos(angular_distances) - np.sin(lat1) * np.sin(lat2))
+    return np.degrees(lat2), (np.degrees(lon2) + 180) % 360 - 180
+
+def get_geodesic_inverse(lats1,
+                         lons1,
+                         lats2,
+                         lons2,
+                         model: str = 'wgs84') -> tuple:
+    """
+    Solves the inverse geodesic problem for broadcast arrays of coordinate pairs; returns (azimuths_degrees, distances_m).
+
+    Azimuths are the initial bearings from the first coordinates in [0, 360).
+    model 'wgs84' uses one batched pyproj.Geod call on the WGS84 ellipsoid;
+    'sphere' uses haversine distances and great-circle bearings.
+    """
+    import numpy as np
+    assert model in GEODESIC_MODELS, f'Geodesic model must be one of {GEODESIC_MODELS}.'
+    lats1, lons1, lats2, lons2 = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (lats1, lons1, lats2, lons2)))
+    if model == 'wgs84':
+        azimuths, _, distances = _get_wgs84_geod().inv(lons1.ravel(), lats1.ravel(), lons2.ravel(), lats2.ravel())
+        return np.reshape(azimuths, lats1.shape) % 360, np.reshape(distances, lats1.shape)
+    lat1, lat2 = np.radians(lats1), np.radians(lats2)
+    dLon = np.radians(lons2 - lons1)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dLon / 2) ** 2
+    distances = 2 * SPHERE_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+    x = np.cos(lat2) * np.sin(dLon)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dLon)
+    return np.degrees(np.arctan2(x, y)) % 360, distances
+
+def get_pairwise_geodesics(origin_coords: list[list[float,float]],
+                           target_coords: list[list[float,float]],
+                           model: str = 'wgs84') -> tuple:
+    """Returns (azimuths_degrees, distances_m) matrices of shape (origins, targets) from every origin to every target in one call."""
+    import numpy as np
+    origins = np.asarray(origin_coords, dtype=np.float64).reshape(-1, 2)
+    targets = np.asarray(target_coords, dtype=np.float64).reshape(-1, 2)
+    return get_geodesic_inverse(origins[:, 0, None], origins[:, 1, None], targets[None, :, 0], targets[None, :, 1], model)
 
 def get_center_coord(coord_list : list[list[float,float]]) -> list:
     """
@@ -228,43 +577,99 @@ def get_center_coord(coord_list : list[list[float,float]]) -> list:
 
     """
     from statistics import mean
-    print(coord_list)
     assert isinstance(coord_list,list) and len(coord_list) >= 1, "Coordinates must be in a list comprehension of length 1 or greater"
     coord_list = [c for c in coord_list if c]
-    print(coord_list)
     assert len(coord_list) >= 1, "At least one valid coordinate is required to calculate center coordinate."
     assert all(isinstance(c, (list, tuple)) and len(c) == 2 for c in coord_list), "Each coordinate must be a list or tuple of length 2 (lat,lon)."
     
     return [float(mean([c[0] for c in coord_list])),float(mean([c[1] for c in coord_list]))]
 
+def get_rhumb_line_destinations(starting_coord: list[float,float],
+                                azimuths_degrees,
+                                distances_m) -> tuple:
+    """
+    Returns the (lats, lons) reached by following constant azimuths for arrays of distances.
+
+    This is the closed form of repeatedly applying adjust_coordinate in short
+    steps: a rhumb line on the same 6371 km sphere, which is also the straight
+    line drawn on the Web Mercator map.
+    """
+    import numpy as np
+    assert len(starting_coord) == 2, 'Coordinate [lat,lon] needs to be of length 2.'
+    # earth radius in meters
+    earth_radius_meters = 6371000.0
+    azimuths_radians = np.radians(np.asarray(azimuths_degrees, dtype=np.float64))
+    angular_distances = np.asarray(distances_m, dtype=np.float64) / earth_radius_meters
+    lat1 = np.radians(float(starting_coord[0]))
+    lat2 = lat1 + angular_distances * np.cos(azimuths_radians)
+    # ratio of latitude change to Mercator latitude change along the line (cos(lat) on east-west lines)
+    mercator_change = np.log(np.tan(np.pi / 4 + lat2 / 2) / np.tan(np.pi / 4 + lat1 / 2))
+    flat = np.abs(mercator_change) < 1e-12
+    stretch = np.where(flat, np.cos(lat1), (lat2 - lat1) / np.where(flat, 1.0, mercator_change))
+    lon2 = float(starting_coord[1]) + np.degrees(angular_distances * np.sin(azimuths_radians) / stretch)
+    return np.degrees(lat2), lon2
+
+def get_lob_coords(sensor_coord: list[float,float],
+                   azimuth: float,
+                   sensor_error: float,
+                   min_lob_length: float,
+                   max_lob_length: float,
+                   center_line_spacing_m: float = None) -> dict:
+    """
+    Returns the corner and center coordinates of a LOB wedge in one vectorized call.
+
+    The near corners lie min_lob_length and the far corners max_lob_length
+    from the sensor along the azimuth +/- sensor_error. With
+    center_line_spacing_m, "center_line" is an (N, 2) array of [lat, lon]
+    points along the azimuth at that spacing out to the far end; otherwise it is None.
+    """
+    import numpy as np
+    assert 0 <= min_lob_length <= max_lob_length, 'LOB lengths must be ordered and non-negative.'
+    azimuths = np.array([azimuth + sensor_error, azimuth - sensor_error, azimuth] * 2) % 360
+    distances = np.repeat([min_lob_length, max_lob_length], 3)
+    lats, lons = get_rhumb_line_destinations(sensor_coord, azimuths, distances)
+    near_right, near_left, near_center, far_right, far_left, far_center = np.column_stack([lats, lons]).tolist()
+    center_line = None
+    if center_line_spacing_m is not None:
+        assert center_line_spacing_m > 0, 'Center line spacing must be positive.'
+        line_distances = np.arange(1, int(np.ceil(max_lob_length / center_line_spacing_m - 1e-9)) + 1) * center_line_spacing_m
+        line_distances[-1:] = np.minimum(line_distances[-1:], max_lob_length)
+        center_line = np.column_stack(get_rhumb_line_destinations(sensor_coord, np.full(line_distances.size, azimuth % 360), line_distances))
+    return {
+        "center_coord": np.mean([near_right, near_left, far_right, far_left], axis=0).tolist(),
+        "near_right_coord": near_right,
+        "near_left_coord": near_left,
+        "near_center_coord": np.mean([near_right, near_left], axis=0).tolist(),
+        "far_right_coord": far_right,
+        "far_left_coord": far_left,
+        "far_center_coord": far_center,
+        "center_line": center_line,
+    }
+
 def get_coords_from_LOBs(sensor_coord: list[float,float],
                          azimuth: float,
                          sensor_error: float,
                          min_lob_length: float,
                          max_lob_length: float):
-    center_coord_list = []
-    right_error_azimuth = (azimuth+sensor_error) % 360
-    left_error_azimuth = (azimuth-sensor_error) % 360
-    running_coord_left = [list(sensor_coord)[0],list(sensor_coord)[1]]
-    running_coord_center = [list(sensor_coord)[0],list(sensor_coord)[1]]
-    running_coord_right = [list(sensor_coord)[0],list(sensor_coord)[1]]
-    lob_length = 0
+    """
+    Compatibility wrapper around get_lob_coords returning the original tuple.
+
+    The original walked the LOB in 10-30 m steps, so its near corners sit two
+    steps past the last step at or below min_lob_length, its far corners one
+    step past max_lob_length, and the center list holds every step; those
+    distances are kept here.
+    """
     interval_meters = 30
     while interval_meters > max_lob_length and interval_meters > 10:
         interval_meters -= 10
-    near_right_coord = []; near_left_coord = []; far_right_coord = []; far_left_coord = []
-    while lob_length <= max_lob_length:
-        running_coord_left = adjust_coordinate(running_coord_left,left_error_azimuth,interval_meters)
-        running_coord_right = adjust_coordinate(running_coord_right,right_error_azimuth,interval_meters)
-        running_coord_center = adjust_coordinate(running_coord_center,azimuth,interval_meters)
-        center_coord_list.append(running_coord_center)    
-        if lob_length > min_lob_length:
-            if near_right_coord == []: near_right_coord = list(running_coord_right)
-            if near_left_coord == []: near_left_coord = list(running_coord_left)
-        lob_length += interval_meters
-    far_right_coord = running_coord_right
-    far_left_coord = running_coord_left
-    center_coord = get_center_coord([near_right_coord,near_left_coord,far_right_coord,far_left_coord])
-    near_center_coord = get_center_coord([near_right_coord,near_left_coord])
-    center_coord_list = [c for c in center_coord_list if len(c) <= 2]
-    return center_coord, near_right_coord, near_left_coord, near_center_coord, far_right_coord, far_left_coord, running_coord_center, center_coord_list
\ No newline at end of file
+    steps = int(max_lob_length // interval_meters) + 1
+    near_steps = int(min_lob_length // interval_meters) + 2
+    lob = get_lob_coords(sensor_coord, azimuth, sensor_error,
+                         min(near_steps, steps) * interval_meters, steps * interval_meters, interval_meters)
+    near_right_coord, near_left_coord = lob["near_right_coord"], lob["near_left_coord"]
+    if near_steps > steps:
+        near_right_coord = []
+        near_left_coord = []
+    center_coord = get_center_coord([near_right_coord,near_left_coord,lob["far_right_coord"],lob["far_left_coord"]])
+    near_center_coord = get_center_coord([near_right_coord,near_left_coord]) if near_right_coord else None
+    return center_coord, near_right_coord, near_left_coord, near_center_coord, lob["far_right_coord"], lob["far_left_coord"], lob["far_center_coord"], lob["center_line"].tolist()
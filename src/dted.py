@@ -1,28 +1,793 @@
+import json
 import os
+import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from typing import Dict
 
-import rasterio
+import numpy as np
 
 from coords import (
-    adjust_coordinate,
     get_distance_between_coords,
-    get_bearing_between_coordinates,
+    get_geodesic_destinations,
+    get_geodesic_inverse,
     convert_coords_to_mgrs,
+    convert_mgrs_to_coords,
     format_readable_mgrs,
 )
+from utilities import read_json
+
+conf = read_json(os.path.join(os.path.dirname(os.path.abspath(__file__)), "config_files", "conf.json"))
+
+DTED_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dted")
+
+# earth radius in meters (matches coords.adjust_coordinate)
+EARTH_RADIUS_M = 6371000.0
+SPEED_OF_LIGHT_M_S = 299792458.0
+# fraction of the first Fresnel zone radius a path must keep clear (the usual 60% rule)
+FRESNEL_CLEARANCE_FRACTION = 0.6
+
+
+# DTED header record lengths (MIL-PRF-89020B): UHL, DSI and ACC precede the data records
+DTED_UHL_LENGTH = 80
+DTED_DSI_LENGTH = 648
+DTED_ACC_LENGTH = 2700
+DTED_HEADER_LENGTH = DTED_UHL_LENGTH + DTED_DSI_LENGTH + DTED_ACC_LENGTH
+DTED_RECORD_SENTINEL = 0xAA
+# DTED levels in order of preference when more than one is present for a cell
+DTED_EXTENSIONS = (".dt2", ".dt1", ".dt0")
+ELEVATION_SAMPLING_METHODS = ("nearest", "bilinear", "bicubic")
+# nominal latitude post interval (arc-seconds) of each DTED level
+DTED_LEVEL_LAT_INTERVAL_ARCSEC = {0: 30, 1: 3, 2: 1}
+# downsampling factors of the elevation pyramid (1 is the DTED file itself)
+DTED_PYRAMID_FACTORS = (1, 4, 16)
+DTED_PYRAMID_DIRECTORY_NAME = "pyramid"
+# single-file container of native int16 cells written by convert_dted.py
+DTED_CONTAINER_FILENAME = "dted_container.bin"
+DTED_CONTAINER_MAGIC = b"SSDTED01"
+DTED_CONTAINER_ALIGNMENT = 16
+# number of target paths swept together by the line-of-sight engine
+LINE_OF_SIGHT_CHUNK_TARGETS = 256
+# number of rays swept together by the viewshed
+VIEWSHED_CHUNK_RAYS = 1024
+# knife-edge diffraction along a LOB: sample budget and search range
+LOB_DIFFRACTION_MAX_POINTS = 1500
+LOB_DIFFRACTION_MAX_RANGE_M = 100000
+
+
+class DTEDTile:
+    """Elevation array of a single DTED file (north-up, row 0 is the northern edge) and its geotransform."""
+
+    def __init__(self,
+                 file_path: str,
+                 elevation: np.ndarray,
+                 transform: tuple,
+                 signed_magnitude: bool = False) -> None:
+        self.file_path = file_path
+        self.elevation = elevation
+        # affine coefficients (a, b, c, d, e, f) mapping (col, row) to (lon, lat)
+        self.transform = tuple(float(x) for x in transform[:6])
+        a, b, c, d, e, f = self.transform
+        det = a * e - b * d
+        self.inverse_transform = (
+            e / det, -b / det, (b * f - e * c) / det,
+            -d / det, a / det, (d * c - a * f) / det,
+        )
+        # raw DTED views store elevations as big-endian signed magnitude, not two's complement
+        self.signed_magnitude = signed_magnitude
+        self.nbytes = elevation.nbytes
+
+    def index(self, lats: np.ndarray, lons: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the (rows, cols) of the posts containing the coordinates, matching rasterio's index."""
+        a, b, c, d, e, f = self.inverse_transform
+        cols = np.floor(a * lons + b * lats + c).astype(np.intp)
+        rows = np.floor(d * lons + e * lats + f).astype(np.intp)
+        rows = np.clip(rows, 0, self.elevation.shape[0] - 1)
+        cols = np.clip(cols, 0, self.elevation.shape[1] - 1)
+        return rows, cols
+
+    def fractional_index(self, lats: np.ndarray, lons: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Returns fractional (rows, cols) of the coordinates, with whole numbers falling on posts."""
+        a, b, c, d, e, f = self.inverse_transform
+        cols = a * lons + b * lats + c - 0.5
+        rows = d * lons + e * lats + f - 0.5
+        return np.clip(rows, 0, self.elevation.shape[0] - 1), np.clip(cols, 0, self.elevation.shape[1] - 1)
+
+    def sample(self, lats: np.ndarray, lons: np.ndarray, method: str = "nearest") -> np.ndarray:
+        """
+        Samples elevations (m) at coordinates inside the tile.
+
+        Args:
+            lats (np.ndarray): Latitudes in degrees.
+            lons (np.ndarray): Longitudes in degrees.
+            method (str): 'nearest' (post containing the point, as rasterio's index),
+                'bilinear' or 'bicubic' (Catmull-Rom) interpolation between posts.
+
+        Returns:
+            np.ndarray: int16 elevations for 'nearest', float64 otherwise.
+        """
+        if method == "nearest":
+            return self.read(*self.index(lats, lons))
+        max_row, max_col = self.elevation.shape[0] - 1, self.elevation.shape[1] - 1
+        rows, cols = self.fractional_index(lats, lons)
+        if method == "bilinear":
+            row0 = np.minimum(np.floor(rows).astype(np.intp), max(max_row - 1, 0))
+            col0 = np.minimum(np.floor(cols).astype(np.intp), max(max_col - 1, 0))
+            row1 = np.minimum(row0 + 1, max_row)
+            col1 = np.minimum(col0 + 1, max_col)
+            t_row = rows - row0
+            t_col = cols - col0
+            top = self.read(row0, col0) * (1 - t_col) + self.read(row0, col1) * t_col
+            bottom = self.read(row1, col0) * (1 - t_col) + self.read(row1, col1) * t_col
+            return top * (1 - t_row) + bottom * t_row
+        if method == "bicubic":
+            row0 = np.floor(rows).astype(np.intp)
+            col0 = np.floor(cols).astype(np.intp)
+            row_weights = _catmull_rom_weights(rows - row0)
+            col_weights = _catmull_rom_weights(cols - col0)
+            elevations = np.zeros(np.shape(rows), dtype=np.float64)
+            for i in range(4):
+                row_i = np.clip(row0 + i - 1, 0, max_row)
+                for j in range(4):
+                    col_j = np.clip(col0 + j - 1, 0, max_col)
+                    elevations += row_weights[i] * col_weights[j] * self.read(row_i, col_j)
+            return elevations
+        raise ValueError(f"Unknown elevation sampling method: {method}")
+
+    def read_array(self) -> np.ndarray:
+        """Returns the whole tile as a native int16 array (decoded copy for memory-mapped tiles)."""
+        values = np.array(self.elevation, dtype=np.int16)
+        if self.signed_magnitude:
+            negative = values < 0
+            values[negative] = -(values[negative] & 0x7FFF)
+        return values
+
+    def read(self, rows, cols) -> np.ndarray:
+        """Returns the elevations (m) at the given rows and columns as native int16."""
+        values = np.asarray(self.elevation[rows, cols], dtype=np.int16)
+        if self.signed_magnitude:
+            values = np.where(values < 0, -(values & 0x7FFF), values).astype(np.int16)
+        return values
+
+
+def _catmull_rom_weights(t: np.ndarray) -> np.ndarray:
+    """Returns the (4, ...) cubic convolution weights for the posts at offsets -1, 0, 1, 2 from the fractional offset t."""
+    t2 = t * t
+    t3 = t2 * t
+    return np.array([
+        (-t3 + 2 * t2 - t) / 2,
+        (3 * t3 - 5 * t2 + 2) / 2,
+        (-3 * t3 + 4 * t2 + t) / 2,
+        (t3 - t2) / 2,
+    ])
+
+
+def _parse_dted_angle(field: bytes) -> float:
+    """Parses a DDDMMSSH header angle into signed decimal degrees."""
+    text = field.decode("ascii")
+    degrees = int(text[0:3]) + int(text[3:5]) / 60 + int(text[5:7]) / 3600
+    return -degrees if text[7] in "SW" else degrees
+
+
+def read_dted_header(file_path: str) -> dict:
+    """Reads the origin, post spacing and dimensions from a DTED file's UHL record."""
+    with open(file_path, "rb") as f:
+        uhl = f.read(DTED_UHL_LENGTH)
+    if len(uhl) < DTED_UHL_LENGTH or uhl[:4] != b"UHL1":
+        raise ValueError(f"Not a DTED file (missing UHL record): {file_path}")
+    try:
+        return {
+            "lon_origin": _parse_dted_angle(uhl[4:12]),
+            "lat_origin": _parse_dted_angle(uhl[12:20]),
+            # intervals are stored in tenths of arc seconds
+            "lon_interval": int(uhl[20:24]) / 36000,
+            "lat_interval": int(uhl[24:28]) / 36000,
+            "num_lon_lines": int(uhl[47:51]),
+            "num_lat_points": int(uhl[51:55]),
+        }
+    except (ValueError, UnicodeDecodeError, IndexError) as e:
+        raise ValueError(f"Malformed DTED UHL record in {file_path}: {e}")
+
+
+def open_dted_memmap(file_path: str) -> DTEDTile:
+    """
+    Memory-maps a DTED level 0/1/2 file and exposes its elevations as a zero-copy NumPy view.
+
+    Each data record is one longitude line (south to north) of big-endian
+    int16 posts framed by an 8-byte header and a 4-byte checksum, so the file
+    body maps onto a (lon lines, record words) array; the elevation view is
+    that array transposed and flipped to north-up.
+
+    Args:
+        file_path (str): Path to the .dt0/.dt1/.dt2 file.
+
+    Returns:
+        DTEDTile: Tile backed by the memory map.
+
+    Raises:
+        ValueError: If the file is not laid out as a DTED file.
+    """
+    header = read_dted_header(file_path)
+    num_lon_lines = header["num_lon_lines"]
+    num_lat_points = header["num_lat_points"]
+    record_words = (8 + 2 * num_lat_points + 4) // 2
+    if num_lon_lines <= 0 or num_lat_points <= 0:
+        raise ValueError(f"Invalid DTED dimensions in {file_path}")
+    if os.path.getsize(file_path) < DTED_HEADER_LENGTH + num_lon_lines * record_words * 2:
+        raise ValueError(f"Truncated DTED file: {file_path}")
+    records = np.memmap(file_path, dtype=">i2", mode="r", offset=DTED_HEADER_LENGTH, shape=(num_lon_lines, record_words))
+    sentinels = (records[[0, -1], 0].astype(np.uint16) >> 8)
+    if not np.all(sentinels == DTED_RECORD_SENTINEL):
+        raise ValueError(f"Missing DTED data record sentinel in {file_path}")
+    elevation = records[:, 4:4 + num_lat_points].T[::-1]
+    lon_interval = header["lon_interval"]
+    lat_interval = header["lat_interval"]
+    transform = (
+        lon_interval, 0.0, header["lon_origin"] - lon_interval / 2,
+        0.0, -lat_interval, header["lat_origin"] + (num_lat_points - 1) * lat_interval + lat_interval / 2,
+    )
+    return DTEDTile(file_path, elevation, transform, signed_magnitude=True)
+
+
+def read_dted_rasterio(file_path: str) -> DTEDTile:
+    """Decodes a DTED (or any GDAL-readable elevation) file into memory with rasterio."""
+    import rasterio
+    with rasterio.open(file_path) as dted:
+        return DTEDTile(file_path, dted.read(1), tuple(dted.transform)[:6])
+
+
+def load_dted_pyramid_tile(file_path: str) -> DTEDTile:
+    """Loads a downsampled pyramid level written by build_dted_pyramid."""
+    with np.load(file_path) as data:
+        return DTEDTile(file_path, data["elevation"], tuple(data["transform"]))
+
+
+@lru_cache(maxsize=8)
+def _read_dted_container_index(container_path: str, mtime_ns: int) -> dict:
+    with open(container_path, "rb") as f:
+        if f.read(len(DTED_CONTAINER_MAGIC)) != DTED_CONTAINER_MAGIC:
+            raise ValueError(f"Not a DTED container: {container_path}")
+        header_length = int.from_bytes(f.read(4), "little")
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    data_start = _align(len(DTED_CONTAINER_MAGIC) + 4 + header_length, DTED_CONTAINER_ALIGNMENT)
+    for entry in header["cells"].values():
+        entry["offset"] += data_start
+    return header
+
+
+def _align(offset: int, alignment: int) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+def read_dted_container_index(container_path: str) -> dict:
+    """
+    Reads the header index of a DTED container.
+
+    The container is the magic bytes, a little-endian uint32 header length,
+    a JSON header and then, from the next 16-byte boundary, every cell as a
+    C-ordered little-endian int16 array (north-up, native two's complement).
+
+    Returns:
+        dict: {"cells": {"e011/n49.dt2": {"lat", "lon", "level", "shape", "transform", "offset"}}}
+            with absolute byte offsets.
+    """
+    return _read_dted_container_index(container_path, os.stat(container_path).st_mtime_ns)
+
+
+def open_dted_container_tile(file_path: str) -> DTEDTile:
+    """Memory-maps one cell of a DTED container, addressed as '<container path>#<lon folder>/<lat file>'."""
+    container_path, key = file_path.rsplit("#", 1)
+    entry = read_dted_container_index(container_path)["cells"][key]
+    elevation = np.memmap(container_path, dtype="<i2", mode="r", offset=entry["offset"], shape=tuple(entry["shape"]))
+    return DTEDTile(file_path, elevation, tuple(entry["transform"]))
+
+
+def build_dted_container(output_path: str = None) -> dict:
+    """
+    Packs the finest level of every loose DTED file under DTED_DIRECTORY into a single container.
+
+    An existing container is never read, so re-running the conversion repacks the source files.
+
+    Args:
+        output_path (str, optional): Container to write; defaults to DTED_DIRECTORY/dted_container.bin.
+
+    Returns:
+        dict: The container index (see read_dted_container_index).
+    """
+    output_path = output_path or os.path.join(DTED_DIRECTORY, DTED_CONTAINER_FILENAME)
+    source_cells = DTEDCatalog.scan(DTED_DIRECTORY, include_container=False)
+    if not source_cells:
+        raise FileNotFoundError(f"No DTED files found in {os.path.abspath(DTED_DIRECTORY)}")
+    cells = {}
+    arrays = []
+    offset = 0
+    for cell in sorted(source_cells.values(), key=lambda cell: (cell["lon"], cell["lat"])):
+        tile = DTEDTileCache.load_tile(os.path.join(DTED_DIRECTORY, *cell["file"].split("/")))
+        lat_dir, lon_dir = get_dted_cell_names(cell["lat"], cell["lon"])
+        key = f"{lon_dir}/{lat_dir}.dt{cell['levels'][0]}"
+        cells[key] = {
+            "lat": cell["lat"],
+            "lon": cell["lon"],
+            "level": cell["levels"][0],
+            "shape": list(tile.elevation.shape),
+            "transform": list(tile.transform),
+            "offset": offset,
+        }
+        arrays.append(tile.read_array().astype("<i2"))
+        offset = _align(offset + tile.elevation.size * 2, DTED_CONTAINER_ALIGNMENT)
+    header = json.dumps({"created": datetime.now().isoformat(timespec="seconds"), "cells": cells}).encode("utf-8")
+    data_start = _align(len(DTED_CONTAINER_MAGIC) + 4 + len(header), DTED_CONTAINER_ALIGNMENT)
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(DTED_CONTAINER_MAGIC)
+        f.write(len(header).to_bytes(4, "little"))
+        f.write(header)
+        for entry, values in zip(cells.values(), arrays):
+            f.seek(data_start + entry["offset"])
+            f.write(values.tobytes())
+        f.truncate(data_start + offset)
+    # drop every mapping of the old container before replacing it (Windows refuses to replace mapped files)
+    DTEDTileCache.clear_cache()
+    _read_dted_container_index.cache_clear()
+    os.replace(temp_path, output_path)
+    return read_dted_container_index(output_path)
+
+
+class DTEDTileCache:
+    """Thread-safe, process-wide LRU cache of decoded DTED tiles with a memory cap."""
+
+    _tile_cache: "OrderedDict[str, DTEDTile]" = OrderedDict()
+    _lock = threading.Lock()
+    max_bytes: int = int(conf.get("DTED_TILE_CACHE_MB", 256) * 1024 * 1024)
+    current_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @staticmethod
+    def load_tile(file_path: str) -> DTEDTile:
+        """Memory-maps a DTED file, falling back to rasterio for files the built-in reader cannot parse."""
+        if file_path.endswith(".npz"):
+            return load_dted_pyramid_tile(file_path)
+        if "#" in file_path:
+            return open_dted_container_tile(file_path)
+        try:
+            return open_dted_memmap(file_path)
+        except ValueError:
+            return read_dted_rasterio(file_path)
+
+    @classmethod
+    def get_tile(cls, file_path: str) -> DTEDTile:
+        """
+        Get the decoded tile for a DTED file, decoding it on a cache miss.
+
+        Args:
+            file_path (str): Path to the DTED file.
+
+        Returns:
+            DTEDTile: Decoded elevation array and geotransform.
+        """
+        with cls._lock:
+            tile = cls._tile_cache.get(file_path)
+            if tile is not None:
+                cls._tile_cache.move_to_end(file_path)
+                cls.hits += 1
+                return tile
+            cls.misses += 1
+        # decode outside the lock so other threads can keep reading resident tiles
+        tile = cls.load_tile(file_path)
+        with cls._lock:
+            if file_path in cls._tile_cache:
+                return cls._tile_cache[file_path]
+            cls._tile_cache[file_path] = tile
+            cls.current_bytes += tile.nbytes
+            cls._evict()
+        return tile
+
+    @classmethod
+    def _evict(cls) -> None:
+        """Drop least recently used tiles until under the memory cap (always keeps the newest tile)."""
+        while cls.current_bytes > cls.max_bytes and len(cls._tile_cache) > 1:
+            _, evicted = cls._tile_cache.popitem(last=False)
+            cls.current_bytes -= evicted.nbytes
+            cls.evictions += 1
+
+    @classmethod
+    def set_max_bytes(cls, max_bytes: int) -> None:
+        """Change the memory cap, evicting tiles if the cache is now over it."""
+        with cls._lock:
+            cls.max_bytes = int(max_bytes)
+            cls._evict()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        """Returns hit/miss/eviction counters and current memory use."""
+        with cls._lock:
+            return {
+                "tiles": len(cls._tile_cache),
+                "bytes": cls.current_bytes,
+                "max_bytes": cls.max_bytes,
+                "hits": cls.hits,
+                "misses": cls.misses,
+                "evictions": cls.evictions,
+            }
+
+    @classmethod
+    def contains(cls, file_path: str) -> bool:
+        """True if the tile for a DTED file is resident (does not count as a hit)."""
+        with cls._lock:
+            return file_path in cls._tile_cache
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all resident tiles and reset the counters."""
+        with cls._lock:
+            cls._tile_cache.clear()
+            cls.current_bytes = 0
+            cls.hits = 0
+            cls.misses = 0
+            cls.evictions = 0
+
+
+class DTEDCatalog:
+    """Process-wide index of the DTED cells under DTED_DIRECTORY, cached in a JSON manifest next to the tiles."""
+
+    MANIFEST_FILENAME = "dted_manifest.json"
+    _cells: Dict[tuple[int, int], dict] = {}
+    _directory: str = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_signature(directory: str) -> Dict[str, int]:
+        """Returns the modification times of the longitude folders and the container, which change whenever a tile is added or removed."""
+        if not os.path.isdir(directory):
+            return {}
+        return {
+            entry.name: entry.stat().st_mtime_ns for entry in os.scandir(directory)
+            if entry.is_dir() or entry.name == DTED_CONTAINER_FILENAME
+        }
+
+    @staticmethod
+    def scan(directory: str, include_container: bool = True) -> Dict[tuple[int, int], dict]:
+        """
+        Walks a DTED tree (<e|w>DDD/<n|s>DD.dt<level>) and its container index without opening any tiles.
+
+        Args:
+            directory (str): Root of the DTED tree.
+            include_container (bool): Whether cells of the container override the loose files.
+
+        Returns:
+            dict: (cell_lat, cell_lon) -> {"lat", "lon", "levels", "file", "bounds"} where levels
+                are sorted finest first, file is the relative path of the finest level and
+                bounds are (south, west, north, east).
+        """
+        files = {}
+        if not os.path.isdir(directory):
+            return {}
+        for lon_entry in os.scandir(directory):
+            lon_match = re.fullmatch(r"([ew])(\d{3})", lon_entry.name.lower())
+            if not lon_entry.is_dir() or lon_match is None:
+                continue
+            cell_lon = int(lon_match.group(2)) * (1 if lon_match.group(1) == "e" else -1)
+            for file_entry in os.scandir(lon_entry.path):
+                file_match = re.fullmatch(r"([ns])(\d{2})\.dt([012])", file_entry.name.lower())
+                if not file_entry.is_file() or file_match is None:
+                    continue
+                cell_lat = int(file_match.group(2)) * (1 if file_match.group(1) == "n" else -1)
+                files.setdefault((cell_lat, cell_lon), {})[int(file_match.group(3))] = f"{lon_entry.name}/{file_entry.name}"
+        container_path = os.path.join(directory, DTED_CONTAINER_FILENAME)
+        if include_container and os.path.isfile(container_path):
+            # container cells take precedence over loose files of the same level
+            for key, entry in read_dted_container_index(container_path)["cells"].items():
+                files.setdefault((entry["lat"], entry["lon"]), {})[entry["level"]] = f"{DTED_CONTAINER_FILENAME}#{key}"
+        cells = {}
+        for (cell_lat, cell_lon), levels in files.items():
+            cells[(cell_lat, cell_lon)] = {
+                "lat": cell_lat,
+                "lon": cell_lon,
+                "levels": sorted(levels, reverse=True),
+                "file": levels[max(levels)],
+                "bounds": [cell_lat, cell_lon, cell_lat + 1, cell_lon + 1],
+            }
+        return cells
+
+    @classmethod
+    def load(cls, rebuild: bool = False) -> None:
+        """Loads the manifest of DTED_DIRECTORY if it is current, otherwise rescans the tree and rewrites it."""
+        directory = DTED_DIRECTORY
+        manifest_path = os.path.join(directory, cls.MANIFEST_FILENAME)
+        signature = cls.get_signature(directory)
+        cells = None
+        if not rebuild and os.path.isfile(manifest_path):
+            try:
+                manifest = read_json(manifest_path)
+                if manifest.get("signature") == signature:
+                    cells = {(cell["lat"], cell["lon"]): cell for cell in manifest["cells"]}
+            except (OSError, ValueError, KeyError):
+                cells = None
+        if cells is None:
+            cells = cls.scan(directory)
+            try:
+                with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+                    json.dump({
+                        "generated": datetime.now().isoformat(timespec="seconds"),
+                        "signature": signature,
+                        "cells": sorted(cells.values(), key=lambda cell: (cell["lat"], cell["lon"])),
+                    }, manifest_file, indent=1)
+            except OSError:
+                # read-only media; the tree is simply rescanned next time
+                pass
+        with cls._lock:
+            cls._cells = cells
+            cls._directory = directory
+
+    @classmethod
+    def refresh(cls) -> None:
+        """Rescans DTED_DIRECTORY, e.g. after tiles were copied in while running."""
+        cls.load(rebuild=True)
+
+    @classmethod
+    def get_cells(cls) -> Dict[tuple[int, int], dict]:
+        """Returns the catalog of DTED_DIRECTORY, loading it on first use."""
+        if cls._directory != DTED_DIRECTORY:
+            cls.load()
+        return cls._cells
+
+    @classmethod
+    def get_cell(cls, lat: float, lon: float) -> dict:
+        """Returns the catalog entry of the cell containing a coordinate, or None if it has no DTED."""
+        return cls.get_cells().get(get_dted_cell(lat, lon))
+
+    @classmethod
+    def get_file(cls, lat: float, lon: float) -> str:
+        """Returns the path of the finest DTED file covering a coordinate ('<container>#<key>' for container cells), or None."""
+        cell = cls.get_cell(lat, lon)
+        if cell is None:
+            return None
+        if "#" in cell["file"]:
+            container, key = cell["file"].split("#", 1)
+            return f"{os.path.join(DTED_DIRECTORY, container)}#{key}"
+        return os.path.join(DTED_DIRECTORY, *cell["file"].split("/"))
+
+    @classmethod
+    def get_missing_cells(cls, lats: np.ndarray, lons: np.ndarray) -> list[tuple[int, int]]:
+        """Returns the (cell_lat, cell_lon) of every cell touched by the coordinates that has no DTED."""
+        cells = cls.get_cells()
+        keys = np.unique(np.stack([np.floor(np.ravel(lats)), np.floor(np.ravel(lons))], axis=1).astype(int), axis=0)
+        return [(int(cell_lat), int(cell_lon)) for cell_lat, cell_lon in keys if (cell_lat, cell_lon) not in cells]
+
+    @classmethod
+    def get_missing_cells_along_path(cls, start: list[float], end: list[float], interpoint_distance_m: float = 100) -> list[tuple[int, int]]:
+        """Returns the cells without DTED crossed by the great-circle path between two coordinates."""
+        num_points = int(np.ceil(get_distance_between_coords(start, end, 'm') / interpoint_distance_m)) + 1
+        lats, lons = get_great_circle_points(start, end, np.linspace(0, 1, max(num_points, 2)))
+        return cls.get_missing_cells(lats, lons)
+
+    @classmethod
+    def is_path_covered(cls, start: list[float], end: list[float]) -> bool:
+        """True if DTED covers the whole great-circle path between two coordinates (e.g. a LOB)."""
+        return not cls.get_missing_cells_along_path(start, end)
+
+    @classmethod
+    def get_coverage_bounds(cls) -> tuple[float, float, float, float]:
+        """Returns the (south, west, north, east) bounds of all catalogued cells, or None if there are none."""
+        cells = cls.get_cells()
+        if not cells:
+            return None
+        bounds = np.array([cell["bounds"] for cell in cells.values()])
+        return tuple(float(x) for x in (*bounds[:, :2].min(axis=0), *bounds[:, 2:].max(axis=0)))
+
+
+def get_dted_cell(lat: float, lon: float) -> tuple[int, int]:
+    """Returns the (lat, lon) of the south-west corner of the 1x1 degree DTED cell containing a coordinate."""
+    return int(np.floor(lat)), int(np.floor(lon))
+
+
+class DTEDPrefetcher:
+    """Background thread pool that warms the DTED tile cache for the cells around points of interest."""
+
+    radius_km: float = float(conf.get("DTED_PREFETCH_RADIUS_KM", 30))
+    max_workers: int = 2
+    _executor = None
+    _pending: set = set()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_cells_within_radius(coord: list[float], radius_km: float) -> list[tuple[int, int]]:
+        """Returns the DTED cells overlapping the box that encloses a radius around a coordinate."""
+        lat_radius = radius_km * 1000 / (np.radians(1) * EARTH_RADIUS_M)
+        lon_radius = lat_radius / max(np.cos(np.radians(coord[0])), 1e-6)
+        lat_range = range(int(np.floor(max(coord[0] - lat_radius, -90))), int(np.floor(min(coord[0] + lat_radius, 89.999999))) + 1)
+        lon_range = range(int(np.floor(coord[1] - lon_radius)), int(np.floor(coord[1] + lon_radius)) + 1)
+        # wrap longitudes across the antimeridian
+        return [(cell_lat, (cell_lon + 180) % 360 - 180) for cell_lat in lat_range for cell_lon in lon_range]
+
+    @staticmethod
+    def warm_tile(file_path: str) -> None:
+        """Loads a tile into the cache and touches every post so it is paged in."""
+        tile = DTEDTileCache.get_tile(file_path)
+        np.max(tile.elevation)
+
+    @classmethod
+    def prefetch(cls, coords: list[list[float]], radius_km: float = None) -> list:
+        """
+        Queues the DTED cells within a radius of the coordinates for loading on background threads.
+
+        Cells that are not catalogued, already resident or already queued are skipped,
+        so this is cheap to call repeatedly (e.g. on every map move).
+
+        Args:
+            coords (list[list[float]]): Coordinates [lat, lon] of EWTs, the map center, etc.
+            radius_km (float, optional): Radius around each coordinate; defaults to DTED_PREFETCH_RADIUS_KM.
+
+        Returns:
+            list: concurrent.futures.Future of each queued tile.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        radius_km = cls.radius_km if radius_km is None else radius_km
+        file_paths = []
+        for coord in coords:
+            if coord is None:
+                continue
+            for cell_lat, cell_lon in cls.get_cells_within_radius(coord, radius_km):
+                file_path = DTEDCatalog.get_file(cell_lat, cell_lon)
+                if file_path is not None and file_path not in file_paths and not DTEDTileCache.contains(file_path):
+                    file_paths.append(file_path)
+        queued = {}
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.max_workers, thread_name_prefix="dted-prefetch")
+            for file_path in file_paths:
+                if file_path in cls._pending:
+                    continue
+                cls._pending.add(file_path)
+                queued[file_path] = cls._executor.submit(cls.warm_tile, file_path)
+        # outside the lock: callbacks of futures that already finished run immediately
+        for file_path, future in queued.items():
+            future.add_done_callback(lambda _, file_path=file_path: cls._discard_pending(file_path))
+        return list(queued.values())
+
+    @classmethod
+    def _discard_pending(cls, file_path: str) -> None:
+        with cls._lock:
+            cls._pending.discard(file_path)
+
+    @classmethod
+    def shutdown(cls, wait: bool = False) -> None:
+        """Stops the worker threads, dropping queued tiles unless wait is True."""
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+def get_dted_cell_names(cell_lat: int, cell_lon: int) -> tuple[str, str]:
+    """Returns the (latitude file stem, longitude folder) names of a DTED cell, e.g. ('n49', 'e011')."""
+    lat_dir = f'n{cell_lat:02d}' if cell_lat >= 0 else f's{abs(cell_lat):02d}'
+    lon_dir = f'e{cell_lon:03d}' if cell_lon >= 0 else f'w{abs(cell_lon):03d}'
+    return lat_dir, lon_dir
 
 
 def get_dted_file(lat: float, lon: float) -> str:
     """Constructs the DTED file path based on latitude and longitude."""
-    lat_dir = f'n{int(lat):02d}' if lat >= 0 else f's{abs(int(lat)):02d}'
-    lon_dir = f'e{int(lon):03d}' if lon >= 0 else f'w{abs(int(lon)):03d}'
-    dted_dir = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)), "..", "dted"
-    )
-    file_path = os.path.join(dted_dir, lon_dir, f"{lat_dir}.dt2")
+    file_path = DTEDCatalog.get_file(lat, lon)
+    if file_path is not None:
+        return file_path
+    # not catalogued; check the disk in case tiles were added since the catalog was built
+    lat_dir, lon_dir = get_dted_cell_names(*get_dted_cell(lat, lon))
+    for extension in DTED_EXTENSIONS:
+        file_path = os.path.join(DTED_DIRECTORY, lon_dir, f"{lat_dir}{extension}")
+        if os.path.exists(file_path):
+            return file_path
+    return os.path.join(DTED_DIRECTORY, lon_dir, f"{lat_dir}{DTED_EXTENSIONS[0]}")
+
+
+def require_dted_file(lat: float, lon: float) -> str:
+    """Returns the DTED file covering a coordinate, raising FileNotFoundError if there is none."""
+    file_path = DTEDCatalog.get_file(lat, lon)
+    if file_path is None:
+        file_path = get_dted_file(lat, lon)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"DTED file not found: {file_path}")
     return file_path
 
 
+def get_dted_pyramid_file(cell_lat: int, cell_lon: int, factor: int) -> str:
+    """Constructs the path of a downsampled pyramid level of a DTED cell."""
+    lat_dir, lon_dir = get_dted_cell_names(cell_lat, cell_lon)
+    return os.path.join(DTED_DIRECTORY, DTED_PYRAMID_DIRECTORY_NAME, lon_dir, f"{lat_dir}_x{factor}.npz")
+
+
+def downsample_elevation(elevation: np.ndarray, factor: int) -> np.ndarray:
+    """Box-filters posts over (factor + 1)-post windows and keeps every factor-th post, starting with the first."""
+    if factor == 1:
+        return np.array(elevation, dtype=np.int16)
+    radius = factor // 2
+    window = 2 * radius + 1
+    padded = np.pad(np.asarray(elevation, dtype=np.float64), radius, mode="edge")
+    integral = np.pad(padded.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    rows = np.arange(0, elevation.shape[0], factor)[:, None]
+    cols = np.arange(0, elevation.shape[1], factor)[None, :]
+    window_sums = (
+        integral[rows + window, cols + window] - integral[rows, cols + window]
+        - integral[rows + window, cols] + integral[rows, cols]
+    )
+    return np.rint(window_sums / window ** 2).astype(np.int16)
+
+
+def build_dted_pyramid(lat: float, lon: float, factors: tuple[int, ...] = DTED_PYRAMID_FACTORS[1:], overwrite: bool = False) -> list[str]:
+    """
+    Writes the downsampled pyramid levels of the DTED cell containing a coordinate.
+
+    Each level is a compressed npz holding the int16 posts and the
+    geotransform; post 0 stays on the cell's north-west post.
+
+    Args:
+        lat (float): Latitude inside the cell.
+        lon (float): Longitude inside the cell.
+        factors (tuple[int, ...]): Downsampling factors to write.
+        overwrite (bool): Rebuild levels that already exist.
+
+    Returns:
+        list[str]: Paths of the levels written.
+
+    Raises:
+        FileNotFoundError: If the cell has no DTED file.
+    """
+    source_path = require_dted_file(lat, lon)
+    cell_lat, cell_lon = get_dted_cell(lat, lon)
+    written = []
+    tile = None
+    for factor in factors:
+        file_path = get_dted_pyramid_file(cell_lat, cell_lon, factor)
+        if factor == 1 or (os.path.exists(file_path) and not overwrite):
+            continue
+        if tile is None:
+            # bypass the tile cache so a full rebuild does not evict the working set
+            tile = DTEDTileCache.load_tile(source_path)
+            elevation = tile.read_array()
+        a, b, c, d, e, f = tile.transform
+        transform = (a * factor, b, c + a * (1 - factor) / 2, d, e * factor, f + e * (1 - factor) / 2)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        np.savez_compressed(file_path, elevation=downsample_elevation(elevation, factor), transform=np.array(transform))
+        written.append(file_path)
+    return written
+
+
+def get_dted_pyramid_factor(lat: float, lon: float, resolution_m: float) -> int:
+    """Returns the coarsest built pyramid factor whose post spacing still meets a ground resolution (1 is native DTED)."""
+    cell = DTEDCatalog.get_cell(lat, lon)
+    if cell is None:
+        return 1
+    file_path = DTEDCatalog.get_file(lat, lon)
+    try:
+        if "#" in file_path:
+            container_path, key = file_path.rsplit("#", 1)
+            lat_interval = abs(read_dted_container_index(container_path)["cells"][key]["transform"][4])
+        else:
+            lat_interval = read_dted_header(file_path)["lat_interval"]
+    except (OSError, ValueError, KeyError):
+        lat_interval = DTED_LEVEL_LAT_INTERVAL_ARCSEC[cell["levels"][0]] / 3600
+    spacing_m = lat_interval * np.radians(1) * EARTH_RADIUS_M
+    for factor in sorted(DTED_PYRAMID_FACTORS, reverse=True):
+        if factor == 1:
+            break
+        if factor * spacing_m <= resolution_m and os.path.exists(get_dted_pyramid_file(cell["lat"], cell["lon"], factor)):
+            return factor
+    return 1
+
+
+def get_dted_file_for_resolution(lat: float, lon: float, resolution_m: float = None) -> str:
+    """Returns the coarsest DTED file or pyramid level covering a coordinate that meets a ground resolution (m)."""
+    file_path = require_dted_file(lat, lon)
+    if resolution_m is None:
+        return file_path
+    factor = get_dted_pyramid_factor(lat, lon, resolution_m)
+    return file_path if factor == 1 else get_dted_pyramid_file(*get_dted_cell(lat, lon), factor)
+
+
 def get_elevation(coord: list[float]) -> float:
     """Returns the elevation for a given coordinate from the DTED files."""
     assert isinstance(coord, list) and len(coord) == 2, "Coordinate must be a list of two floats."
@@ -31,18 +796,57 @@ def get_elevation(coord: list[float]) -> float:
     assert -90 <= lat <= 90, "Latitude must be between -90 and 90 degrees."
     assert -180 <= lon <= 180, "Longitude must be between -180 and 180 degrees."
 
-    file_path = get_dted_file(lat, lon)
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"DTED file not found: {file_path}")
+    return get_elevations(np.array([lat]), np.array([lon]))[0]
 
-    try:
-        with rasterio.open(file_path) as dted:
-            row, col = dted.index(lon, lat)
-            elevation = dted.read(1)[row, col]
-    except Exception as e:
-        raise RuntimeError(f"Error reading elevation data: {e}")
 
-    return elevation
+def get_elevations(lats: np.ndarray, lons: np.ndarray, method: str = "nearest", resolution_m: float = None) -> np.ndarray:
+    """
+    Returns the elevations for arrays of coordinates from the DTED files.
+
+    Points are grouped by DTED cell so each cell is fetched from the tile
+    cache once and indexed in a single vectorized lookup.
+
+    Args:
+        lats (np.ndarray): Latitudes in degrees.
+        lons (np.ndarray): Longitudes in degrees, same shape as lats.
+        method (str): 'nearest' post (default), or 'bilinear'/'bicubic' interpolation.
+        resolution_m (float, optional): Coarsest acceptable ground resolution; reads from the
+            elevation pyramid when a built level meets it, native DTED otherwise.
+
+    Returns:
+        np.ndarray: Elevations (m) with the same shape as the inputs;
+            int16 for 'nearest', float64 when interpolated.
+
+    Raises:
+        FileNotFoundError: If a point falls in a cell with no DTED file.
+        RuntimeError: If a DTED file cannot be read.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    assert lats.shape == lons.shape, "Latitude and Longitude arrays must have the same shape."
+    assert np.all((-90 <= lats) & (lats <= 90)), "Latitude must be between -90 and 90 degrees."
+    assert np.all((-180 <= lons) & (lons <= 180)), "Longitude must be between -180 and 180 degrees."
+    assert method in ELEVATION_SAMPLING_METHODS, f"Sampling method must be one of {ELEVATION_SAMPLING_METHODS}."
+
+    flat_lats = lats.ravel()
+    flat_lons = lons.ravel()
+    elevations = np.zeros(flat_lats.shape, dtype=np.int16 if method == "nearest" else np.float64)
+    if flat_lats.size == 0:
+        return elevations.reshape(lats.shape)
+
+    cell_keys = (np.floor(flat_lats).astype(np.int64) + 90) * 361 + (np.floor(flat_lons).astype(np.int64) + 180)
+    unique_keys, inverse = np.unique(cell_keys, return_inverse=True)
+    for key_index, cell_key in enumerate(unique_keys):
+        cell_lat, cell_lon = int(cell_key // 361) - 90, int(cell_key % 361) - 180
+        file_path = get_dted_file_for_resolution(cell_lat, cell_lon, resolution_m)
+        in_cell = inverse == key_index
+        try:
+            tile = DTEDTileCache.get_tile(file_path)
+            elevations[in_cell] = tile.sample(flat_lats[in_cell], flat_lons[in_cell], method)
+        except Exception as e:
+            raise RuntimeError(f"Error reading elevation data: {e}")
+
+    return elevations.reshape(lats.shape)
 
 
 def generate_coordinates_of_interest(
@@ -52,24 +856,432 @@ def generate_coordinates_of_interest(
 ) -> list[float]:
     farside_target_distance_m = farside_target_distance_km * 1000
     offset_distance_m = farside_target_distance_m * 0.2
-    bearing = get_bearing_between_coordinates(sensor_coord, target_coord)
-    farside_coord = adjust_coordinate(
-        sensor_coord,
-        bearing,
-        farside_target_distance_m + offset_distance_m
-    )
+    bearing, _ = get_geodesic_inverse(*sensor_coord, *target_coord, 'sphere')
+    farside_lat, farside_lon = get_geodesic_destinations(*sensor_coord, bearing, farside_target_distance_m + offset_distance_m, 'sphere')
+    farside_coord = [float(farside_lat), float(farside_lon)]
     return farside_coord
 
 
+def get_dted_post_spacing_m(lat: float, lon: float) -> float:
+    """Returns the finer of the north-south and east-west post spacings (m) of the DTED cell containing a coordinate."""
+    file_path = require_dted_file(lat, lon)
+    a, _, _, _, e, _ = DTEDTileCache.get_tile(file_path).transform
+    meters_per_degree = np.radians(1) * EARTH_RADIUS_M
+    return float(min(abs(e) * meters_per_degree, abs(a) * meters_per_degree * np.cos(np.radians(lat))))
+
+
+def get_great_circle_points(start: list[float],
+                            end: list[float],
+                            fractions: np.ndarray
+                            ) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the (lats, lons) at fractions (0 to 1) of the way along the great circle from start to end."""
+    lat1, lon1, lat2, lon2 = np.radians([start[0], start[1], end[0], end[1]])
+    v1 = np.array([np.cos(lat1) * np.cos(lon1), np.cos(lat1) * np.sin(lon1), np.sin(lat1)])
+    v2 = np.array([np.cos(lat2) * np.cos(lon2), np.cos(lat2) * np.sin(lon2), np.sin(lat2)])
+    omega = np.arccos(np.clip(np.dot(v1, v2), -1.0, 1.0))
+    fractions = np.asarray(fractions, dtype=np.float64)
+    if omega < 1e-12:
+        return np.full(fractions.shape, start[0], dtype=np.float64), np.full(fractions.shape, start[1], dtype=np.float64)
+    weight1 = np.sin((1 - fractions) * omega) / np.sin(omega)
+    weight2 = np.sin(fractions * omega) / np.sin(omega)
+    x, y, z = np.outer(v1, weight1) + np.outer(v2, weight2)
+    return np.degrees(np.arctan2(z, np.hypot(x, y))), np.degrees(np.arctan2(y, x))
+
+
+def get_great_circle_paths(start: list[float],
+                           end_lats: np.ndarray,
+                           end_lons: np.ndarray,
+                           fractions: np.ndarray
+                           ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Samples the great circles from one start coordinate to many end coordinates.
+
+    Args:
+        start (list[float]): Start coordinate [lat, lon].
+        end_lats (np.ndarray): 1-D end latitudes in degrees.
+        end_lons (np.ndarray): 1-D end longitudes in degrees.
+        fractions (np.ndarray): 1-D fractions (0 to 1) of the way along each path.
+
+    Returns:
+        tuple: (lats, lons) of shape (len(ends), len(fractions)) and the path lengths (m).
+    """
+    lat1, lon1 = np.radians(start[0]), np.radians(start[1])
+    lat2, lon2 = np.radians(np.asarray(end_lats, dtype=np.float64)), np.radians(np.asarray(end_lons, dtype=np.float64))
+    v1 = np.array([np.cos(lat1) * np.cos(lon1), np.cos(lat1) * np.sin(lon1), np.sin(lat1)])
+    v2 = np.stack([np.cos(lat2) * np.cos(lon2), np.cos(lat2) * np.sin(lon2), np.sin(lat2)], axis=-1)
+    omega = np.arccos(np.clip(v2 @ v1, -1.0, 1.0))
+    fractions = np.asarray(fractions, dtype=np.float64)
+    zero_length = omega < 1e-12
+    sin_omega = np.where(zero_length, 1.0, np.sin(omega))[:, None]
+    weight1 = np.sin(np.outer(omega, 1 - fractions)) / sin_omega
+    weight2 = np.sin(np.outer(omega, fractions)) / sin_omega
+    # paths of zero length collapse onto the start point
+    weight1[zero_length] = 1 - fractions
+    weight2[zero_length] = fractions
+    x = weight1 * v1[0] + weight2 * v2[:, 0, None]
+    y = weight1 * v1[1] + weight2 * v2[:, 1, None]
+    z = weight1 * v1[2] + weight2 * v2[:, 2, None]
+    return np.degrees(np.arctan2(z, np.hypot(x, y))), np.degrees(np.arctan2(y, x)), omega * EARTH_RADIUS_M
+
+
+def get_fresnel_zone_radius(path_distances_m: np.ndarray, total_distances_m: np.ndarray, frequency_MHz: float) -> np.ndarray:
+    """Returns the first Fresnel zone radius (m), sqrt(wavelength * d1 * d2 / D), at distances along paths of total length D."""
+    assert frequency_MHz > 0, "Frequency must be positive."
+    wavelength_m = SPEED_OF_LIGHT_M_S / (frequency_MHz * 1e6)
+    path_distances_m = np.asarray(path_distances_m, dtype=np.float64)
+    total_distances_m = np.asarray(total_distances_m, dtype=np.float64)
+    return np.sqrt(np.maximum(wavelength_m * path_distances_m * (total_distances_m - path_distances_m), 0) / np.maximum(total_distances_m, 1e-9))
+
+
+def _sweep_sight_lines(
+    sensor_coord: list[float],
+    flat_lats: np.ndarray,
+    flat_lons: np.ndarray,
+    sensor_height_m: float,
+    target_height_m: float,
+    weather_coeff: float,
+    interpoint_distance_m: float,
+    method: str
+):
+    """
+    Yields (chunk, lats, lons, path_distances_m, distances_m, height_above_terrain_m)
+    for range-sorted chunks of targets, where height_above_terrain_m is the
+    sight line minus the earth-bulged terrain at each interior path sample.
+    """
+    if interpoint_distance_m is None:
+        interpoint_distance_m = get_dted_post_spacing_m(*sensor_coord)
+    sensor_elevation = float(get_elevations(np.array([sensor_coord[0]]), np.array([sensor_coord[1]]), method)[0]) + sensor_height_m
+    target_distances_m = get_great_circle_paths(sensor_coord, flat_lats, flat_lons, np.array([1.0]))[2]
+    target_elevations = get_elevations(flat_lats, flat_lons, method) + target_height_m
+    effective_radius_m = weather_coeff * EARTH_RADIUS_M
+
+    # sweep the targets nearest first, in chunks sized to their longest path, so
+    # short paths are not oversampled and the working arrays stay bounded
+    order = np.argsort(target_distances_m, kind="stable")
+    for start in range(0, order.size, LINE_OF_SIGHT_CHUNK_TARGETS):
+        chunk = order[start:start + LINE_OF_SIGHT_CHUNK_TARGETS]
+        num_points = max(int(np.ceil(target_distances_m[chunk[-1]] / interpoint_distance_m)) + 1, 3)
+        # interior samples only; the end points are the antennas themselves
+        fractions = np.linspace(0, 1, num_points)[1:-1]
+        lats, lons, distances_m = get_great_circle_paths(sensor_coord, flat_lats[chunk], flat_lons[chunk], fractions)
+        terrain = get_elevations(lats, lons, method)
+        path_distances_m = fractions[None, :] * distances_m[:, None]
+        terrain = terrain + path_distances_m * (distances_m[:, None] - path_distances_m) / (2 * effective_radius_m)
+        sight_line = sensor_elevation + (target_elevations[chunk, None] - sensor_elevation) * fractions[None, :]
+        yield chunk, lats, lons, path_distances_m, distances_m, sight_line - terrain
+
+
+def get_line_of_sight_clearance(
+    sensor_coord: list[float],
+    target_lats: np.ndarray,
+    target_lons: np.ndarray,
+    sensor_height_m: float = 2.0,
+    target_height_m: float = 2.0,
+    weather_coeff: float = 4 / 3,
+    interpoint_distance_m: float = None,
+    method: str = "bilinear",
+    frequency_MHz: float = None,
+    fresnel_zone_fraction: float = FRESNEL_CLEARANCE_FRACTION
+) -> np.ndarray:
+    """
+    Returns the minimum clearance (m) of the sight lines from one sensor to many targets.
+
+    Terrain along each great-circle path is raised by the earth bulge
+    d * (D - d) / (2 * k * R), where k is the effective earth radius factor
+    (the same 4/3 refraction weather_coeff as ew.py), and compared against
+    the straight line between the antennas. Targets are swept in chunks of
+    similar range so each chunk is a handful of array operations.
+
+    Args:
+        sensor_coord (list[float]): Sensor coordinate [lat, lon].
+        target_lats (np.ndarray): Target latitudes in degrees.
+        target_lons (np.ndarray): Target longitudes in degrees, same shape as target_lats.
+        sensor_height_m (float): Sensor antenna height above ground.
+        target_height_m (float): Target antenna height above ground.
+        weather_coeff (float): Effective earth radius factor for atmospheric refraction.
+        interpoint_distance_m (float, optional): Maximum sample spacing along each path;
+            defaults to the native DTED post spacing at the sensor.
+        method (str): Elevation sampling method.
+        frequency_MHz (float, optional): When given, clearance is measured below the
+            fraction of the first Fresnel zone rather than below the sight line itself.
+        fresnel_zone_fraction (float): Fraction of the first Fresnel zone radius that must stay clear.
+
+    Returns:
+        np.ndarray: Minimum clearance (m) with the shape of the targets; negative where terrain blocks the path.
+
+    Raises:
+        FileNotFoundError: If a path crosses a cell with no DTED file.
+    """
+    target_lats = np.asarray(target_lats, dtype=np.float64)
+    target_lons = np.asarray(target_lons, dtype=np.float64)
+    assert target_lats.shape == target_lons.shape, "Latitude and Longitude arrays must have the same shape."
+    assert weather_coeff > 0, "Weather coefficient must be positive."
+    flat_lats = target_lats.ravel()
+    flat_lons = target_lons.ravel()
+    clearance = np.full(flat_lats.shape, np.inf)
+    if flat_lats.size == 0:
+        return clearance.reshape(target_lats.shape)
+
+    for chunk, _, _, path_distances_m, distances_m, clearance_m in _sweep_sight_lines(
+        sensor_coord, flat_lats, flat_lons, sensor_height_m, target_height_m, weather_coeff, interpoint_distance_m, method
+    ):
+        if frequency_MHz is not None:
+            clearance_m = clearance_m - fresnel_zone_fraction * get_fresnel_zone_radius(path_distances_m, distances_m[:, None], frequency_MHz)
+        clearance[chunk] = np.min(clearance_m, axis=1)
+    return clearance.reshape(target_lats.shape)
+
+
+def get_fresnel_clearance(
+    sensor_coord: list[float],
+    target_lats: np.ndarray,
+    target_lons: np.ndarray,
+    frequency_MHz: float,
+    sensor_height_m: float = 2.0,
+    target_height_m: float = 2.0,
+    weather_coeff: float = 4 / 3,
+    interpoint_distance_m: float = None,
+    method: str = "bilinear",
+    fresnel_zone_fraction: float = FRESNEL_CLEARANCE_FRACTION
+) -> dict:
+    """
+    Returns the first Fresnel zone clearance of the paths from one sensor to many targets.
+
+    Clearance at each path sample is the height of the sight line above the
+    earth-bulged terrain as a percentage of the first Fresnel zone radius:
+    100% or more is a fully clear zone, 0% grazes the sight line and negative
+    values are blocked. The worst sample of each path is its obstructing point.
+
+    Args:
+        sensor_coord (list[float]): Sensor coordinate [lat, lon].
+        target_lats (np.ndarray): Target latitudes in degrees.
+        target_lons (np.ndarray): Target longitudes in degrees, same shape as target_lats.
+        frequency_MHz (float): Emitter frequency.
+        sensor_height_m (float): Sensor antenna height above ground.
+        target_height_m (float): Target antenna height above ground.
+        weather_coeff (float): Effective earth radius factor for atmospheric refraction.
+        interpoint_distance_m (float, optional): Maximum sample spacing along each path;
+            defaults to the native DTED post spacing at the sensor.
+        method (str): Elevation sampling method.
+        fresnel_zone_fraction (float): Fraction of the first Fresnel zone that must stay clear
+            for a path to count as unobstructed.
+
+    Returns:
+        dict: Arrays with the shape of the targets:
+            "clearance_percent": minimum clearance as a percentage of the first Fresnel zone radius,
+            "obstructed": True where clearance_percent is below fresnel_zone_fraction * 100,
+            "obstruction_lats", "obstruction_lons", "obstruction_distances_m": the worst
+            point of each path (NaN for paths too short to have interior samples).
+
+    Raises:
+        FileNotFoundError: If a path crosses a cell with no DTED file.
+    """
+    target_lats = np.asarray(target_lats, dtype=np.float64)
+    target_lons = np.asarray(target_lons, dtype=np.float64)
+    assert target_lats.shape == target_lons.shape, "Latitude and Longitude arrays must have the same shape."
+    assert weather_coeff > 0, "Weather coefficient must be positive."
+    flat_lats = target_lats.ravel()
+    flat_lons = target_lons.ravel()
+    clearance_percent = np.full(flat_lats.shape, np.inf)
+    obstruction_lats = np.full(flat_lats.shape, np.nan)
+    obstruction_lons = np.full(flat_lats.shape, np.nan)
+    obstruction_distances_m = np.full(flat_lats.shape, np.nan)
+    if flat_lats.size:
+        for chunk, lats, lons, path_distances_m, distances_m, clearance_m in _sweep_sight_lines(
+            sensor_coord, flat_lats, flat_lons, sensor_height_m, target_height_m, weather_coeff, interpoint_distance_m, method
+        ):
+            radius_m = get_fresnel_zone_radius(path_distances_m, distances_m[:, None], frequency_MHz)
+            # zero-length paths have no zone to obstruct
+            percent = np.where(radius_m > 0, 100 * clearance_m / np.where(radius_m > 0, radius_m, 1), np.inf)
+            worst = np.argmin(percent, axis=1)
+            rows = np.arange(chunk.size)
+            clearance_percent[chunk] = percent[rows, worst]
+            valid = np.isfinite(clearance_percent[chunk])
+            obstruction_lats[chunk[valid]] = lats[rows, worst][valid]
+            obstruction_lons[chunk[valid]] = lons[rows, worst][valid]
+            obstruction_distances_m[chunk[valid]] = path_distances_m[rows, worst][valid]
+    shape = target_lats.shape
+    return {
+        "clearance_percent": clearance_percent.reshape(shape),
+        "obstructed": (clearance_percent < fresnel_zone_fraction * 100).reshape(shape),
+        "obstruction_lats": obstruction_lats.reshape(shape),
+        "obstruction_lons": obstruction_lons.reshape(shape),
+        "obstruction_distances_m": obstruction_distances_m.reshape(shape),
+    }
+
+
+def get_line_of_sight(
+    sensor_coord: list[float],
+    target_lats: np.ndarray,
+    target_lons: np.ndarray,
+    sensor_height_m: float = 2.0,
+    target_height_m: float = 2.0,
+    weather_coeff: float = 4 / 3,
+    interpoint_distance_m: float = None,
+    method: str = "bilinear",
+    frequency_MHz: float = None,
+    fresnel_zone_fraction: float = FRESNEL_CLEARANCE_FRACTION
+) -> np.ndarray:
+    """Returns a boolean array, True where the target has terrain line of sight (or Fresnel clearance) to the sensor (see get_line_of_sight_clearance)."""
+    return get_line_of_sight_clearance(
+        sensor_coord, target_lats, target_lons, sensor_height_m, target_height_m,
+        weather_coeff, interpoint_distance_m, method, frequency_MHz, fresnel_zone_fraction
+    ) >= 0
+
+
+def get_viewshed(
+    sensor_mgrs: str,
+    sensor_height_m: float = conf["DEFAULT_SENSOR_1_HEIGHT_M"],
+    radius_m: float = 10000,
+    target_height_m: float = conf["DEFAULT_TX_HEIGHT_M"],
+    weather_coeff: float = 4 / 3,
+    resolution_m: float = None
+) -> tuple[np.ndarray, tuple[float, float, float, float]]:
+    """
+    Computes which DTED posts around a sensor are visible from its antenna.
+
+    Uses an R2-style radial sweep: a ray is cast from the sensor post to
+    every post on the edge of the raster, each ray steps one post at a time
+    along its major axis, and a post is visible when the elevation angle to
+    the target antenna above it is at least the steepest terrain angle seen
+    earlier on the ray. Elevations are lowered by the 4/3-earth drop
+    d^2 / (2 * k * R) with k = weather_coeff. The raster is aligned to the
+    posts of the DTED cell under the sensor and may span several cells.
+
+    Args:
+        sensor_mgrs (str): Sensor location in MGRS.
+        sensor_height_m (float): Sensor antenna height above ground.
+        radius_m (float): Radius of the viewshed.
+        target_height_m (float): Height above ground at which a target is considered visible.
+        weather_coeff (float): Effective earth radius factor for atmospheric refraction.
+        resolution_m (float, optional): Coarsest acceptable ground resolution; wide viewsheds
+            can run on a downsampled pyramid level (see get_elevations).
+
+    Returns:
+        tuple: (visible, bounds) where visible is a north-up boolean raster of
+            posts (False outside the radius) and bounds is (south, west, north, east)
+            in degrees at the outer edges of the posts.
+
+    Raises:
+        FileNotFoundError: If the raster reaches a cell with no DTED file.
+    """
+    sensor_coord = convert_mgrs_to_coords(sensor_mgrs)
+    assert sensor_coord is not None, "Sensor MGRS must be a string."
+    assert radius_m > 0, "Radius must be positive."
+    assert weather_coeff > 0, "Weather coefficient must be positive."
+    tile = DTEDTileCache.get_tile(get_dted_file_for_resolution(*sensor_coord, resolution_m))
+    a, _, c, _, e, f = tile.transform
+    row, col = tile.index(np.array([sensor_coord[0]]), np.array([sensor_coord[1]]))
+    sensor_post_lat = f + e * (row[0] + 0.5)
+    sensor_post_lon = c + a * (col[0] + 0.5)
+
+    meters_per_degree = np.radians(1) * EARTH_RADIUS_M
+    lat_step_m = abs(e) * meters_per_degree
+    lon_step_m = abs(a) * meters_per_degree * np.cos(np.radians(sensor_post_lat))
+    half_rows = int(np.ceil(radius_m / lat_step_m))
+    half_cols = int(np.ceil(radius_m / lon_step_m))
+    row_offsets = np.arange(-half_rows, half_rows + 1)
+    col_offsets = np.arange(-half_cols, half_cols + 1)
+    lats = sensor_post_lat - abs(e) * row_offsets
+    lons = sensor_post_lon + abs(a) * col_offsets
+    grid_lons, grid_lats = np.meshgrid(lons, lats)
+    elevations = get_elevations(grid_lats, grid_lons, resolution_m=resolution_m).astype(np.float64)
+
+    distances_m = np.hypot(*np.meshgrid(col_offsets * lon_step_m, row_offsets * lat_step_m))
+    elevations -= distances_m ** 2 / (2 * weather_coeff * EARTH_RADIUS_M)
+    sensor_elevation = elevations[half_rows, half_cols] + sensor_height_m
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terrain_slopes = (elevations - sensor_elevation) / distances_m
+        target_slopes = (elevations + target_height_m - sensor_elevation) / distances_m
+    terrain_slopes[half_rows, half_cols] = -np.inf
+
+    # rays to every post on the raster edge, stepping one post along the major axis
+    edge_rows = np.concatenate([
+        np.full(2 * half_cols + 1, -half_rows), np.full(2 * half_cols + 1, half_rows),
+        row_offsets[1:-1], row_offsets[1:-1],
+    ])
+    edge_cols = np.concatenate([
+        col_offsets, col_offsets,
+        np.full(2 * half_rows - 1, -half_cols), np.full(2 * half_rows - 1, half_cols),
+    ])
+    ray_steps = np.maximum(np.abs(edge_rows), np.abs(edge_cols))
+    steps = np.arange(1, max(half_rows, half_cols) + 1)
+    hits = np.zeros(elevations.size, dtype=np.float64)
+    for start in range(0, edge_rows.size, VIEWSHED_CHUNK_RAYS):
+        chunk = slice(start, start + VIEWSHED_CHUNK_RAYS)
+        fractions = np.minimum(steps[None, :], ray_steps[chunk, None]) / ray_steps[chunk, None]
+        on_ray = steps[None, :] <= ray_steps[chunk, None]
+        ray_rows = half_rows + np.rint(edge_rows[chunk, None] * fractions).astype(np.intp)
+        ray_cols = half_cols + np.rint(edge_cols[chunk, None] * fractions).astype(np.intp)
+        ray_slopes = np.where(on_ray, terrain_slopes[ray_rows, ray_cols], -np.inf)
+        horizon = np.maximum.accumulate(ray_slopes, axis=1)
+        horizon = np.concatenate([np.full((horizon.shape[0], 1), -np.inf), horizon[:, :-1]], axis=1)
+        ray_visible = on_ray & (target_slopes[ray_rows, ray_cols] >= horizon)
+        # a post is visible if any ray crossing it sees it
+        hits += np.bincount((ray_rows * elevations.shape[1] + ray_cols)[ray_visible], minlength=elevations.size)
+
+    visible = (hits > 0).reshape(elevations.shape)
+    visible[half_rows, half_cols] = True
+    visible &= distances_m <= radius_m
+    bounds = (
+        float(lats[-1] - abs(e) / 2), float(lons[0] - abs(a) / 2),
+        float(lats[0] + abs(e) / 2), float(lons[-1] + abs(a) / 2),
+    )
+    return visible, bounds
+
+
+def get_elevation_profile_arrays(
+    start: list[float],
+    end: list[float],
+    interpoint_distance_m: float = None,
+    max_points: int = None,
+    method: str = "bilinear"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Samples elevations along the great-circle path between two points.
+
+    By default the path is sampled at the native post spacing of the finest
+    DTED cell it crosses, and may span any number of cells.
+
+    Args:
+        start (list[float]): Start coordinate [lat, lon].
+        end (list[float]): End coordinate [lat, lon].
+        interpoint_distance_m (float, optional): Sample spacing; defaults to native DTED post spacing.
+        max_points (int, optional): Upper bound on the number of samples.
+        method (str, optional): Elevation sampling method (default 'bilinear' for a smooth profile).
+
+    Returns:
+        tuple: (lats, lons, elevations, distances_km) arrays, start and end inclusive.
+
+    Raises:
+        FileNotFoundError: If the path crosses a cell with no DTED file.
+    """
+    total_distance_m = get_distance_between_coords(start, end, 'm')
+    if interpoint_distance_m is None:
+        # sample the path coarsely (~1 km) to find every cell it crosses
+        coarse_lats, coarse_lons = get_great_circle_points(start, end, np.linspace(0, 1, int(total_distance_m // 1000) + 2))
+        cells = set(zip(np.floor(coarse_lats).astype(int), np.floor(coarse_lons).astype(int)))
+        interpoint_distance_m = min(get_dted_post_spacing_m(cell_lat + 0.5, cell_lon + 0.5) for cell_lat, cell_lon in cells)
+    num_points = int(np.ceil(total_distance_m / interpoint_distance_m)) + 1
+    if max_points is not None:
+        num_points = min(num_points, max_points)
+    num_points = max(num_points, 2)
+    fractions = np.linspace(0, 1, num_points)
+    lats, lons = get_great_circle_points(start, end, fractions)
+    elevations = get_elevations(lats, lons, method)
+    distances_km = fractions * total_distance_m / 1000
+    return lats, lons, elevations, distances_km
+
+
 def get_elevation_profile(
     start: list[float],
     end: list[float],
-    interpoint_distance_m: int = 30
-) -> list[tuple[float, float, int, float]]:
-    """Returns a list of elevations along a line between two points."""
+    interpoint_distance_m: int = None,
+    method: str = "bilinear"
+) -> list[tuple[float, float, float, float]]:
+    """Returns a list of (lat, lon, elevation, distance_km) along the great-circle path between two points, at native DTED post spacing by default."""
     assert isinstance(start, list) and len(start) == 2
     assert isinstance(end, list) and len(end) == 2
-    assert isinstance(interpoint_distance_m, int) and interpoint_distance_m > 0
+    assert interpoint_distance_m is None or (isinstance(interpoint_distance_m, (int, float)) and interpoint_distance_m > 0)
 
     lat1, lon1 = start
     lat2, lon2 = end
@@ -77,33 +1289,138 @@ def get_elevation_profile(
     assert -90 <= lat1 <= 90 and -90 <= lat2 <= 90
     assert -180 <= lon1 <= 180 and -180 <= lon2 <= 180
 
-    max_points = 50
-    file_path1 = get_dted_file(lat1, lon1)
-    file_path2 = get_dted_file(lat2, lon2)
-
-    if not os.path.exists(file_path1):
-        raise FileNotFoundError(f"DTED file not found: {file_path1}")
-    if not os.path.exists(file_path2):
-        raise FileNotFoundError(f"DTED file not found: {file_path2}")
-
-    num_points = int(get_distance_between_coords(start, end, 'm') / interpoint_distance_m)
-    num_points = min(num_points, max_points)
-
     try:
-        lats = [lat1 + (lat2 - lat1) * i / num_points for i in range(num_points)]
-        lons = [lon1 + (lon2 - lon1) * i / num_points for i in range(num_points)]
-        elevation_data = []
-
-        for lat, lon in zip(lats, lons):
-            elevation = get_elevation([lat, lon])
-            distance_km = get_distance_between_coords(start, [lat, lon], 'km')
-            elevation_data.append((lat, lon, int(elevation), distance_km))
+        lats, lons, elevations, distances_km = get_elevation_profile_arrays(start, end, interpoint_distance_m, method=method)
+        elevation_data = [
+            (float(lat), float(lon), float(elevation), float(distance_km))
+            for lat, lon, elevation, distance_km in zip(lats, lons, elevations, distances_km)
+        ]
+    except FileNotFoundError:
+        raise
     except Exception as e:
         raise RuntimeError(f"Error reading elevation data: {e}")
 
     return elevation_data
 
 
+def get_lob_diffraction_profile(
+    sensor_coord: list[float],
+    bearing: float,
+    max_distance_m: float,
+    frequency_MHz: float,
+    sensor_height_m: float = 2.0,
+    target_height_m: float = 2.0,
+    weather_coeff: float = 4 / 3,
+    interpoint_distance_m: float = None,
+    max_points: int = LOB_DIFFRACTION_MAX_POINTS
+) -> dict:
+    """
+    Returns the Deygout knife-edge diffraction loss over the DTED profile for an
+    emitter at every range sample along a LOB (see ew.deygout_diffraction_loss).
+
+    Returns:
+        dict: "lats", "lons", "distances_m" and "diffraction_loss_dB" arrays, sensor first.
+
+    Raises:
+        FileNotFoundError: If the LOB crosses a cell with no DTED file.
+    """
+    from ew import deygout_diffraction_loss
+    # the end of the great circle the profile is sampled along
+    end_lat, end_lon = get_geodesic_destinations(*sensor_coord, bearing % 360, max_distance_m, 'sphere')
+    end_coord = [float(end_lat), float(end_lon)]
+    lats, lons, elevations, distances_km = get_elevation_profile_arrays(sensor_coord, end_coord, interpoint_distance_m, max_points)
+    distances_m = distances_km * 1000
+    return {
+        "lats": lats,
+        "lons": lons,
+        "distances_m": distances_m,
+        "diffraction_loss_dB": deygout_diffraction_loss(distances_m, elevations, sensor_height_m, target_height_m, frequency_MHz, weather_coeff),
+    }
+
+
+def get_lob_distance_band(
+    sensor_coord: list[float],
+    bearing: float,
+    frequency_MHz: float,
+    min_P_t_watts: float,
+    max_P_t_watts: float,
+    G_t: float,
+    G_r: float,
+    R_s: float,
+    sensor_height_m: float = 2.0,
+    target_height_m: float = 2.0,
+    path_loss_coeff: float = 2,
+    weather_coeff: float = 4 / 3,
+    power_tolerance_dB: float = 1.0,
+    max_distance_m: float = LOB_DIFFRACTION_MAX_RANGE_M,
+    interpoint_distance_m: float = None,
+    max_points: int = LOB_DIFFRACTION_MAX_POINTS
+) -> dict:
+    """
+    Solves for the distances along a LOB where a terrain-aware propagation
+    model predicts the measured received power.
+
+    Expected received power is the log-distance model of ew.py (free space by
+    default) less the Deygout knife-edge diffraction loss of the DTED profile,
+    evaluated for the minimum and maximum ERP at every range sample at once.
+    A range matches where the measured power, widened by power_tolerance_dB,
+    falls between the two predictions. The search stops at the free-space range
+    of the maximum ERP, since terrain only adds loss.
+
+    Args:
+        sensor_coord (list[float]): Sensor coordinate [lat, lon].
+        bearing (float): LOB bearing in degrees.
+        frequency_MHz (float): Emitter frequency.
+        min_P_t_watts (float): Minimum transmitter power in watts.
+        max_P_t_watts (float): Maximum transmitter power in watts.
+        G_t (float): Transmitter antenna gain in dBi.
+        G_r (float): Receiver antenna gain in dBi.
+        R_s (float): Measured received power in dBm.
+        sensor_height_m (float): Sensor antenna height above ground.
+        target_height_m (float): Transmitter antenna height above ground.
+        path_loss_coeff (float): Log-distance path loss exponent applied before diffraction.
+        weather_coeff (float): Effective earth radius factor for atmospheric refraction.
+        power_tolerance_dB (float): Measurement tolerance on R_s.
+        max_distance_m (float): Upper bound on the search range.
+        interpoint_distance_m (float, optional): Range sample spacing; defaults to native DTED post spacing.
+        max_points (int): Upper bound on the number of range samples.
+
+    Returns:
+        dict: "distances_m", "diffraction_loss_dB", "received_power_min_dBm",
+            "received_power_max_dBm" and "matches" arrays over the range samples,
+            plus "min_distance_m" and "max_distance_m" of the matching samples
+            (None if no range matches).
+
+    Raises:
+        FileNotFoundError: If the LOB crosses a cell with no DTED file.
+    """
+    from ew import theoretical_emission_distance, theoretical_received_power
+    assert 0 < min_P_t_watts <= max_P_t_watts, "Transmitter power range must be positive and ordered."
+    free_space_distance_m = theoretical_emission_distance(max_P_t_watts, frequency_MHz, G_t, G_r, R_s - power_tolerance_dB, 2) * 1000
+    search_distance_m = max(min(max_distance_m, free_space_distance_m), 10)
+    profile = get_lob_diffraction_profile(
+        sensor_coord, bearing, search_distance_m, frequency_MHz, sensor_height_m, target_height_m,
+        weather_coeff, interpoint_distance_m, max_points
+    )
+    distances_km = profile["distances_m"] / 1000
+    loss_dB = profile["diffraction_loss_dB"]
+    received_power_min_dBm = theoretical_received_power(min_P_t_watts, frequency_MHz, G_t, G_r, distances_km, path_loss_coeff) - loss_dB
+    received_power_max_dBm = theoretical_received_power(max_P_t_watts, frequency_MHz, G_t, G_r, distances_km, path_loss_coeff) - loss_dB
+    matches = (received_power_min_dBm <= R_s + power_tolerance_dB) & (received_power_max_dBm >= R_s - power_tolerance_dB)
+    # the sensor sample itself is never a candidate emitter location
+    matches[0] = False
+    matching_distances_m = profile["distances_m"][matches]
+    return {
+        "distances_m": profile["distances_m"],
+        "diffraction_loss_dB": loss_dB,
+        "received_power_min_dBm": received_power_min_dBm,
+        "received_power_max_dBm": received_power_max_dBm,
+        "matches": matches,
+        "min_distance_m": float(matching_distances_m.min()) if matching_distances_m.size else None,
+        "max_distance_m": float(matching_distances_m.max()) if matching_distances_m.size else None,
+    }
+
+
 def get_elevation_plot_filename(target_class: str = "LOB") -> str:
     date_str = datetime.now().strftime('%Y-%m-%d')
     logs_dir = os.path.abspath(
@@ -124,13 +1441,18 @@ def get_elevation_plot_filename(target_class: str = "LOB") -> str:
 
 
 def plot_elevation_profile(
-    elevation_data: list[tuple[float, float, int, float]],
+    elevation_data: list[tuple[float, float, float, float]],
     sensor_coord: list[float],
     nearside_target_distance_km: float,
     target_coord: list[float],
-    farside_target_distance_km: float
+    farside_target_distance_km: float,
+    frequency_MHz: float = None,
+    sensor_height_m: float = 2.0,
+    target_height_m: float = 2.0,
+    weather_coeff: float = 4 / 3,
+    fresnel_zone_fraction: float = FRESNEL_CLEARANCE_FRACTION
 ) -> None:
-    """Plots the elevation profile with visual enhancements."""
+    """Plots the elevation profile with visual enhancements; with a frequency, the first Fresnel zone to the target and the terrain inside its fresnel_zone_fraction clearance are drawn too."""
     import matplotlib.pyplot as plt
     import numpy as np
     from utilities import generate_DTG
@@ -153,7 +1475,7 @@ def plot_elevation_profile(
 
     ax.plot(distances[0], elevations[0], 'bo', label="Sensor Position")
 
-    target_elevation = get_elevation(target_coord)
+    target_elevation = get_elevations(np.array([target_coord[0]]), np.array([target_coord[1]]), method="bilinear")[0]
     formatted_mgrs = format_readable_mgrs(convert_coords_to_mgrs(target_coord))
     ax.plot(target_distance, target_elevation, 'ro', label="Est. Target Location")
 
@@ -169,6 +1491,35 @@ def plot_elevation_profile(
 
     y_min = max(0, min(elevations) - 100)
     y_max = max(elevations) + 100
+
+    if frequency_MHz is not None and target_distance > 0:
+        fresnel = get_fresnel_clearance(
+            sensor_coord, np.array([target_coord[0]]), np.array([target_coord[1]]), frequency_MHz,
+            sensor_height_m, target_height_m, weather_coeff, fresnel_zone_fraction=fresnel_zone_fraction
+        )
+        clearance_percent = fresnel["clearance_percent"][0]
+        # the sight line is drawn over flat terrain, so bend it down by the earth bulge instead
+        path_distances_m = distances[distances <= target_distance] * 1000
+        target_distance_m = target_distance * 1000
+        sensor_antenna_m = elevations[0] + sensor_height_m
+        target_antenna_m = target_elevation + target_height_m
+        sight_line = (
+            sensor_antenna_m + (target_antenna_m - sensor_antenna_m) * path_distances_m / target_distance_m
+            - path_distances_m * (target_distance_m - path_distances_m) / (2 * weather_coeff * EARTH_RADIUS_M)
+        )
+        radius_m = get_fresnel_zone_radius(path_distances_m, target_distance_m, frequency_MHz)
+        path_km = path_distances_m / 1000
+        ax.plot(path_km, sight_line, color="navy", linestyle="--", linewidth=1, label="Line of Sight")
+        ax.fill_between(
+            path_km, sight_line - radius_m, sight_line + radius_m, color="gold", alpha=0.35,
+            label=f"1st Fresnel Zone ({frequency_MHz:,.1f} MHz, {clearance_percent:,.0f}% clear)"
+        )
+        intrudes = elevations[:path_km.size] > sight_line - fresnel_zone_fraction * radius_m
+        intrudes[[0, -1]] = False
+        if intrudes.any():
+            ax.plot(path_km[intrudes], elevations[:path_km.size][intrudes], "x", color="darkred", markersize=4,
+                    label=f"Fresnel Zone Obstruction (< {fresnel_zone_fraction * 100:,.0f}% clear)")
+        y_max = max(y_max, float(np.max(sight_line + radius_m)) + 50)
     ax.set_ylim(y_min, y_max)
     ax.set_xlim(min(distances), max(distances))
 
@@ -197,3 +1548,34 @@ def plot_elevation_profile(
     plt.savefig(save_path)
     plt.show()
     plt.close()
+
+
+def get_viewshed_overlay_filename(sensor_mgrs: str) -> str:
+    date_str = datetime.now().strftime('%Y-%m-%d')
+    logs_dir = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), '..', 'logs', 'viewsheds', date_str)
+    )
+    os.makedirs(logs_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Hh%Mm%Ss')
+    return os.path.join(logs_dir, f"viewshed_{sensor_mgrs.replace(' ', '')}_{date_str}_{timestamp}.png")
+
+
+def save_viewshed_overlay(
+    visible: np.ndarray,
+    bounds: tuple[float, float, float, float],
+    file_path: str,
+    color: tuple[int, int, int] = (0, 200, 0),
+    opacity: float = 0.45
+) -> str:
+    """
+    Writes a viewshed raster as a north-up RGBA PNG (visible posts tinted, the rest transparent)
+    with a world file (.pgw) placing it at the bounds (south, west, north, east) from get_viewshed.
+    Returns the PNG path.
+    """
+    import matplotlib.pyplot as plt
+    from utilities import write_world_file
+    overlay = np.zeros(visible.shape + (4,), dtype=np.uint8)
+    overlay[visible] = (*color, int(round(opacity * 255)))
+    plt.imsave(file_path, overlay)
+    write_world_file(file_path, bounds, visible.shape)
+    return file_path
@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 
 def convert_watts_to_dBm(p_watts: float) -> float:
     """
@@ -176,3 +178,266 @@ def get_emission_distance(P_t_watts: float,
     if pure_pathLoss:
         return path_loss
     return min(path_loss, earth_curve_with_ducting)
+
+
+def convert_watts_to_dBm_array(p_watts) -> np.ndarray:
+    """
+    Converts watts to dBm element-wise (array counterpart of convert_watts_to_dBm).
+
+    Parameters
+    ----------
+    p_watts : array_like
+        Power(s) in watts (W).
+
+    Returns
+    -------
+    np.ndarray
+        Power(s) in dBm.
+    """
+    p_watts = np.asarray(p_watts, dtype=np.float64)
+    assert np.all(p_watts >= 0), 'Wattage needs to be greater than zero.'
+    with np.errstate(divide='ignore'):
+        return 10 * np.log10(1000 * p_watts)
+
+
+def theoretical_emission_distance_array(P_t_watts,
+                                        f_MHz,
+                                        G_t,
+                                        G_r,
+                                        R_s,
+                                        path_loss_coeff=3) -> np.ndarray:
+    """
+    Returns theoretical maximum distance of emission for broadcast arrays of
+    every parameter (array counterpart of theoretical_emission_distance).
+
+    Parameters
+    ----------
+    P_t_watts, f_MHz, G_t, G_r, R_s, path_loss_coeff : array_like
+        As for theoretical_emission_distance; shapes must broadcast together.
+
+    Returns
+    -------
+    np.ndarray
+        Theoretical maximum distance(s) in km.
+    """
+    path_loss_coeff = np.asarray(path_loss_coeff, dtype=np.float64)
+    return 10 ** (
+        (convert_watts_to_dBm_array(P_t_watts) + G_t - 32.4 -
+         (10 * path_loss_coeff * np.log10(f_MHz)) +
+         G_r - np.asarray(R_s, dtype=np.float64)) / (10 * path_loss_coeff)
+    )
+
+
+def emission_optical_maximum_distance_with_ducting_array(t_h,
+                                                         r_h,
+                                                         f_MHz,
+                                                         temp_f,
+                                                         weather_coeff=4 / 3) -> np.ndarray:
+    """
+    Returns theoretical maximum line-of-sight with ducting consideration for
+    broadcast arrays of every parameter (array counterpart of
+    emission_optical_maximum_distance_with_ducting).
+
+    Parameters
+    ----------
+    t_h, r_h, f_MHz, temp_f, weather_coeff : array_like
+        As for emission_optical_maximum_distance_with_ducting; shapes must broadcast together.
+
+    Returns
+    -------
+    np.ndarray
+        Maximum line-of-sight(s) with ducting in km.
+    """
+    t_h, r_h, f_MHz, temp_f, weather_coeff = (
+        np.asarray(x, dtype=np.float64) for x in (t_h, r_h, f_MHz, temp_f, weather_coeff)
+    )
+    return (
+        np.sqrt(2 * weather_coeff * 6371000 * r_h + temp_f ** 2) / 1000 +
+        np.sqrt(2 * weather_coeff * 6371000 * t_h + f_MHz ** 2) / 1000
+    )
+
+
+def get_emission_distance_array(P_t_watts,
+                                f_MHz,
+                                G_t,
+                                G_r,
+                                R_s,
+                                t_h,
+                                r_h,
+                                temp_f,
+                                path_loss_coeff=3,
+                                weather_coeff=4 / 3,
+                                pure_pathLoss: bool = False) -> np.ndarray:
+    """
+    Returns theoretical maximum transceiver distance with all considerations
+    for broadcast arrays of every parameter (array counterpart of
+    get_emission_distance).
+
+    Parameters
+    ----------
+    P_t_watts, f_MHz, G_t, G_r, R_s, t_h, r_h, temp_f, path_loss_coeff, weather_coeff : array_like
+        As for get_emission_distance; shapes must broadcast together.
+    pure_pathLoss : bool, optional
+        If True, returns only path loss limited distances.
+
+    Returns
+    -------
+    np.ndarray
+        Maximum distance(s) in km, with the broadcast shape of the parameters.
+    """
+    path_loss = theoretical_emission_distance_array(
+        P_t_watts, f_MHz, G_t, G_r, R_s, path_loss_coeff
+    )
+    if pure_pathLoss:
+        return path_loss
+    earth_curve_with_ducting = emission_optical_maximum_distance_with_ducting_array(
+        t_h, r_h, f_MHz, temp_f, weather_coeff
+    )
+    return np.minimum(path_loss, earth_curve_with_ducting)
+
+
+def theoretical_received_power(P_t_watts: float,
+                               f_MHz: float,
+                               G_t: float,
+                               G_r: float,
+                               distance_km,
+                               path_loss_coeff=2):
+    """
+    Returns the received power predicted by the log-distance model of
+    theoretical_emission_distance (the inverse of that function).
+
+    Parameters
+    ----------
+    P_t_watts : float or np.ndarray
+        Power output of transmitter in watts (W).
+    f_MHz : float or np.ndarray
+        Operating frequency in MHz.
+    G_t : float or np.ndarray
+        Transmitter antenna gain in dBi.
+    G_r : float or np.ndarray
+        Receiver antenna gain in dBi.
+    distance_km : float or np.ndarray
+        Distance(s) between transmitter and receiver in km.
+    path_loss_coeff : float or np.ndarray, optional
+        Path loss exponent (default is 2, free space); shapes must broadcast together.
+
+    Returns
+    -------
+    float or np.ndarray
+        Received power in dBm.
+    """
+    distance_km = np.maximum(np.asarray(distance_km, dtype=np.float64), 1e-6)
+    return (
+        convert_watts_to_dBm_array(P_t_watts) + G_t + G_r - 32.4 -
+        10 * np.asarray(path_loss_coeff, dtype=np.float64) * (np.log10(f_MHz) + np.log10(distance_km))
+    )
+
+
+def knife_edge_diffraction_loss(v):
+    """
+    Returns the single knife-edge diffraction loss (ITU-R P.526 approximation).
+
+    Parameters
+    ----------
+    v : float or np.ndarray
+        Fresnel-Kirchhoff diffraction parameter(s).
+
+    Returns
+    -------
+    np.ndarray
+        Diffraction loss in dB; zero where v <= -0.78.
+    """
+    v = np.asarray(v, dtype=np.float64)
+    clipped = np.maximum(v, -0.78)
+    return np.where(
+        v > -0.78,
+        6.9 + 20 * np.log10(np.sqrt((clipped - 0.1) ** 2 + 1) + clipped - 0.1),
+        0.0
+    )
+
+
+def _knife_edge_parameters(distances_m: np.ndarray,
+                           elevations_m: np.ndarray,
+                           start: np.ndarray,
+                           end: np.ndarray,
+                           start_height_m: np.ndarray,
+                           end_height_m: np.ndarray,
+                           wavelength_m: float,
+                           effective_radius_m: float) -> np.ndarray:
+    """
+    Returns the diffraction parameter of every profile sample for a batch of
+    sub-paths (one row per sub-path, -inf outside the sub-path interior).
+    """
+    d1 = distances_m[None, :] - distances_m[start][:, None]
+    d2 = distances_m[end][:, None] - distances_m[None, :]
+    length = d1 + d2
+    interior = (d1 > 0) & (d2 > 0)
+    safe_d1 = np.where(interior, d1, 1.0)
+    safe_d2 = np.where(interior, d2, 1.0)
+    sight_line = start_height_m[:, None] + (end_height_m - start_height_m)[:, None] * safe_d1 / (safe_d1 + safe_d2)
+    height = elevations_m[None, :] + safe_d1 * safe_d2 / (2 * effective_radius_m) - sight_line
+    v = height * np.sqrt(2 * length / (wavelength_m * safe_d1 * safe_d2))
+    return np.where(interior, v, -np.inf)
+
+
+def deygout_diffraction_loss(distances_m,
+                             elevations_m,
+                             r_h: float,
+                             t_h: float,
+                             f_MHz: float,
+                             weather_coeff=4 / 3) -> np.ndarray:
+    """
+    Returns the Deygout multiple knife-edge diffraction loss over a terrain
+    profile, for a receiver at the first sample and a transmitter at every
+    other sample, all at once.
+
+    The main edge is the sample with the largest diffraction parameter; the
+    strongest edges either side of it are added when the main edge obstructs
+    the path (three-edge Deygout). Earth bulge uses the effective earth
+    radius factor weather_coeff.
+
+    Parameters
+    ----------
+    distances_m : np.ndarray
+        Increasing distances of the profile samples from the receiver in meters (m).
+    elevations_m : np.ndarray
+        Terrain elevations of the profile samples in meters (m).
+    r_h : float
+        Receiver height above ground in meters (m).
+    t_h : float
+        Transmitter height above ground in meters (m).
+    f_MHz : float
+        Operating frequency in MHz.
+    weather_coeff : float, optional
+        Effective earth radius factor (default is 4/3).
+
+    Returns
+    -------
+    np.ndarray
+        Diffraction loss in dB for a transmitter at each profile sample (zero at the receiver).
+    """
+    distances_m = np.asarray(distances_m, dtype=np.float64)
+    elevations_m = np.asarray(elevations_m, dtype=np.float64)
+    assert distances_m.ndim == 1 and distances_m.shape == elevations_m.shape, \
+        'Distances and elevations must be 1-D arrays of the same length.'
+    assert f_MHz > 0 and weather_coeff > 0, 'Frequency and weather coefficient must be positive.'
+    wavelength_m = 299.792458 / f_MHz
+    effective_radius_m = weather_coeff * 6371000
+    num_samples = distances_m.size
+    ends = np.arange(num_samples)
+    starts = np.zeros(num_samples, dtype=int)
+    receiver_m = np.full(num_samples, elevations_m[0] + r_h)
+    transmitter_m = elevations_m + t_h
+
+    # main edge of every path
+    v = _knife_edge_parameters(distances_m, elevations_m, starts, ends, receiver_m, transmitter_m, wavelength_m, effective_radius_m)
+    main = np.argmax(v, axis=1)
+    main_v = v[ends, main]
+    loss = knife_edge_diffraction_loss(main_v)
+    obstructed = loss > 0
+    # strongest edges between the receiver and the main edge, and the main edge and the transmitter
+    edge_m = elevations_m[main]
+    for sub_start, sub_end, start_m, end_m in [(starts, main, receiver_m, edge_m), (main, ends, edge_m, transmitter_m)]:
+        sub_v = _knife_edge_parameters(distances_m, elevations_m, sub_start, sub_end, start_m, end_m, wavelength_m, effective_radius_m)
+        loss = loss + np.where(obstructed, knife_edge_diffraction_loss(np.max(sub_v, axis=1)), 0.0)
+    return loss
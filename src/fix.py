@@ -0,0 +1,178 @@
+import numpy as np
+
+from coords import convert_coords_to_enu, convert_enu_to_coords
+from map import SQUARE_METERS_PER_ACRE
+
+# probability held by the returned error ellipse
+FIX_CONFIDENCE_LEVEL = 0.95
+# reweighting passes of the Stansfield solver
+FIX_MAX_ITERATIONS = 20
+# the solver stops once the fix moves less than this between passes
+FIX_TOLERANCE_M = 0.01
+# vertices of the returned error ellipse outline
+FIX_ELLIPSE_POINTS = 72
+
+
+def _get_plane_azimuths(origin: list[float], lats: np.ndarray, lons: np.ndarray, bearings: np.ndarray) -> np.ndarray:
+    """Returns the azimuths (radians) in the tangent plane at the origin of bearings taken from north at each sensor."""
+    lats, lons, bearings = np.radians(lats), np.radians(lons), np.radians(bearings)
+    lat0, lon0 = np.radians(origin[0]), np.radians(origin[1])
+    # bearing direction at each sensor as an earth-centered vector
+    east_x, east_y = -np.sin(lons), np.cos(lons)
+    north_x, north_y, north_z = -np.sin(lats) * np.cos(lons), -np.sin(lats) * np.sin(lons), np.cos(lats)
+    x = np.sin(bearings) * east_x + np.cos(bearings) * north_x
+    y = np.sin(bearings) * east_y + np.cos(bearings) * north_y
+    z = np.cos(bearings) * north_z
+    # rotated into the east and north axes of the origin, removing the meridian convergence
+    east = -np.sin(lon0) * x + np.cos(lon0) * y
+    north = -np.sin(lat0) * np.cos(lon0) * x - np.sin(lat0) * np.sin(lon0) * y + np.cos(lat0) * z
+    return np.arctan2(east, north)
+
+
+def get_stansfield_fix_from_arrays(
+    lats,
+    lons,
+    bearings,
+    bearing_errors,
+    power_received_dBm=None,
+    receiver_gains_dBi=0,
+    frequency_MHz: float = None,
+    min_P_t_watts: float = None,
+    max_P_t_watts: float = None,
+    G_t: float = 0,
+    path_loss_coeff: float = 4,
+    confidence: float = FIX_CONFIDENCE_LEVEL,
+    max_iterations: int = FIX_MAX_ITERATIONS,
+    tolerance_m: float = FIX_TOLERANCE_M,
+    ellipse_points: int = FIX_ELLIPSE_POINTS
+) -> dict:
+    """
+    Returns the weighted least-squares (Stansfield) fix of any number of LOBs.
+
+    Every LOB is projected once into the WGS84 local tangent plane at the mean
+    sensor position, where the fix minimises the sum of squared perpendicular
+    miss distances weighted by 1 / (bearing sigma * range)^2. The ranges come
+    from the previous estimate, so the solve is repeated until the fix stops
+    moving. The first pass takes its ranges from the received power and the
+    ew.py log-distance model (geometric mean of the minimum and maximum ERP
+    ranges) when the frequency, ERP bounds and powers are given, and treats
+    every range as equal otherwise. As in the rest of the app, the sensor
+    error is the +/- wedge that holds about 95% of the bearings (sigma = error / 2).
+
+    Args:
+        lats, lons (array-like): Sensor coordinates.
+        bearings (array-like): LOB azimuths in degrees.
+        bearing_errors (array-like): Sensor errors in degrees.
+        power_received_dBm (array-like): Received powers, used only for the first-pass ranges.
+        receiver_gains_dBi (array-like): Sensor antenna gains.
+        frequency_MHz (float): Emitter frequency.
+        min_P_t_watts, max_P_t_watts (float): ERP bounds in watts.
+        G_t (float): Transmitter antenna gain in dBi.
+        path_loss_coeff (float): Path-loss coefficient.
+        confidence (float): Probability held by the error ellipse.
+        max_iterations (int): Most reweighting passes.
+        tolerance_m (float): Convergence threshold in meters.
+        ellipse_points (int): Vertices of the ellipse outline.
+
+    Returns:
+        dict: "coord" [lat, lon], "covariance_m2" (east/north, 2x2), "semi_major_m",
+            "semi_minor_m", "orientation_deg" (azimuth of the major axis), "confidence",
+            "ellipse_acres", "ellipse_coords" ([lat, lon] outline), "ranges_m",
+            "residuals_deg" (LOB bearing minus bearing to the fix), "chi_square",
+            "iterations", "converged" and "consistent" (False when the fix lies behind
+            any sensor). None when the LOBs are parallel and have no unique fix.
+    """
+    lats = np.asarray(lats, dtype=np.float64).ravel()
+    lons = np.asarray(lons, dtype=np.float64).ravel()
+    bearings = np.broadcast_to(np.asarray(bearings, dtype=np.float64), lats.shape)
+    bearing_errors = np.broadcast_to(np.asarray(bearing_errors, dtype=np.float64), lats.shape)
+    assert lats.size >= 2, "At least two LOBs are required for a fix."
+    assert lons.size == lats.size, "Sensor latitudes and longitudes must have the same length."
+    assert 0 < confidence < 1, "Confidence must be between 0 and 1."
+    origin = [float(lats.mean()), float(lons.mean())]
+    east, north, _ = convert_coords_to_enu(origin, lats, lons)
+    sensors = np.column_stack([east, north])
+    azimuths = _get_plane_azimuths(origin, lats, lons, bearings)
+    directions = np.column_stack([np.sin(azimuths), np.cos(azimuths)])
+    # unit normals of the LOBs; a point's miss distance is normal . (point - sensor)
+    normals = np.column_stack([np.cos(azimuths), -np.sin(azimuths)])
+    projectors = normals[:, :, None] * normals[:, None, :]
+    projected_sensors = np.einsum("nij,nj->ni", projectors, sensors)
+    sigmas = np.radians(np.maximum(bearing_errors, 0.1) / 2)
+
+    ranges_m = np.ones(lats.size)
+    if power_received_dBm is not None and frequency_MHz is not None and min_P_t_watts is not None and max_P_t_watts is not None:
+        from ew import get_emission_distance_array
+        erp_watts = np.array([[min_P_t_watts], [max_P_t_watts]])
+        erp_ranges_km = get_emission_distance_array(
+            erp_watts, frequency_MHz, G_t, np.asarray(receiver_gains_dBi, dtype=np.float64),
+            np.asarray(power_received_dBm, dtype=np.float64), 0, 0, 0, path_loss_coeff, pure_pathLoss=True
+        )
+        ranges_m = np.broadcast_to(np.sqrt(erp_ranges_km[0] * erp_ranges_km[1]) * 1000, lats.shape)
+
+    fix = None
+    converged = False
+    for iteration in range(1, max_iterations + 1):
+        weights = 1 / (sigmas * np.maximum(ranges_m, 1.0)) ** 2
+        information = np.einsum("n,nij->ij", weights, projectors)
+        if np.linalg.cond(information) > 1e12:
+            return None
+        new_fix = np.linalg.solve(information, weights @ projected_sensors)
+        ranges_m = np.hypot(*(new_fix - sensors).T)
+        moved_m = np.inf if fix is None else float(np.hypot(*(new_fix - fix)))
+        fix = new_fix
+        if moved_m < tolerance_m:
+            converged = True
+            break
+
+    offsets = fix - sensors
+    weights = 1 / (sigmas * np.maximum(ranges_m, 1.0)) ** 2
+    covariance = np.linalg.inv(np.einsum("n,nij->ij", weights, projectors))
+    residuals_deg = np.degrees((azimuths - np.arctan2(offsets[:, 0], offsets[:, 1]) + np.pi) % (2 * np.pi) - np.pi)
+    # chi-square quantile of two degrees of freedom
+    scale = np.sqrt(-2 * np.log(1 - confidence))
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+    semi_minor_m, semi_major_m = scale * np.sqrt(np.maximum(eigenvalues, 0))
+    major_east, major_north = eigenvectors[:, 1]
+    angles = np.linspace(0, 2 * np.pi, ellipse_points, endpoint=False)
+    outline = fix[:, None] + eigenvectors @ np.vstack([semi_minor_m * np.cos(angles), semi_major_m * np.sin(angles)])
+    fix_lat, fix_lon = convert_enu_to_coords(origin, fix[0], fix[1])
+    ellipse_lats, ellipse_lons = convert_enu_to_coords(origin, outline[0], outline[1])
+    return {
+        "coord": [float(fix_lat), float(fix_lon)],
+        "covariance_m2": covariance,
+        "semi_major_m": float(semi_major_m),
+        "semi_minor_m": float(semi_minor_m),
+        "orientation_deg": float(np.degrees(np.arctan2(major_east, major_north)) % 180),
+        "confidence": confidence,
+        "ellipse_acres": float(np.pi * semi_major_m * semi_minor_m / SQUARE_METERS_PER_ACRE),
+        "ellipse_coords": np.column_stack([ellipse_lats, ellipse_lons]).tolist(),
+        "ranges_m": ranges_m,
+        "residuals_deg": residuals_deg,
+        "chi_square": float(np.sum((np.radians(residuals_deg) / sigmas) ** 2)),
+        "iterations": iteration,
+        "converged": converged,
+        "consistent": bool(np.all(np.einsum("ni,ni->n", offsets, directions) > 0)),
+    }
+
+
+def get_stansfield_fix(reports: list[dict], **kwargs) -> dict:
+    """
+    Returns the weighted least-squares (Stansfield) fix of a list of LOB reports.
+
+    Each report is a dict with "coord" [lat, lon], "bearing" and "bearing_error"
+    (sensor error in degrees), and optionally "power_received_dBm" and
+    "receiver_gain_dBi" (the same keys as the probability.py sensors). Keyword
+    arguments are passed to get_stansfield_fix_from_arrays.
+    """
+    assert len(reports) >= 2, "At least two LOBs are required for a fix."
+    coords = np.array([report["coord"] for report in reports], dtype=np.float64)
+    powers = [report.get("power_received_dBm") for report in reports]
+    return get_stansfield_fix_from_arrays(
+        coords[:, 0], coords[:, 1],
+        [report["bearing"] for report in reports],
+        [report["bearing_error"] for report in reports],
+        power_received_dBm=None if None in powers else powers,
+        receiver_gains_dBi=[report.get("receiver_gain_dBi", 0) for report in reports],
+        **kwargs
+    )
@@ -37,6 +37,8 @@ class App(customtkinter.CTk):
     MAP_POSITIION = (conf["DEFAULT_INITIAL_LATITUDE"], conf["DEFAULT_INITIAL_LONGITUDE"])
     # preset maximum map zoom level
     MAX_ZOOM = conf["MAX_ZOOM"]
+    # preset interval between background DTED prefetch passes (ms)
+    DTED_PREFETCH_INTERVAL_MS = 5000
     # preset default values
     DEFAULT_VALUES = {
         "Sensor 1 MGRS": conf["DEFAULT_SENSOR_1_MGRS"],
@@ -169,6 +171,8 @@ class App(customtkinter.CTk):
         self.cut_list = []
         # define initial FIX list
         self.fix_list = []
+        # define initial probability region list
+        self.probability_list = []
         # define initial EW marker list
         self.ewt_marker_list = []
         # define initial target marker list
@@ -192,6 +196,12 @@ class App(customtkinter.CTk):
         # define default target emitter
         self.bypass_input_errors = False
         self.bypass_elevation_plot_prompt =  False
+        # define default LOB terrain mask
+        self.terrain_mask = 'Off'
+        # define default LOB propagation model
+        self.propagation_model = 'Log-Distance'
+        # define default target probability surface
+        self.probability_surface = 'Off'
 
         # ============ create two CTkFrames ============
 
@@ -676,13 +686,108 @@ class App(customtkinter.CTk):
             columnspan=1, 
             padx=(0,0), 
             pady=(0,0))
+        # define terrain mask label attributes
+        self.label_terrain_mask = customtkinter.CTkLabel(
+            master=self.frame_left, 
+            text="LOB Terrain Mask:", 
+            text_color='white')
+        # assign terrain mask label grid position
+        self.label_terrain_mask.grid(
+            row=self.option_path_loss_coeff.grid_info()["row"]+1,
+            rowspan=1,
+            column=0,
+            columnspan=1, 
+            padx=(0,5), 
+            pady=(0,0),
+            sticky='w')
+        # define terrain mask option attributes
+        self.terrain_mask_values = ["Off",
+                                    "Line of Sight",
+                                    "Fresnel Zone"]
+        self.option_terrain_mask = customtkinter.CTkOptionMenu(
+            master=self.frame_left, 
+            values=self.terrain_mask_values,
+            fg_color='green',
+            button_color='green',
+            command=self.change_terrain_mask)
+        # assign terrain mask option grid position
+        self.option_terrain_mask.grid(
+            row=self.option_path_loss_coeff.grid_info()["row"]+1,
+            rowspan=1, 
+            column=1, 
+            columnspan=1, 
+            padx=(0,0), 
+            pady=(0,0))
+        # define propagation model label attributes
+        self.label_propagation_model = customtkinter.CTkLabel(
+            master=self.frame_left, 
+            text="Propagation Model:", 
+            text_color='white')
+        # assign propagation model label grid position
+        self.label_propagation_model.grid(
+            row=self.option_terrain_mask.grid_info()["row"]+1,
+            rowspan=1,
+            column=0,
+            columnspan=1, 
+            padx=(0,5), 
+            pady=(0,0),
+            sticky='w')
+        # define propagation model option attributes
+        self.propagation_model_values = ["Log-Distance",
+                                         "Knife-Edge Terrain"]
+        self.option_propagation_model = customtkinter.CTkOptionMenu(
+            master=self.frame_left, 
+            values=self.propagation_model_values,
+            fg_color='green',
+            button_color='green',
+            command=self.change_propagation_model)
+        # assign propagation model option grid position
+        self.option_propagation_model.grid(
+            row=self.option_terrain_mask.grid_info()["row"]+1,
+            rowspan=1, 
+            column=1, 
+            columnspan=1, 
+            padx=(0,0), 
+            pady=(0,0))
+        # define probability surface label attributes
+        self.label_probability_surface = customtkinter.CTkLabel(
+            master=self.frame_left, 
+            text="Probability Surface:", 
+            text_color='white')
+        # assign probability surface label grid position
+        self.label_probability_surface.grid(
+            row=self.option_propagation_model.grid_info()["row"]+1,
+            rowspan=1,
+            column=0,
+            columnspan=1, 
+            padx=(0,5), 
+            pady=(0,0),
+            sticky='w')
+        # define probability surface option attributes
+        self.probability_surface_values = ["Off",
+                                           "Monte Carlo",
+                                           "Bayesian Grid"]
+        self.option_probability_surface = customtkinter.CTkOptionMenu(
+            master=self.frame_left, 
+            values=self.probability_surface_values,
+            fg_color='green',
+            button_color='green',
+            command=self.change_probability_surface)
+        # assign probability surface option grid position
+        self.option_probability_surface.grid(
+            row=self.option_propagation_model.grid_info()["row"]+1,
+            rowspan=1, 
+            column=1, 
+            columnspan=1, 
+            padx=(0,0), 
+            pady=(0,0))
         # define buffer column attributes
         self.buffer = customtkinter.CTkLabel(
             master=self.frame_left,
             text='')
         # assign buffer column grid position
         self.buffer.grid(
-            row=self.option_path_loss_coeff.grid_info()["row"]+1,
+            row=self.option_probability_surface.grid_info()["row"]+1,
             column=1,
             columnspan=2, 
             padx=(0,0), 
@@ -1028,6 +1133,9 @@ class App(customtkinter.CTk):
         self.map_option_menu.set(self.map_dropdown_values[0])
         # set default path-loss coefficient
         self.option_path_loss_coeff.set(self.path_loss_coeff_values[len(self.path_loss_coeff_values)//2])
+        self.option_terrain_mask.set(self.terrain_mask_values[0])
+        self.option_propagation_model.set(self.propagation_model_values[0])
+        self.option_probability_surface.set(self.probability_surface_values[0])
         # set default sensor
         self.option_sensor.set('BEAST+')
         # define right-click attributes
@@ -1058,36 +1166,39 @@ class App(customtkinter.CTk):
             label="Increase Brightness (20%)",
             command=self.increment_brightness_up)
         self.plot_current_markers()
+        # warm the DTED tile cache around the map and EWTs in the background
+        self.after(1000, self._prefetch_dted)
 
     def plot_current_markers(self) -> None:
         from tkinter import END
-        from coords import convert_coords_to_mgrs, format_readable_mgrs
+        from coords import convert_coords_to_mgrs, convert_coords_to_mgrs_batch, format_readable_mgrs
         from utilities import read_csv
         filepath_POI_markers = os.path.join(self.log_directory, App.DEFAULT_VALUES["POI Marker Filename"])
         initial_coord = []
         try:
             marker_data_list = read_csv(filepath_POI_markers)
             marker_data_list = sorted(marker_data_list,key=lambda x: int(x["MARKER_NUM"]))
-            for marker_data in marker_data_list:
-                marker_coord = marker_data['LOC_LATLON']
-                marker_coord = [float(x) for x in marker_coord.split(', ')]
+            marker_coords = [[float(x) for x in marker_data['LOC_LATLON'].split(', ')] for marker_data in marker_data_list]
+            # convert every marker in one batch; the markers' own conversions then hit the cache
+            marker_mgrs_list = convert_coords_to_mgrs_batch([c[0] for c in marker_coords], [c[1] for c in marker_coords])
+            for marker_data, marker_coord, marker_mgrs in zip(marker_data_list, marker_coords, marker_mgrs_list):
                 self.add_marker_event(marker_coord,True,True)
-                self.logger_gui.info(f"Loaded POI Marker No. {marker_data['MARKER_NUM']} at {format_readable_mgrs(convert_coords_to_mgrs(marker_coord))}")
+                self.logger_gui.info(f"Loaded POI Marker No. {marker_data['MARKER_NUM']} at {format_readable_mgrs(marker_mgrs)}")
                 initial_coord = marker_coord
         except FileNotFoundError:
             pass
         tactical_marker_filepath = os.path.join(self.log_directory, App.DEFAULT_VALUES["Tactical Graphic Marker Filename"])
         try:
             marker_data_list = read_csv(tactical_marker_filepath)
-            for marker_data in marker_data_list:
-                marker_coord = marker_data['LOC_LATLON']
-                marker_coord = [float(x) for x in marker_coord.split(', ')]
+            marker_coords = [[float(x) for x in marker_data['LOC_LATLON'].split(', ')] for marker_data in marker_data_list]
+            marker_mgrs_list = convert_coords_to_mgrs_batch([c[0] for c in marker_coords], [c[1] for c in marker_coords])
+            for marker_data, marker_coord, marker_mgrs in zip(marker_data_list, marker_coords, marker_mgrs_list):
                 if marker_data['MARKER_TYPE'] == 'OBJ':
                     self.plot_OBJ(marker_coord,True)
-                    self.logger_gui.info(f"Loaded OBJ Marker at {format_readable_mgrs(convert_coords_to_mgrs(marker_coord))}")
+                    self.logger_gui.info(f"Loaded OBJ Marker at {format_readable_mgrs(marker_mgrs)}")
                 elif marker_data['MARKER_TYPE'] == 'NAI':
                     self.plot_NAI(marker_coord,True)
-                    self.logger_gui.info(f"Loaded NAI Marker at {format_readable_mgrs(convert_coords_to_mgrs(marker_coord))}")
+                    self.logger_gui.info(f"Loaded NAI Marker at {format_readable_mgrs(marker_mgrs)}")
                 initial_coord = marker_coord
         except FileNotFoundError:
             pass
@@ -1818,37 +1929,44 @@ class App(customtkinter.CTk):
 
     def ewt_input_processor(self,*args, **kwargs) -> None:
         from utilities import format_readable_DTG, generate_DTG
-        from coords import convert_coords_to_mgrs, convert_mgrs_to_coords, format_readable_mgrs, get_bearing_between_coordinates, get_distance_between_coords, get_center_coord, get_coords_from_LOBs
-        from ew import get_emission_distance
-        from map import check_for_intersection, check_if_point_in_polygon, get_intersection, get_line, get_polygon_area, organize_polygon_coords
+        from coords import convert_mgrs_to_coords, format_readable_mgrs
+        from targeting import get_lob_distance_band, get_sensor_distance, get_targets
         import threading
 
-        def elevation_profile_worker(sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km, callback):
+        def elevation_profile_worker(sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km, callback, sensor_height_m):
             from dted import get_elevation_profile, generate_coordinates_of_interest
             try:
                 farside_coord = generate_coordinates_of_interest(sensor_coord, target_coord, farside_target_distance_km)
-                elevation_data = get_elevation_profile(sensor_coord, farside_coord, interpoint_distance_m=30)
+                elevation_data = get_elevation_profile(sensor_coord, farside_coord)
 
                 # Schedule callback in main thread using after
                 if hasattr(callback, '__self__') and hasattr(callback.__self__, 'after'):
-                    callback.__self__.after(0, callback, elevation_data, sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km)
+                    callback.__self__.after(0, callback, elevation_data, sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km, sensor_height_m)
                 else:
                     # fallback if no .after() is found — will run in the thread (unsafe for GUI)
-                    callback(elevation_data, sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km)
+                    callback(elevation_data, sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km, sensor_height_m)
             except Exception as e:
                 self.logger_gui.error(f"Error generating elevation profile: {e}")
 
-        def run_2D_elevation_plotter_threaded(sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km, callback):
+        def run_2D_elevation_plotter_threaded(sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km, callback, sensor_height_m=2):
+            from dted import DTEDCatalog, generate_coordinates_of_interest
+            # warn up front instead of failing partway through the profile
+            farside_coord = generate_coordinates_of_interest(sensor_coord, target_coord, farside_target_distance_km)
+            missing_cells = DTEDCatalog.get_missing_cells_along_path(sensor_coord, farside_coord)
+            if missing_cells:
+                missing_cells_text = ", ".join(f"{cell_lat}°, {cell_lon}°" for cell_lat, cell_lon in missing_cells)
+                self.logger_gui.warning(f"Elevation plot skipped: no DTED for cell(s) {missing_cells_text}")
+                self._show_info(f"No DTED coverage for cell(s) {missing_cells_text}.\nThe 2D Elevation Plot cannot be generated.")
+                return
             thread = threading.Thread(
                 target=elevation_profile_worker,
-                args=(sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km, callback)
+                args=(sensor_coord, nearside_target_distance_km, target_coord, farside_target_distance_km, callback, sensor_height_m)
             )
             thread.daemon = True
             thread.start()
 
-        def plot_lobs(s1lnmc,s1lfmc,s2lnmc,s2lfmc,s3lnmc,s3lfmc,plot_ewt1_lob_tgt_bool=True,plot_ewt2_lob_tgt_bool=True,plot_ewt3_lob_tgt_bool=True):
+        def plot_lobs(lob1,lob2,lob3,plot_ewt1_lob_tgt_bool=True,plot_ewt2_lob_tgt_bool=True,plot_ewt3_lob_tgt_bool=True):
             self.sensor1_target_coord = None ; self.sensor2_target_coord = None ; self.sensor3_target_coord = None
-            import numpy as np
             num_lobs = 3-[self.sensor1_grid_azimuth_val,self.sensor2_grid_azimuth_val,self.sensor3_grid_azimuth_val].count(None)
             # assess if there is no target class
             if self.target_class == '':
@@ -1864,18 +1982,22 @@ class App(customtkinter.CTk):
             # assess if sensor 1 has non-None values
             if self.sensor1_mgrs_val != None and self.sensor1_grid_azimuth_val != None and self.sensor1_power_received_dBm_val != None:
                 # calculate sensor 1 target coordinate
-                self.sensor1_target_coord = [np.average([s1lnmc[0],s1lfmc[0]]),np.average([s1lnmc[1],s1lfmc[1]])]
+                self.sensor1_target_coord = lob1['target_coord']
                 # calculate sensor 1 target MGRS
-                sensor1_target_mgrs = convert_coords_to_mgrs(self.sensor1_target_coord)
+                sensor1_target_mgrs = lob1['target_mgrs']
                 # calculate sensor 1 LOB error (in acres)
-                self.sensor1_lob_error_acres = get_polygon_area(self.sensor1_lob_polygon)
+                self.sensor1_lob_error_acres = lob1['error_acres']
+                # clip sensor 1 LOB area to terrain visible from the sensor (if enabled)
+                sensor1_visible_polygons, sensor1_hidden_polygons, self.sensor1_lob_masked_acres = self._get_terrain_masked_lob(self.sensor1_coord,self.sensor1_lob_polygon,self.sensor1_receiver_height_m_val,self.sensor1_lob_error_acres)
                 # define sensor 1 LOB description
                 sensor1_lob_description = f"EWT 1 at {format_readable_mgrs(self.sensor1_mgrs_val)} with a LOB at bearing {int(self.sensor1_grid_azimuth_val)}° between {self._generate_sensor_distance_text(self.sensor1_min_distance_m)} and {self._generate_sensor_distance_text(self.sensor1_max_distance_m)} with {self.sensor1_lob_error_acres:,.0f} acres of error"
+                if self.sensor1_lob_masked_acres is not None:
+                    sensor1_lob_description += f" ({self.sensor1_lob_masked_acres:,.0f} acres with {self.terrain_mask.lower()})"
                 # define and set sensor 1 marker on the map
                 self.plot_EWT(self.sensor1_coord,1,False)
                 # define and set sensor 1 center line
                 sensor1_lob = self.map_widget.set_polygon(
-                    position_list=[(self.sensor1_coord[0],self.sensor1_coord[1]),(s1lfmc[0],s1lfmc[1])],
+                    position_list=[(self.sensor1_coord[0],self.sensor1_coord[1]),tuple(lob1['far_center_coord'])],
                     fill_color=App.DEFAULT_VALUES['LOB Fill Color'],
                     outline_color=App.DEFAULT_VALUES['LOB Center Line Color'],
                     border_width=App.DEFAULT_VALUES['Border Width'],
@@ -1893,6 +2015,8 @@ class App(customtkinter.CTk):
                     data="LOB Area\n"+sensor1_lob_description)
                 # add sensor 1 LOB area to polygon list
                 self._append_object(sensor1_lob_area,"LOB")
+                # define and set sensor 1 terrain-masked LOB areas
+                self._plot_terrain_masked_lob(sensor1_visible_polygons,sensor1_hidden_polygons,sensor1_lob_description)
                 if plot_ewt1_lob_tgt_bool:
                     # define and set sensor 1 target marker
                     target1_marker = self.map_widget.set_marker(
@@ -1907,8 +2031,7 @@ class App(customtkinter.CTk):
                     # add sensor 1 target marker to target marker list
                     self._append_object(target1_marker,"TGT")
                 # calculate sensor 1 distance to target 1
-                self.sensor1_distance_val = int(get_distance_between_coords(self.sensor1_coord,self.sensor1_target_coord))
-                self.sensor1_bearing_val = int(get_bearing_between_coordinates(self.sensor1_coord,self.sensor1_target_coord))
+                self.sensor1_distance_val, self.sensor1_bearing_val = lob1['distance_m'], lob1['bearing_deg']
                 # generate sensor 1 distance from target text     
                 dist_sensor1_text = self._generate_sensor_distance_text(self.sensor1_distance_val,self.sensor1_bearing_val)
                 # set sensor 1 distance field
@@ -1919,11 +2042,12 @@ class App(customtkinter.CTk):
                     msgBox = CTkMessagebox(title="2D Elevation Plot", message="Do you want to generate a 2D Elevation Plot", icon='info',options=['Yes','No'])
                     response = msgBox.get()
                     if response == 'Yes': 
-                        run_2D_elevation_plotter_threaded(self.sensor1_coord,self.sensor1_min_distance_km,self.sensor1_target_coord,self.sensor1_max_distance_km,callback=self._safe_plot_callback)
+                        run_2D_elevation_plotter_threaded(self.sensor1_coord,self.sensor1_min_distance_km,self.sensor1_target_coord,self.sensor1_max_distance_km,callback=self._safe_plot_callback,sensor_height_m=self.sensor1_receiver_height_m_val)
                         self.logger_gui.info(f"Attempting to create a 2D Elevation Plot for EWT 1 at {format_readable_mgrs(self.sensor1_mgrs_val)} with a LOB at bearing {int(self.sensor1_grid_azimuth_val)}° between {self._generate_sensor_distance_text(self.sensor1_min_distance_m)} and {self._generate_sensor_distance_text(self.sensor1_max_distance_m)}")
             else:
                 sensor1_target_mgrs = None
                 self.sensor1_lob_error_acres = None
+                self.sensor1_lob_masked_acres = None
                 self.sensor1_target_coord = None
                 self.sensor1_distance.configure(text="N/A",text_color='white')
             # assess if sensor 2 has a non-None grid
@@ -1934,18 +2058,22 @@ class App(customtkinter.CTk):
             # assess if sensor 2 has non-None values
             if self.sensor2_mgrs_val != None and self.sensor2_grid_azimuth_val != None and self.sensor2_power_received_dBm_val != None:
                 # calculate sensor 2 target coordinate
-                self.sensor2_target_coord = [np.average([s2lnmc[0],s2lfmc[0]]),np.average([s2lnmc[1],s2lfmc[1]])]
+                self.sensor2_target_coord = lob2['target_coord']
                 # calculate sensor 2 target MGRS
-                sensor2_target_mgrs = convert_coords_to_mgrs(self.sensor2_target_coord)
+                sensor2_target_mgrs = lob2['target_mgrs']
                 # calculate LOB 2 sensor error (in acres)
-                self.sensor2_lob_error_acres = get_polygon_area(self.sensor2_lob_polygon)
+                self.sensor2_lob_error_acres = lob2['error_acres']
+                # clip sensor 2 LOB area to terrain visible from the sensor (if enabled)
+                sensor2_visible_polygons, sensor2_hidden_polygons, self.sensor2_lob_masked_acres = self._get_terrain_masked_lob(self.sensor2_coord,self.sensor2_lob_polygon,self.sensor2_receiver_height_m_val,self.sensor2_lob_error_acres)
                 # define LOB 2 description
                 sensor2_lob_description = f"EWT 2 at {format_readable_mgrs(self.sensor2_mgrs_val)} with a LOB at bearing {int(self.sensor2_grid_azimuth_val)}° between {self._generate_sensor_distance_text(self.sensor2_min_distance_m)} and {self._generate_sensor_distance_text(self.sensor2_max_distance_m)} with {self.sensor2_lob_error_acres:,.0f} acres of error"
+                if self.sensor2_lob_masked_acres is not None:
+                    sensor2_lob_description += f" ({self.sensor2_lob_masked_acres:,.0f} acres with {self.terrain_mask.lower()})"
                 # define and set sensor 2 marker on the map
                 self.plot_EWT(self.sensor2_coord,2,False)
                 # define and set sensor 2 LOB area
                 sensor2_lob = self.map_widget.set_polygon(
-                    position_list=[(self.sensor2_coord[0],self.sensor2_coord[1]),(s2lfmc[0],s2lfmc[1])],
+                    position_list=[(self.sensor2_coord[0],self.sensor2_coord[1]),tuple(lob2['far_center_coord'])],
                     fill_color=App.DEFAULT_VALUES['LOB Fill Color'],
                     outline_color=App.DEFAULT_VALUES['LOB Center Line Color'],
                     border_width=App.DEFAULT_VALUES['Border Width'],
@@ -1963,6 +2091,8 @@ class App(customtkinter.CTk):
                     data="LOB Area\n"+sensor2_lob_description)
                 # add LOB area to polygon list
                 self._append_object(sensor2_lob_area,"LOB")
+                # define and set sensor 2 terrain-masked LOB areas
+                self._plot_terrain_masked_lob(sensor2_visible_polygons,sensor2_hidden_polygons,sensor2_lob_description)
                 if plot_ewt2_lob_tgt_bool:
                     # define and set sensor 2 target marker
                     target2_marker = self.map_widget.set_marker(
@@ -1977,8 +2107,7 @@ class App(customtkinter.CTk):
                     # add sensor 2 target marker to tarket marker list
                     self._append_object(target2_marker,"TGT")
                 # calculate sensor 1 distance to target 2
-                self.sensor2_distance_val = int(get_distance_between_coords(self.sensor2_coord,self.sensor2_target_coord))
-                self.sensor2_bearing_val = int(get_bearing_between_coordinates(self.sensor2_coord,self.sensor2_target_coord))
+                self.sensor2_distance_val, self.sensor2_bearing_val = lob2['distance_m'], lob2['bearing_deg']
                 # generate sensor 2 distance from target text       
                 dist_sensor2_text = self._generate_sensor_distance_text(self.sensor2_distance_val,self.sensor2_bearing_val)
                 # set sensor 2 distance field
@@ -1989,12 +2118,13 @@ class App(customtkinter.CTk):
                     msgBox = CTkMessagebox(title="2D Elevation Plot", message="Do you want to generate a 2D Elevation Plot", icon='info',options=['Yes','No'])
                     response = msgBox.get()
                     if response == 'Yes': 
-                        run_2D_elevation_plotter_threaded(self.sensor2_coord,self.sensor2_min_distance_km,self.sensor2_target_coord,self.sensor2_max_distance_km,callback=self._safe_plot_callback)
+                        run_2D_elevation_plotter_threaded(self.sensor2_coord,self.sensor2_min_distance_km,self.sensor2_target_coord,self.sensor2_max_distance_km,callback=self._safe_plot_callback,sensor_height_m=self.sensor2_receiver_height_m_val)
                         self.logger_gui.info(f"Attempting to create a 2D Elevation Plot for EWT 2 at {format_readable_mgrs(self.sensor2_mgrs_val)} with a LOB at bearing {int(self.sensor2_grid_azimuth_val)}° between {self._generate_sensor_distance_text(self.sensor2_min_distance_m)} and {self._generate_sensor_distance_text(self.sensor2_max_distance_m)}")
 
             else:
                 sensor2_target_mgrs = None
                 self.sensor2_lob_error_acres = None
+                self.sensor2_lob_masked_acres = None
                 self.sensor2_target_coord = None
                 self.sensor2_distance.configure(text="N/A",text_color='white')
             # assess if sensor 3 has a non-None grid
@@ -2005,18 +2135,22 @@ class App(customtkinter.CTk):
             # assess if sensor 3 has non-None values
             if self.sensor3_mgrs_val != None and self.sensor3_grid_azimuth_val != None and self.sensor3_power_received_dBm_val != None:
                 # calculate sensor 3 target coordinate
-                self.sensor3_target_coord = [np.average([s3lnmc[0],s3lfmc[0]]),np.average([s3lnmc[1],s3lfmc[1]])]
+                self.sensor3_target_coord = lob3['target_coord']
                 # calculate sensor 3 target MGRS
-                sensor3_target_mgrs = convert_coords_to_mgrs(self.sensor3_target_coord)
+                sensor3_target_mgrs = lob3['target_mgrs']
                 # calculate LOB 3 sensor error (in acres)
-                self.sensor3_lob_error_acres = get_polygon_area(self.sensor3_lob_polygon)
+                self.sensor3_lob_error_acres = lob3['error_acres']
+                # clip sensor 3 LOB area to terrain visible from the sensor (if enabled)
+                sensor3_visible_polygons, sensor3_hidden_polygons, self.sensor3_lob_masked_acres = self._get_terrain_masked_lob(self.sensor3_coord,self.sensor3_lob_polygon,self.sensor3_receiver_height_m_val,self.sensor3_lob_error_acres)
                 # define sensor 3 LOB description
                 sensor3_lob_description = f"EWT 3 at {format_readable_mgrs(self.sensor3_mgrs_val)} with a LOB at bearing {int(self.sensor3_grid_azimuth_val)}° between {self._generate_sensor_distance_text(self.sensor3_min_distance_m)} and {self._generate_sensor_distance_text(self.sensor3_max_distance_m)} with {self.sensor3_lob_error_acres:,.0f} acres of error"
+                if self.sensor3_lob_masked_acres is not None:
+                    sensor3_lob_description += f" ({self.sensor3_lob_masked_acres:,.0f} acres with {self.terrain_mask.lower()})"
                 # define and plot sensor 3 marker on the map
                 self.plot_EWT(self.sensor3_coord,3,False)
                 # define and set sensor 3 LOB area
                 sensor3_lob = self.map_widget.set_polygon(
-                    position_list=[(self.sensor3_coord[0],self.sensor3_coord[1]),(s3lfmc[0],s3lfmc[1])],
+                    position_list=[(self.sensor3_coord[0],self.sensor3_coord[1]),tuple(lob3['far_center_coord'])],
                     fill_color=App.DEFAULT_VALUES['LOB Fill Color'],
                     outline_color=App.DEFAULT_VALUES['LOB Center Line Color'],
                     border_width=App.DEFAULT_VALUES['Border Width'],
@@ -2034,6 +2168,8 @@ class App(customtkinter.CTk):
                     data="LOB Area\n"+sensor3_lob_description)
                 # add LOB area to polygon list
                 self._append_object(sensor3_lob_area,"LOB")
+                # define and set sensor 3 terrain-masked LOB areas
+                self._plot_terrain_masked_lob(sensor3_visible_polygons,sensor3_hidden_polygons,sensor3_lob_description)
                 if plot_ewt3_lob_tgt_bool:
                     # define and set sensor 3 target marker
                     target3_marker = self.map_widget.set_marker(
@@ -2048,8 +2184,7 @@ class App(customtkinter.CTk):
                     # add sensor 3 target marker to target marker list
                     self._append_object(target3_marker,"TGT")
                 # calculate sensor 3 distance to target 3
-                self.sensor3_distance_val = int(get_distance_between_coords(self.sensor3_coord,self.sensor3_target_coord))
-                self.sensor3_bearing_val = int(get_bearing_between_coordinates(self.sensor3_coord,self.sensor3_target_coord))
+                self.sensor3_distance_val, self.sensor3_bearing_val = lob3['distance_m'], lob3['bearing_deg']
                 # generate sensor 3 distance from target text       
                 dist_sensor3_text = self._generate_sensor_distance_text(self.sensor3_distance_val,self.sensor3_bearing_val)
                 # set sensor 3 distance field
@@ -2060,84 +2195,51 @@ class App(customtkinter.CTk):
                     msgBox = CTkMessagebox(title="2D Elevation Plot", message="Do you want to generate a 2D Elevation Plot", icon='info',options=['Yes','No'])
                     response = msgBox.get()
                     if response == 'Yes': 
-                        run_2D_elevation_plotter_threaded(self.sensor3_coord,self.sensor3_min_distance_km,self.sensor3_target_coord,self.sensor3_max_distance_km,callback=self._safe_plot_callback)
+                        run_2D_elevation_plotter_threaded(self.sensor3_coord,self.sensor3_min_distance_km,self.sensor3_target_coord,self.sensor3_max_distance_km,callback=self._safe_plot_callback,sensor_height_m=self.sensor3_receiver_height_m_val)
                         self.logger_gui.info(f"Attempting to create a 2D Elevation Plot for EWT 3 at {format_readable_mgrs(self.sensor3_mgrs_val)} with a LOB at bearing {int(self.sensor3_grid_azimuth_val)}° between {self._generate_sensor_distance_text(self.sensor3_min_distance_m)} and {self._generate_sensor_distance_text(self.sensor3_max_distance_m)}")
             else:
                 sensor3_target_mgrs = None
                 self.sensor3_lob_error_acres = None
+                self.sensor3_lob_masked_acres = None
                 self.sensor3_target_coord = None
                 self.sensor3_distance.configure(text="N/A",text_color='white')
             # calculate distance from EWT 1 to other EWT targets
             if self.sensor1_distance._text == "N/A" and self.sensor1_coord != None:
                 if self.sensor2_target_coord != None:
-                    self.sensor1_distance_val = int(get_distance_between_coords(self.sensor1_coord,self.sensor2_target_coord))
-                    self.sensor1_bearing_val = int(get_bearing_between_coordinates(self.sensor1_coord,self.sensor2_target_coord))
+                    self.sensor1_distance_val, self.sensor1_bearing_val = get_sensor_distance(self.sensor1_coord,self.sensor2_target_coord)
                     dist_sensor1_text = self._generate_sensor_distance_text(self.sensor1_distance_val,self.sensor1_bearing_val)
                     self.sensor1_distance.configure(text=dist_sensor1_text,text_color='white')
                 if self.sensor3_target_coord != None:
-                    self.sensor1_distance_val = int(get_distance_between_coords(self.sensor1_coord,self.sensor3_target_coord))
+                    self.sensor1_distance_val = get_sensor_distance(self.sensor1_coord,self.sensor3_target_coord)[0]
                     dist_sensor1_text = self._generate_sensor_distance_text(self.sensor1_distance_val)
                     self.sensor1_distance.configure(text=dist_sensor1_text,text_color='white')
             # calculate distance from EWT 2 to other EWT targets
             if self.sensor2_distance._text == "N/A" and self.sensor2_coord != None:
                 if self.sensor1_target_coord != None:
-                    self.sensor2_distance_val = int(get_distance_between_coords(self.sensor2_coord,self.sensor1_target_coord))
-                    self.sensor2_bearing_val = int(get_bearing_between_coordinates(self.sensor2_coord,self.sensor1_target_coord))
+                    self.sensor2_distance_val, self.sensor2_bearing_val = get_sensor_distance(self.sensor2_coord,self.sensor1_target_coord)
                     dist_sensor2_text = self._generate_sensor_distance_text(self.sensor2_distance_val,self.sensor2_bearing_val)
                     self.sensor2_distance.configure(text=dist_sensor2_text,text_color='white')
                 if self.sensor3_target_coord != None:
-                    self.sensor2_distance_val = int(get_distance_between_coords(self.sensor2_coord,self.sensor3_target_coord))
-                    self.sensor2_bearing_val = int(get_bearing_between_coordinates(self.sensor2_coord,self.sensor3_target_coord))
+                    self.sensor2_distance_val, self.sensor2_bearing_val = get_sensor_distance(self.sensor2_coord,self.sensor3_target_coord)
                     dist_sensor2_text = self._generate_sensor_distance_text(self.sensor2_distance_val,self.sensor2_bearing_val)
                     self.sensor2_distance.configure(text=dist_sensor2_text,text_color='white')
             # calculate distance from EWT 3 to other EWT targets
             if self.sensor3_distance._text == "N/A" and self.sensor3_coord != None:
                 if self.sensor2_target_coord != None:
-                    self.sensor3_distance_val = int(get_distance_between_coords(self.sensor3_coord,self.sensor2_target_coord))
-                    self.sensor3_bearing_val = int(get_bearing_between_coordinates(self.sensor3_coord,self.sensor2_target_coord))
+                    self.sensor3_distance_val, self.sensor3_bearing_val = get_sensor_distance(self.sensor3_coord,self.sensor2_target_coord)
                     dist_sensor3_text = self._generate_sensor_distance_text(self.sensor3_distance_val,self.sensor3_bearing_val)
                     self.sensor3_distance.configure(text=dist_sensor3_text,text_color='white')
                 if self.sensor1_target_coord != None:
-                    self.sensor3_distance_val = int(get_distance_between_coords(self.sensor3_coord,self.sensor1_target_coord))
-                    self.sensor3_bearing_val = int(get_bearing_between_coordinates(self.sensor3_coord,self.sensor1_target_coord))
+                    self.sensor3_distance_val, self.sensor3_bearing_val = get_sensor_distance(self.sensor3_coord,self.sensor1_target_coord)
                     dist_sensor3_text = self._generate_sensor_distance_text(self.sensor3_distance_val,self.sensor3_bearing_val)
                     self.sensor3_distance.configure(text=dist_sensor3_text,text_color='white')
     
-        def plot_cut(l1c,l1r,l1l,l2c,l2r,l2l,multi_cut_bool=False,plot_cut_tgts=True):
-            """
-            Detect intersection between lob bounds and other lob's far bound, choose the four closes points for cut polygon'
-            """
-            # define target classification
-            self.target_class = '(CUT)'
-            # set target label with updated target classification
-            self.label_target_grid.configure(text=f'TARGET GRID {self.target_class}'.strip(),text_color='red')
-            # get intersection of LOB centers
-            self.target_coord = get_intersection(l1c, l2c)
-            # get intersection of right-bound LOB errors
-            intersection_l1r_l2r = get_intersection(l1r, l2r)
-            # get intersection of LOB 1 right-bound error and LOB 2 left-bound error
-            intersection_l1r_l2l = get_intersection(l1r, l2l)
-            # get intersection of LOB 1 left-bound error and LOB 2 right-bound error
-            intersection_l1l_l2r = get_intersection(l1l, l2r)
-            # get intersection of left-bound LOB errors 
-            intersection_l1l_l2l = get_intersection(l1l, l2l)
-            '''
-            Assess if the backstops of LOBs intersect with LOB left-right bounds, need to know which LOBs are being assessed
-            '''
-            
-            # define CUT polygon
-            cut_polygon = [intersection_l1r_l2r,intersection_l1r_l2l,intersection_l1l_l2l,intersection_l1l_l2r]
-            # organize CUT polygon
-            cut_polygon = organize_polygon_coords(cut_polygon)
-            # calculate the CUT error (in acres)
-            self.target_error_val = get_polygon_area(cut_polygon)
-            # define CUT center MGRS grid
-            self.target_mgrs = convert_coords_to_mgrs(self.target_coord)
-            # define sensor 1 LOB description
-            cut_description = f"Target CUT at {format_readable_mgrs(self.target_mgrs)} with {self.target_error_val:,.0f} acres of error"
+        def plot_cut(cut):
+            """Draw a CUT area of the targeting engine, with its target marker if the engine gives it one."""
+            cut_description = f"Target CUT at {format_readable_mgrs(cut['target_mgrs'])} with {cut['error_acres']:,.0f} acres of error"
             # define and set CUT area
             cut_area = self.map_widget.set_polygon(
-                position_list=cut_polygon,
+                position_list=cut['polygon'],
                 fill_color=App.DEFAULT_VALUES['LOB Fill Color'],
                 outline_color=App.DEFAULT_VALUES['CUT Area Outline Color'],
                 border_width=App.DEFAULT_VALUES['Border Width'],
@@ -2145,258 +2247,46 @@ class App(customtkinter.CTk):
                 data=cut_description)
             # add CUT polygon to the polygon list
             self._append_object(cut_area,"CUT")
-            # calculate distance from sensor 1 and CUT intersection (in meters)
-            if self.sensor1_mgrs_val != None: 
-                self.sensor1_distance_val = int(get_distance_between_coords(self.sensor1_coord,self.target_coord))
-                self.sensor1_bearing_val = int(get_bearing_between_coordinates(self.sensor1_coord,self.target_coord))
-            # calculate distance from sensor 2 and CUT intersection (in meters)
-            if self.sensor2_mgrs_val != None: 
-                self.sensor2_distance_val = int(get_distance_between_coords(self.sensor2_coord,self.target_coord))
-                self.sensor2_bearing_val = int(get_bearing_between_coordinates(self.sensor2_coord,self.target_coord))
-            # define and set the CUT target marker
-            if self.sensor3_mgrs_val != None: 
-                self.sensor3_distance_val = int(get_distance_between_coords(self.sensor3_coord,self.target_coord))
-                self.sensor3_bearing_val = int(get_bearing_between_coordinates(self.sensor3_coord,self.target_coord))
-            if plot_cut_tgts:
+            if cut['marker']:
                 # define and set the CUT target marker
                 cut_target_marker = self.map_widget.set_marker(
-                    deg_x=self.target_coord[0], 
-                    deg_y=self.target_coord[1], 
-                    text=f'{format_readable_mgrs(self.target_mgrs)}',
+                    deg_x=cut['target_coord'][0], 
+                    deg_y=cut['target_coord'][1], 
+                    text=f"{format_readable_mgrs(cut['target_mgrs'])}",
                     image_zoom_visibility=(10, float("inf")),
                     marker_color_circle='white',
                     icon=self.target_image_CUT,
                     command=self.marker_click,
-                    data=f'TGT (CUT)\n{format_readable_mgrs(self.target_mgrs)}\nat {format_readable_DTG(generate_DTG())}')
+                    data=f"TGT (CUT)\n{format_readable_mgrs(cut['target_mgrs'])}\nat {format_readable_DTG(generate_DTG())}")
                 # add CUT marker to target marker list
                 self._append_object(cut_target_marker,"TGT")
-            # generate sensor 1 distance from target text     
-            if self.sensor1_mgrs_val != None: 
-                # generate sensor 1 distance from target text
-                dist_sensor1_text = self._generate_sensor_distance_text(self.sensor1_distance_val,self.sensor1_bearing_val)
-                # set sensor 1 distance field
-                if self.sensor1_distance.cget("text") != '' and multi_cut_bool:
-                    if self.sensor1_distance.cget("text") > dist_sensor1_text:
-                        self.sensor1_distance.configure(text=dist_sensor1_text,text_color='white')
-                else:
-                    self.sensor1_distance.configure(text=dist_sensor1_text,text_color='white')
-            if self.sensor2_mgrs_val != None: 
-                # generate sensor 2 distance from target text
-                dist_sensor2_text = self._generate_sensor_distance_text(self.sensor2_distance_val,self.sensor2_bearing_val)
-                # set sensor 2 distance field
-                if self.sensor2_distance.cget("text") != '' and multi_cut_bool:
-                    if self.sensor2_distance.cget("text") > dist_sensor2_text:
-                        self.sensor2_distance.configure(text=dist_sensor2_text,text_color='white')
-                else:
-                    self.sensor2_distance.configure(text=dist_sensor2_text,text_color='white')
-            if self.sensor3_mgrs_val != None:
-                # generate sensor 3 distance from target text
-                dist_sensor3_text = self._generate_sensor_distance_text(self.sensor3_distance_val,self.sensor3_bearing_val)
-                # set sensor 3 distance field
-                if self.sensor3_distance.cget("text") != '' and multi_cut_bool:
-                    if self.sensor3_distance.cget("text") > dist_sensor3_text:
-                        self.sensor3_distance.configure(text=dist_sensor3_text,text_color='white')
-                else:
-                    self.sensor3_distance.configure(text=dist_sensor3_text,text_color='white')
-                        # calculate distance from EWT 1 to other EWT targets
-            # set EWT distance of EWTs without target data
-            if self.sensor1_distance._text == "N/A" and self.sensor1_coord != None:
-                self.sensor1_distance_val = int(get_distance_between_coords(self.sensor1_coord,self.target_coord))
-                self.sensor1_bearing_val = int(get_bearing_between_coordinates(self.sensor1_coord,self.target_coord))
-                dist_sensor1_text = self._generate_sensor_distance_text(self.sensor1_distance_val,self.sensor1_bearing_val)
-                self.sensor1_distance.configure(text=dist_sensor1_text,text_color='white')
-            if self.sensor2_distance._text == "N/A" and self.sensor2_coord != None:
-                self.sensor2_distance_val = int(get_distance_between_coords(self.sensor2_coord,self.target_coord))
-                self.sensor2_bearing_val = int(get_bearing_between_coordinates(self.sensor2_coord,self.target_coord))
-                dist_sensor2_text = self._generate_sensor_distance_text(self.sensor2_distance_val,self.sensor2_bearing_val)
-                self.sensor2_distance.configure(text=dist_sensor2_text,text_color='white')
-            if self.sensor3_distance._text == "N/A" and self.sensor3_coord != None:
-                self.sensor3_distance_val = int(get_distance_between_coords(self.sensor3_coord,self.target_coord))
-                self.sensor3_bearing_val = int(get_bearing_between_coordinates(self.sensor3_coord,self.target_coord))
-                dist_sensor3_text = self._generate_sensor_distance_text(self.sensor3_distance_val,self.sensor3_bearing_val)
-                self.sensor3_distance.configure(text=dist_sensor3_text,text_color='white')
-            # set target grid field with CUT center MGRS
-            if multi_cut_bool: self.target_grid.configure(text="MULTIPLE CUTS")
-            if not multi_cut_bool: self.target_grid.configure(text=f'{format_readable_mgrs(self.target_mgrs)}',text_color='yellow')
-            # set target error field
-            if multi_cut_bool: self.target_error.configure(text="MULTIPLE CUTS")
-            if not multi_cut_bool: self.target_error.configure(text=f'{self.target_error_val:,.0f} acres',text_color='white')
-            # set map position at CUT target 
-            self.map_widget.set_position(self.target_coord[0],self.target_coord[1])
-            self.MAP_POSITIION = (self.target_coord[0],self.target_coord[1])
-            
-        def plot_fix(lob1_center,lob1_right_bound,lob1_left_bound,lob2_center,lob2_right_bound,lob2_left_bound,lob3_center,lob3_right_bound,lob3_left_bound):
-            """
-            Still having issues of inconsistency with some assessments of FIX space
-            incorporating alt method as temp solution
-            """
-            
-            from coords import adjust_coordinate, get_bearing_between_coordinates
-            # get intersection of LOB 1 & LOB 2 right-bound errors
-            intersection_l1r_l2r = get_intersection(lob1_right_bound, lob2_right_bound)
-            # get intersection of LOB 1 right-bound error and LOB 2 left-bound error
-            intersection_l1r_l2l = get_intersection(lob1_right_bound, lob2_left_bound)
-            # get intersection of LOB 1 left-bound error and LOB 2 right-bound error
-            intersection_l1l_l2r = get_intersection(lob1_left_bound, lob2_right_bound)
-            # get intersection of LOB 1 & LOB 2 left-bound errors 
-            intersection_l1l_l2l = get_intersection(lob1_left_bound, lob2_left_bound)
-            # define LOB 1 & LOB 2 CUT polygon
-            cut12_polygon = [intersection_l1r_l2r,intersection_l1r_l2l,intersection_l1l_l2r,intersection_l1l_l2l]
-            # get intersection of LOB 1 & LOB 3 right-bound errors
-            intersection_l1r_l3r = get_intersection(lob1_right_bound, lob3_right_bound)
-            # get intersection of LOB 1 right-bound error and LOB 3 left-bound error
-            intersection_l1r_l3l = get_intersection(lob1_right_bound, lob3_left_bound)
-            # get intersection of LOB 1 left-bound error and LOB 3 right-bound error
-            intersection_l1l_l3r = get_intersection(lob1_left_bound, lob3_right_bound)
-            # get intersection of LOB 1 & LOB 3 left-bound errors 
-            intersection_l1l_l3l = get_intersection(lob1_left_bound, lob3_left_bound)
-            # define LOB 1 & LOB 3 CUT polygon
-            cut13_polygon = [intersection_l1r_l3r,intersection_l1r_l3l,intersection_l1l_l3r,intersection_l1l_l3l]
-            # get intersection of LOB 2 & LOB 3 right-bound errors
-            intersection_l2r_l3r = get_intersection(lob2_right_bound, lob3_right_bound)
-            # get intersection of LOB 2 right-bound error and LOB 3 left-bound error
-            intersection_l2r_l3l = get_intersection(lob2_right_bound, lob3_left_bound)
-            # get intersection of LOB 2 left-bound error and LOB 3 right-bound error
-            intersection_l2l_l3r = get_intersection(lob2_left_bound, lob3_right_bound)
-            # get intersection of LOB 2 & LOB 3 left-bound errors 
-            intersection_l2l_l3l = get_intersection(lob2_left_bound, lob3_left_bound)
-            # define LOB 2 & LOB 3 CUT polygon
-            cut23_polygon = [intersection_l2r_l3r,intersection_l2r_l3l,intersection_l2l_l3r,intersection_l2l_l3l]
-            # define candidate points
-            points_unadjusted = list(list(cut12_polygon) + list(cut13_polygon) + list(cut23_polygon))
-            # points.append([35.3336198, -116.5212675])
-            center_point = get_center_coord(points_unadjusted)
-            fix_buffer_adjustment_m = 5
-            points = [adjust_coordinate(p,get_bearing_between_coordinates(p,center_point),fix_buffer_adjustment_m) for p in points_unadjusted]           
-            # organize LOB 1 & LOB 2 CUT polygon
-            cut12_polygon = organize_polygon_coords(cut12_polygon)
-            # organize LOB 1 & LOB 3 CUT polygon
-            cut13_polygon = organize_polygon_coords(cut13_polygon)
-            # organize LOB 2 & LOB 3 CUT polygon
-            cut23_polygon = organize_polygon_coords(cut23_polygon) 
-            # define polygons
-            polygons = [cut12_polygon,cut13_polygon,cut23_polygon]
-            # polygons = [self.sensor1_lob_polygon,self.sensor2_lob_polygon,self.sensor3_lob_polygon]
-            # define FIX coords list
-            fix_polygon = []
-            # loop through all CUT intersection points
-            for index_point, point in enumerate(points):
-                # set polygon boolean value to TRUE
-                in_polygon_bool = True
-                # loop through all CUT polygons
-                for index_polygon, poly in enumerate(polygons):
-                    # assess if the point is in the polygon
-                    output = check_if_point_in_polygon(point,poly)
-                    if output == 0 or output == False:
-                        # set polygon boolean value to FALSE
-                        in_polygon_bool = False
-                        # end polygon loop
-                        break
-                # if point is in all CUT polygons
-                if in_polygon_bool:
-                    # append point as a fix coordinate
-                    fix_polygon.append(point)
-                else:
-                    pass
-                in_polygon_bool = True
-            if len(fix_polygon) == 0:
-                # plot cuts with the CUT target icon
-                plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob2_center,lob2_right_bound,lob2_left_bound,True,True)
-                plot_cut(lob2_center,lob2_right_bound,lob2_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,True)
-                plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,True)
-                return
-            # organize fix coordinates
-            fix_polygon = organize_polygon_coords(fix_polygon)
-            # assess if the fix polygon is not a polygon
-            if len(fix_polygon) < 3:
-                # alternate method of determining fix
-                int_13 = get_intersection(lob1_center, lob3_center)
-                int_12 = get_intersection(lob1_center, lob2_center)
-                int_23 = get_intersection(lob2_center, lob3_center)
-                fix_polygon = [int_12,int_23,int_13]
-                # plot cuts with the CUT target icon
-                plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob2_center,lob2_right_bound,lob2_left_bound,True,True)
-                plot_cut(lob2_center,lob2_right_bound,lob2_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,True)
-                plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,True)
-            else:
-                # plot cuts without the CUT target icon
-                plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob2_center,lob2_right_bound,lob2_left_bound,True,False)
-                plot_cut(lob2_center,lob2_right_bound,lob2_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,False)
-                plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,False)
-            # define target classification
-            self.target_class = '(FIX)'
-            # set target label with updated target classification
-            self.label_target_grid.configure(text=f'TARGET GRID {self.target_class}'.strip(),text_color='red')
-            fix_coord = get_center_coord(fix_polygon)
-            self.target_coord = fix_coord
-            self.target_mgrs = convert_coords_to_mgrs(self.target_coord)
-            self.sensor1_distance_val = int(get_distance_between_coords(self.sensor1_coord,self.target_coord))
-            self.sensor1_bearing_val = int(get_bearing_between_coordinates(self.sensor1_coord,self.target_coord))
-            self.sensor2_distance_val = int(get_distance_between_coords(self.sensor2_coord,self.target_coord))
-            self.sensor2_bearing_val = int(get_bearing_between_coordinates(self.sensor2_coord,self.target_coord))
-            self.sensor3_distance_val = int(get_distance_between_coords(self.sensor3_coord,self.target_coord))
-            self.sensor3_bearing_val = int(get_bearing_between_coordinates(self.sensor3_coord,self.target_coord))
-            self.target_error_val = get_polygon_area(fix_polygon)
-            fix_description = f"Target FIX at {format_readable_mgrs(self.target_mgrs)} with {self.target_error_val:,.0f} acres of error"
+
+        def plot_fix(fix):
+            """Draw the FIX area and target marker of the targeting engine."""
+            if fix['method'] == 'bayesian':
+                self.logger_gui.info(f"Bayesian grid fix: MAP estimate at {fix['target_coord']} with a credible region of {fix['error_acres']:,.0f} acres")
             fix_target_marker = self.map_widget.set_marker(
-                deg_x=self.target_coord[0], 
-                deg_y=self.target_coord[1],
-                text=f'{format_readable_mgrs(self.target_mgrs)}',
+                deg_x=fix['target_coord'][0], 
+                deg_y=fix['target_coord'][1],
+                text=f"{format_readable_mgrs(fix['target_mgrs'])}",
                 image_zoom_visibility=(10, float("inf")),
                 marker_color_circle='white',
                 icon=self.target_image_FIX,
                 command=self.marker_click,
-                data=f'TGT {self.target_class}\n{format_readable_mgrs(self.target_mgrs)}\nat {format_readable_DTG(generate_DTG())}')
+                data=f"TGT (FIX)\n{format_readable_mgrs(fix['target_mgrs'])}\nat {format_readable_DTG(generate_DTG())}")
             # add FIX marker to target marker list
             self._append_object(fix_target_marker,"TGT")
-            # generate sensor 1 distance from target text     
-            dist_sensor1_text = self._generate_sensor_distance_text(self.sensor1_distance_val,self.sensor1_bearing_val)
-            # set sensor 1 distance field
-            self.sensor1_distance.configure(text=dist_sensor1_text,text_color='white')
-            # generate sensor 2 distance from target text       
-            dist_sensor2_text = self._generate_sensor_distance_text(self.sensor2_distance_val,self.sensor2_bearing_val)
-            # set sensor 2 distance field
-            self.sensor2_distance.configure(text=dist_sensor2_text,text_color='white')
-            # set target grid field with CUT center MGRS
-            dist_sensor3_text = self._generate_sensor_distance_text(self.sensor3_distance_val,self.sensor3_bearing_val)
-            # set sensor 2 distance field
-            self.sensor3_distance.configure(text=dist_sensor3_text,text_color='white')
-            # set target grid field with CUT center MGRS
-            self.target_grid.configure(text=f'{format_readable_mgrs(self.target_mgrs)}',text_color='yellow')
-            # set target error field
-            self.target_error.configure(text=f'{self.target_error_val:,.0f} acres',text_color='white')
-            # set map position at CUT target 
-            self.map_widget.set_position(self.target_coord[0],self.target_coord[1])
-            self.MAP_POSITIION = (self.target_coord[0],self.target_coord[1])
-            # calculate the FIX error (in acres)
-            self.target_error_val = get_polygon_area(fix_polygon)
             # define sensor FIX description
-            fix_description = f"Target FIX with {self.target_error_val:,.0f} acres of error"
-            # define and set CUT area
+            fix_description = f"Target FIX with {fix['error_acres']:,.0f} acres of error"
+            # define and set FIX area
             fix_area = self.map_widget.set_polygon(
-                position_list=fix_polygon,
+                position_list=fix['polygon'],
                 fill_color=App.DEFAULT_VALUES['LOB Fill Color'],
                 outline_color=App.DEFAULT_VALUES['FIX Area Outline Color'],
                 border_width=App.DEFAULT_VALUES['Border Width'],
                 command=self.polygon_click,
                 data=fix_description)
             self._append_object(fix_area,"FIX")
-            # set EWT distance of EWTs without target data
-            if self.sensor1_distance._text == "N/A" and self.sensor1_coord != None:
-                self.sensor1_distance_val = int(get_distance_between_coords(self.sensor1_coord,self.target_coord))
-                self.sensor1_bearing_val = int(get_bearing_between_coordinates(self.sensor1_coord,self.target_coord))
-                dist_sensor1_text = self._generate_sensor_distance_text(self.sensor1_distance_val,self.sensor1_bearing_val)
-                self.sensor1_distance.configure(text=dist_sensor1_text,text_color='white')
-            if self.sensor2_distance._text == "N/A" and self.sensor2_coord != None:
-                self.sensor2_distance_val = int(get_distance_between_coords(self.sensor2_coord,self.target_coord))
-                self.sensor2_bearing_val = int(get_bearing_between_coordinates(self.sensor2_coord,self.target_coord))
-                dist_sensor2_text = self._generate_sensor_distance_text(self.sensor2_distance_val,self.sensor2_bearing_val)
-                self.sensor2_distance.configure(text=dist_sensor2_text,text_color='white')
-            if self.sensor3_distance._text == "N/A" and self.sensor3_coord != None:
-                self.sensor3_distance_val = int(get_distance_between_coords(self.sensor3_coord,self.target_coord))
-                self.sensor3_bearing_val = int(get_bearing_between_coordinates(self.sensor3_coord,self.target_coord))
-                dist_sensor3_text = self._generate_sensor_distance_text(self.sensor3_distance_val,self.sensor3_bearing_val)
-                self.sensor3_distance.configure(text=dist_sensor3_text,text_color='white')
         # reset fields to defaults
         self.label_target_grid.configure(text='')
         self.target_grid.configure(text='')
@@ -2407,155 +2297,73 @@ class App(customtkinter.CTk):
         self.target_class = ''; self.target_coord = None; self.target_mgrs = None
         self.sensor1_distance_val = None; self.sensor2_distance_val = None; self.sensor3_distance_val = None
         self.sensor1_bearing_val = None; self.sensor2_bearing_val = None; self.sensor3_bearing_val = None
-        sensor1_lob_near_middle_coord = None; sensor2_lob_near_middle_coord = None; sensor3_lob_near_middle_coord = None
-        sensor1_lob_far_middle_coord = None; sensor2_lob_far_middle_coord = None; sensor3_lob_far_middle_coord = None
         # read the user input fields
         self.read_ewt_input_fields()
         # end function if there is no ewt data
         if self.sensor1_mgrs_val == None and self.sensor2_mgrs_val == None and self.sensor3_mgrs_val == None: return
         # end function if not all data fields were input
         if self.frequency_MHz_val == None or self.min_wattage_val == None or self.max_wattage_val == None: return
-        # if sensor 1 has non-None input values
-        if self.sensor1_mgrs_val != None and self.sensor1_grid_azimuth_val != None and self.sensor1_power_received_dBm_val != None:
-            # convert sensor 1 mgrs to coords
-            self.sensor1_coord = convert_mgrs_to_coords(self.sensor1_mgrs_val)
-            # clear sensor 1 distance
-            self.sensor1_distance.configure(text='')
-            # calculate minimum distance from sensor 1 to TGT (in km)
-            self.sensor1_min_distance_km = get_emission_distance(self.min_wattage_val,self.frequency_MHz_val,self.transmitter_gain_dBi_val,self.sensor1_receiver_gain_dBi,self.sensor1_power_received_dBm_val,self.transmitter_height_m_val,self.sensor1_receiver_height_m_val,self.temp_f_val,self.path_loss_coeff_val,weather_coeff=4/3,pure_pathLoss=True)
-            # convert minimum distance from sensor 1 to TGT to meters
-            self.sensor1_min_distance_m = self.sensor1_min_distance_km * 1000
-            # calculate maximum distance from sensor 1 to TGT (in km)
-            self.sensor1_max_distance_km = get_emission_distance(self.max_wattage_val,self.frequency_MHz_val,self.transmitter_gain_dBi_val,self.sensor1_receiver_gain_dBi,self.sensor1_power_received_dBm_val,self.transmitter_height_m_val,self.sensor1_receiver_height_m_val,self.temp_f_val,self.path_loss_coeff_val,weather_coeff=4/3,pure_pathLoss=True)
-            # calculate minimum distance from sensor 1 to TGT (in km)
-            self.sensor1_max_distance_m = self.sensor1_max_distance_km * 1000
-            # calculate sensor 1 LOB boundaries
-            sensor1_lob_center, sensor1_lob_near_right_coord, sensor1_lob_near_left_coord, sensor1_lob_near_middle_coord, sensor1_lob_far_right_coord, sensor1_lob_far_left_coord, sensor1_lob_far_middle_coord, sensor1_center_coord_list = get_coords_from_LOBs(self.sensor1_coord,self.sensor1_grid_azimuth_val,self.sensor1_error,self.sensor1_min_distance_m,self.sensor1_max_distance_m)
-            # define sensor 1 LOB polygon
-            self.sensor1_lob_polygon = [sensor1_lob_near_right_coord,sensor1_lob_far_right_coord,sensor1_lob_far_left_coord,sensor1_lob_near_left_coord]
-            # organize sensor 1 LOB polygon points
-            self.sensor1_lob_polygon = organize_polygon_coords(self.sensor1_lob_polygon)
-            # define sensor 1 LOB backstop Line
-            self.sensor1_lob_backstop = get_line(sensor1_lob_far_right_coord,sensor1_lob_far_left_coord)
-            # define sensor 1 LOB's center line
-            lob1_center = get_line(self.sensor1_coord, sensor1_lob_far_middle_coord)
-            # define sensor 1 LOB's right-bound error line
-            lob1_right_bound = get_line(sensor1_lob_near_right_coord, sensor1_lob_far_right_coord)
-            # define sensor 1 LOB's left-bound error line
-            lob1_left_bound = get_line(sensor1_lob_near_left_coord, sensor1_lob_far_left_coord)
-        # if sensor 1 has None input values
-        else:
-            # set sensor 1 input values to None
-            self.sensor1_grid_azimuth_val = None; self.sensor1_power_received_dBm_val = None; self.sensor1_lob_polygon = None; self.sensor1_lob_backstop = None
-        # if sensor 2 has non-None input values
-        if self.sensor2_mgrs_val != None and self.sensor2_grid_azimuth_val != None and self.sensor2_power_received_dBm_val != None:
-            # convert sensor 2 MGRS to coordinates
-            self.sensor2_coord = convert_mgrs_to_coords(self.sensor2_mgrs_val)
-            # # set map position to the middle of sensor 1 and sensor 2
-            # self.map_widget.set_position(np.average([self.sensor1_coord[0],self.sensor2_coord[0]]),np.average([self.sensor1_coord[1],self.sensor2_coord[1]]))
-            # self.MAP_POSITIION = (np.average([self.sensor1_coord[0],self.sensor2_coord[0]]),np.average([self.sensor1_coord[1],self.sensor2_coord[1]]))
-            # clear sensor 2 distance 
-            self.sensor2_distance.configure(text='')
-            # calculate sensor 2 minimum distance (in km)
-            self.sensor2_min_distance_km = get_emission_distance(self.min_wattage_val,self.frequency_MHz_val,self.transmitter_gain_dBi_val,self.sensor2_receiver_gain_dBi,self.sensor2_power_received_dBm_val,self.transmitter_height_m_val,self.sensor2_receiver_height_m_val,self.temp_f_val,self.path_loss_coeff_val,weather_coeff=4/3,pure_pathLoss=True)
-            # convert sensor 2 minimum distance to meters
-            self.sensor2_min_distance_m = self.sensor2_min_distance_km * 1000
-            # calculate sensor 2 maximum distance (in km)    
-            self.sensor2_max_distance_km = get_emission_distance(self.max_wattage_val,self.frequency_MHz_val,self.transmitter_gain_dBi_val,self.sensor2_receiver_gain_dBi,self.sensor2_power_received_dBm_val,self.transmitter_height_m_val,self.sensor2_receiver_height_m_val,self.temp_f_val,self.path_loss_coeff_val,weather_coeff=4/3,pure_pathLoss=True)
-            # convert sensor 2 maximum distance to meters
-            self.sensor2_max_distance_m = self.sensor2_max_distance_km * 1000
-            # calculate sensor 2 LOB boundaries
-            sensor2_lob_center, sensor2_lob_near_right_coord, sensor2_lob_near_left_coord, sensor2_lob_near_middle_coord, sensor2_lob_far_right_coord, sensor2_lob_far_left_coord, sensor2_lob_far_middle_coord, sensor2_center_coord_list = get_coords_from_LOBs(self.sensor2_coord,self.sensor2_grid_azimuth_val,self.sensor2_error,self.sensor2_min_distance_m,self.sensor2_max_distance_m)
-            # define sensor 2 LOB polygon
-            self.sensor2_lob_polygon = [sensor2_lob_near_right_coord,sensor2_lob_far_right_coord,sensor2_lob_far_left_coord,sensor2_lob_near_left_coord]
-            # organize sensor 2 LOB polygon
-            self.sensor2_lob_polygon = organize_polygon_coords(self.sensor2_lob_polygon)
-            # define sensor 2 LOB backstop Line
-            self.sensor2_lob_backstop = get_line(sensor2_lob_far_right_coord,sensor2_lob_far_left_coord)
-            # define sensor 2 LOB center-line
-            lob2_center = get_line(self.sensor2_coord, sensor2_lob_far_middle_coord)
-            # define sensor 2 LOB right-bound error line
-            lob2_right_bound = get_line(sensor2_lob_near_right_coord, sensor2_lob_far_right_coord)
-            # define sensor 2 LOB left-bound error line
-            lob2_left_bound = get_line(sensor2_lob_near_left_coord, sensor2_lob_far_left_coord)
-        # if sensor 2 has None input values
-        else:
-            # set sensor 2 input values to None
-            self.sensor2_grid_azimuth_val = None; self.sensor2_power_received_dBm_val = None; self.sensor2_lob_polygon = None; self.sensor2_lob_backstop = None
-        # if sensor 3 has non-None input values 
-        if self.sensor3_mgrs_val != None and self.sensor3_grid_azimuth_val != None and self.sensor3_power_received_dBm_val != None:
-            # convert sensor 3 MGRS to coordinates
-            self.sensor3_coord = convert_mgrs_to_coords(self.sensor3_mgrs_val)
-            # clear sensor 3 distance field
-            self.sensor3_distance.configure(text='')
-            # calculate sensor 3 minimum distance (in km)
-            self.sensor3_min_distance_km = get_emission_distance(self.min_wattage_val,self.frequency_MHz_val,self.transmitter_gain_dBi_val,self.sensor3_receiver_gain_dBi,self.sensor3_power_received_dBm_val,self.transmitter_height_m_val,self.sensor3_receiver_height_m_val,self.temp_f_val,self.path_loss_coeff_val,weather_coeff=4/3,pure_pathLoss=True)
-            # convert sensor 3 minimum distance to meters
-            self.sensor3_min_distance_m = self.sensor3_min_distance_km * 1000
-            # calculate sensor 3 maximum distance (in km)    
-            self.sensor3_max_distance_km = get_emission_distance(self.max_wattage_val,self.frequency_MHz_val,self.transmitter_gain_dBi_val,self.sensor3_receiver_gain_dBi,self.sensor3_power_received_dBm_val,self.transmitter_height_m_val,self.sensor3_receiver_height_m_val,self.temp_f_val,self.path_loss_coeff_val,weather_coeff=4/3,pure_pathLoss=True)
-            # convert sensor 3 maximum distance to meters
-            self.sensor3_max_distance_m = self.sensor3_max_distance_km * 1000
-            # calculate sensor 3 LOB boundaries
-            sensor3_lob_center, sensor3_lob_near_right_coord, sensor3_lob_near_left_coord, sensor3_lob_near_middle_coord, sensor3_lob_far_right_coord, sensor3_lob_far_left_coord, sensor3_lob_far_middle_coord, sensor3_center_coord_list = get_coords_from_LOBs(self.sensor3_coord,self.sensor3_grid_azimuth_val,self.sensor3_error,self.sensor3_min_distance_m,self.sensor3_max_distance_m)
-            # define sensor 3 LOB polygon
-            self.sensor3_lob_polygon = [sensor3_lob_near_right_coord,sensor3_lob_far_right_coord,sensor3_lob_far_left_coord,sensor3_lob_near_left_coord]
-            # organize sensor 3 LOB polygon
-            self.sensor3_lob_polygon = organize_polygon_coords(self.sensor3_lob_polygon)
-            # define sensor 3 LOB backstop Line
-            self.sensor3_lob_backstop = get_line(sensor3_lob_far_right_coord,sensor3_lob_far_left_coord)
-            # define sensor 3 LOB center-line
-            lob3_center = get_line(self.sensor3_coord, sensor3_lob_far_middle_coord)
-            # define sensor 3 LOB right-bound error line
-            lob3_right_bound = get_line(sensor3_lob_near_right_coord, sensor3_lob_far_right_coord)
-            # define sensor 3 LOB left-bound error line
-            lob3_left_bound = get_line(sensor3_lob_near_left_coord, sensor3_lob_far_left_coord)
-        # if sensor 3 has None input values
-        else:
-            # set sensor 3 input values to None
-            self.sensor3_grid_azimuth_val = None; self.sensor3_power_received_dBm_val = None; self.sensor3_lob_polygon = None; self.sensor3_lob_backstop = None
-        # assess which LOBs have intersections
-        ewt1_ewt2_intersection_bool = check_for_intersection(self.sensor1_coord,sensor1_lob_far_middle_coord,self.sensor2_coord,sensor2_lob_far_middle_coord)
-        ewt2_ewt3_intersection_bool = check_for_intersection(self.sensor2_coord,sensor2_lob_far_middle_coord,self.sensor3_coord,sensor3_lob_far_middle_coord)
-        ewt1_ewt3_intersection_bool = check_for_intersection(self.sensor1_coord,sensor1_lob_far_middle_coord,self.sensor3_coord,sensor3_lob_far_middle_coord)
-        # EWT 1 & 2 CUT, EWT 3 LOB (TOTAL 1 CUT, 1 LOB)
-        if ewt1_ewt2_intersection_bool and not ewt2_ewt3_intersection_bool and not ewt1_ewt3_intersection_bool:
-            plot_lobs(sensor1_lob_near_middle_coord,sensor1_lob_far_middle_coord,sensor2_lob_near_middle_coord,sensor2_lob_far_middle_coord,sensor3_lob_near_middle_coord,sensor3_lob_far_middle_coord,False,False,True)
-            plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob2_center,lob2_right_bound,lob2_left_bound)
-        # EWT 2 & 3 CUT, EWT 1 LOB (TOTAL 1 CUT, 1 LOB)
-        elif not ewt1_ewt2_intersection_bool and ewt2_ewt3_intersection_bool and not ewt1_ewt3_intersection_bool:
-            plot_lobs(sensor1_lob_near_middle_coord,sensor1_lob_far_middle_coord,sensor2_lob_near_middle_coord,sensor2_lob_far_middle_coord,sensor3_lob_near_middle_coord,sensor3_lob_far_middle_coord,True,False,False)
-            plot_cut(lob2_center,lob2_right_bound,lob2_left_bound,lob3_center,lob3_right_bound,lob3_left_bound)
-        # EWT 1 & 3 CUT, EWT 2 LOB (TOTAL 1 CUT, 1 LOB)
-        elif not ewt1_ewt2_intersection_bool and not ewt2_ewt3_intersection_bool and ewt1_ewt3_intersection_bool:
-            plot_lobs(sensor1_lob_near_middle_coord,sensor1_lob_far_middle_coord,sensor2_lob_near_middle_coord,sensor2_lob_far_middle_coord,sensor3_lob_near_middle_coord,sensor3_lob_far_middle_coord,False,True,False)
-            plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob3_center,lob3_right_bound,lob3_left_bound)
-        # EWT 1 & 2 CUT, EWT 2 & 3 NO CUT, EWT 1 & 3 CUT (TOTAL 2 CUT)
-        elif ewt1_ewt2_intersection_bool and not ewt2_ewt3_intersection_bool and ewt1_ewt3_intersection_bool:
-            plot_lobs(sensor1_lob_near_middle_coord,sensor1_lob_far_middle_coord,sensor2_lob_near_middle_coord,sensor2_lob_far_middle_coord,sensor3_lob_near_middle_coord,sensor3_lob_far_middle_coord,False,False,False)
-            plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob2_center,lob2_right_bound,lob2_left_bound,True,True)
-            plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,True)
-        # EWT 1 & 2 CUT, EWT 2 & 3 CUT, EWT 1 & 3 NO CUT (TOTAL 2 CUT)
-        elif ewt1_ewt2_intersection_bool and ewt2_ewt3_intersection_bool and not ewt1_ewt3_intersection_bool:
-            plot_lobs(sensor1_lob_near_middle_coord,sensor1_lob_far_middle_coord,sensor2_lob_near_middle_coord,sensor2_lob_far_middle_coord,sensor3_lob_near_middle_coord,sensor3_lob_far_middle_coord,False,False,False)
-            plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob2_center,lob2_right_bound,lob2_left_bound,True,True)
-            plot_cut(lob2_center,lob2_right_bound,lob2_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,True) 
-        # EWT 1 & 2 NO CUT, EWT 2 & 3 CUT, EWT 1 & 3 CUT (TOTAL 2 CUT)
-        elif not ewt1_ewt2_intersection_bool and ewt2_ewt3_intersection_bool and ewt1_ewt3_intersection_bool:
-            plot_lobs(sensor1_lob_near_middle_coord,sensor1_lob_far_middle_coord,sensor2_lob_near_middle_coord,sensor2_lob_far_middle_coord,sensor3_lob_near_middle_coord,sensor3_lob_far_middle_coord,False,False,False)
-            plot_cut(lob2_center,lob2_right_bound,lob2_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,True)
-            plot_cut(lob1_center,lob1_right_bound,lob1_left_bound,lob3_center,lob3_right_bound,lob3_left_bound,True,True)
-        # No intersections between an EWT LOBs
-        elif not ewt1_ewt2_intersection_bool and not ewt2_ewt3_intersection_bool and not ewt1_ewt3_intersection_bool:
-            plot_lobs(sensor1_lob_near_middle_coord,sensor1_lob_far_middle_coord,sensor2_lob_near_middle_coord,sensor2_lob_far_middle_coord,sensor3_lob_near_middle_coord,sensor3_lob_far_middle_coord,True,True,True)
-            pass
-        # EWT 1, 2, & 3 INTERSECTION (TOTAL 1 FIX, 3 CUT)
-        elif ewt1_ewt2_intersection_bool and ewt2_ewt3_intersection_bool and ewt1_ewt3_intersection_bool:
-            plot_lobs(sensor1_lob_near_middle_coord,sensor1_lob_far_middle_coord,sensor2_lob_near_middle_coord,sensor2_lob_far_middle_coord,sensor3_lob_near_middle_coord,sensor3_lob_far_middle_coord,False,False,False)
-            plot_fix(lob1_center,lob1_right_bound,lob1_left_bound,lob2_center,lob2_right_bound,lob2_left_bound,lob3_center,lob3_right_bound,lob3_left_bound)
-        # Unexpected situation
-        else:
-            self.logger_gui.error(f"Unexpected situation with EWTs: {self.sensor1_mgrs_val}, {self.sensor2_mgrs_val}, {self.sensor3_mgrs_val}")
+        # collect the LOB report (or sensor position) and distance band of every EWT for the targeting engine
+        reports = []; distance_bands_km = []
+        for n in (1,2,3):
+            # if sensor n has None input values
+            if getattr(self,f'sensor{n}_mgrs_val') == None or getattr(self,f'sensor{n}_grid_azimuth_val') == None or getattr(self,f'sensor{n}_power_received_dBm_val') == None:
+                setattr(self,f'sensor{n}_grid_azimuth_val',None); setattr(self,f'sensor{n}_power_received_dBm_val',None)
+                # an EWT with only a grid is a sensor position
+                reports.append(None if getattr(self,f'sensor{n}_mgrs_val') == None else {'coord': convert_mgrs_to_coords(getattr(self,f'sensor{n}_mgrs_val'))})
+                distance_bands_km.append(None)
+                continue
+            # convert sensor n MGRS to coordinates
+            setattr(self,f'sensor{n}_coord',convert_mgrs_to_coords(getattr(self,f'sensor{n}_mgrs_val')))
+            # clear sensor n distance
+            getattr(self,f'sensor{n}_distance').configure(text='')
+            report = self._get_lob_report(n)
+            # calculate minimum and maximum distance from sensor n to TGT (in km)
+            min_distance_km, max_distance_km = get_lob_distance_band(report,self.frequency_MHz_val,self.min_wattage_val,self.max_wattage_val,self.transmitter_gain_dBi_val,self.transmitter_height_m_val,self.temp_f_val,self.path_loss_coeff_val)
+            # refine sensor n distances with the terrain propagation model
+            min_distance_km, max_distance_km = self._get_terrain_distance_band(report['coord'],report['bearing'],report['receiver_gain_dBi'],report['power_received_dBm'],report['receiver_height_m'],min_distance_km,max_distance_km)
+            setattr(self,f'sensor{n}_min_distance_km',min_distance_km); setattr(self,f'sensor{n}_max_distance_km',max_distance_km)
+            setattr(self,f'sensor{n}_min_distance_m',min_distance_km*1000); setattr(self,f'sensor{n}_max_distance_m',max_distance_km*1000)
+            reports.append(report); distance_bands_km.append((min_distance_km,max_distance_km))
+        # calculate the LOB, CUT and FIX targets with the targeting engine
+        targets = get_targets(reports,self.frequency_MHz_val,self.min_wattage_val,self.max_wattage_val,self.transmitter_gain_dBi_val,self.transmitter_height_m_val,self.temp_f_val,self.path_loss_coeff_val,
+                              distance_bands_km,bayesian_fallback=self.probability_surface == 'Bayesian Grid')
+        lob1, lob2, lob3 = targets['lobs']
+        for n, lob in zip((1,2,3),targets['lobs']):
+            setattr(self,f'sensor{n}_lob_polygon',None if lob is None else lob['polygon'])
+            setattr(self,f'sensor{n}_lob_backstop',None if lob is None else lob['backstop'])
+        lob_markers = [any(target['marker'] for target in targets['targets'] if target['class'] == 'LOB' and target['reports'] == [n]) for n in range(3)]
+        cuts = [target for target in targets['targets'] if target['class'] == 'CUT']
+        fix = next((target for target in targets['targets'] if target['class'] == 'FIX'), None)
+        # plot the LOBs, then the CUTs and FIX
+        plot_lobs(lob1,lob2,lob3,*lob_markers)
+        for cut in cuts: plot_cut(cut)
+        if fix is not None: plot_fix(fix)
+        if targets['target_class'] in ('CUT','FIX'):
+            # define target classification
+            self.target_class = f"({targets['target_class']})"
+            # set target label with updated target classification
+            self.label_target_grid.configure(text=f'TARGET GRID {self.target_class}'.strip(),text_color='red')
+            self.target_coord = targets['target_coord']
+            self.target_mgrs = targets['target_mgrs']
+            self.target_error_val = targets['target_error_acres']
+            # set the EWT distances and bearings to the target
+            for n, distance_m, bearing_deg in zip((1,2,3),targets['distances_m'],targets['bearings_deg']):
+                if distance_m is None: continue
+                setattr(self,f'sensor{n}_distance_val',distance_m); setattr(self,f'sensor{n}_bearing_val',bearing_deg)
+                getattr(self,f'sensor{n}_distance').configure(text=self._generate_sensor_distance_text(distance_m,bearing_deg),text_color='white')
+            # set target grid and error fields
+            if targets['target_class'] == 'CUT' and len(cuts) > 1:
+                self.target_grid.configure(text="MULTIPLE CUTS")
+                self.target_error.configure(text="MULTIPLE CUTS")
+            else:
+                self.target_grid.configure(text=f'{format_readable_mgrs(self.target_mgrs)}',text_color='yellow')
+                self.target_error.configure(text=f'{self.target_error_val:,.0f} acres',text_color='white')
+            # set map position at the target
+            self.map_widget.set_position(self.target_coord[0],self.target_coord[1])
+            self.MAP_POSITIION = (self.target_coord[0],self.target_coord[1])
+        # plot the target probability surface
+        self.plot_probability_surface(targets['surface'])
         self.set_target_field()
       
     def log_target_data(self) -> None:
@@ -3377,6 +3185,9 @@ class App(customtkinter.CTk):
         for fix in self.fix_list:
             fix.delete()
         self.fix_list = []
+        for probability_region in self.probability_list:
+            probability_region.delete()
+        self.probability_list = []
         if not bool_bypass_log: self.logger_gui.info(f"Cleared all target overlays from the map and tracker lists.")
 
     def clear_ewts(self, bool_bypass_log: bool = False) -> None:
@@ -3545,6 +3356,9 @@ class App(customtkinter.CTk):
         elif "FIX" in polygon.data:
             msgBox_title = "FIX"
             msgBox = CTkMessagebox(title=msgBox_title, message=polygon.data, icon='info',options=['Acknowledge','Remove'])
+        elif "Probability Region" in polygon.data:
+            msgBox_title = "Probability Region"
+            msgBox = CTkMessagebox(title=msgBox_title, message=polygon.data, icon='info',options=['Acknowledge','Remove'])
         else:
             msgBox_title = "Unknown Polygon"
             msgBox = CTkMessagebox(title=msgBox_title, message=polygon.data, icon='info',options=['Acknowledge','Remove'])
@@ -3561,6 +3375,9 @@ class App(customtkinter.CTk):
             elif msgBox_title == "FIX":
                 self.fix_list.remove(polygon)
                 self.logger_gui.info(f"FIX Polygon removed from the map and tracker list.")
+            elif msgBox_title == "Probability Region":
+                self.probability_list.remove(polygon)
+                self.logger_gui.info(f"Probability Region Polygon removed from the map and tracker list.")
             # delete polygon from map
             polygon.delete()
 
@@ -3605,6 +3422,18 @@ class App(customtkinter.CTk):
 
     def change_path_loss(self, path_loss_description: str) -> None:
         self.path_loss_coeff = App.PATH_LOSS_DICT.get(path_loss_description,4)
+
+    def change_terrain_mask(self, terrain_mask: str) -> None:
+        self.terrain_mask = terrain_mask
+        self.logger_gui.info(f"LOB terrain mask changed to: {terrain_mask}")
+
+    def change_propagation_model(self, propagation_model: str) -> None:
+        self.propagation_model = propagation_model
+        self.logger_gui.info(f"LOB propagation model changed to: {propagation_model}")
+
+    def change_probability_surface(self, probability_surface: str) -> None:
+        self.probability_surface = probability_surface
+        self.logger_gui.info(f"Target probability surface changed to: {probability_surface}")
     
     def get_pathloss_description_from_coeff(self,coeff: float) -> dict[str,str]:
         reversed_dict = {str(value): str(key) for key, value in App.PATH_LOSS_DICT.items()}
@@ -3693,6 +3522,12 @@ class App(customtkinter.CTk):
             if not self._check_if_object_in_object_list(map_object,self.fix_list):
                 # append the FIX to the FIX list
                 self.fix_list.append(map_object)
+        # check if map object is a probability region
+        elif map_object_list_name.upper() == 'PROB':
+            # check if probability region already exists in the probability region list
+            if not self._check_if_object_in_object_list(map_object,self.probability_list):
+                # append the probability region to the probability region list
+                self.probability_list.append(map_object)
 
     def _check_if_object_in_object_list(self,map_object,map_object_list):
         map_object_data = map_object.data
@@ -3704,6 +3539,119 @@ class App(customtkinter.CTk):
         else:
             return False
 
+    def _get_terrain_masked_lob(self,
+                                sensor_coord: list[float],
+                                lob_polygon: list[list[float]],
+                                sensor_height_m: float,
+                                lob_error_acres: float
+                                ) -> tuple[list, list, float]:
+        """Split a LOB area into the terrain visible from its sensor and the terrain hidden from it; returns both sets of polygons and the visible acres (None if masking is off or unavailable)."""
+        if self.terrain_mask == 'Off' or lob_polygon is None: return [], [], None
+        from map import get_terrain_masked_polygons
+        frequency_MHz = self.frequency_MHz_val if self.terrain_mask == 'Fresnel Zone' else None
+        try:
+            visible_polygons, hidden_polygons, visible_fraction = get_terrain_masked_polygons(sensor_coord,lob_polygon,sensor_height_m,self.transmitter_height_m_val,frequency_MHz)
+        except FileNotFoundError as e:
+            self.logger_gui.warning(f"LOB terrain mask unavailable: {e}")
+            return [], [], None
+        return visible_polygons, hidden_polygons, lob_error_acres*visible_fraction
+
+    def _plot_terrain_masked_lob(self,
+                                 visible_polygons: list,
+                                 hidden_polygons: list,
+                                 lob_description: str
+                                 ) -> None:
+        """Draw the visible parts of a LOB area filled and the hidden parts in outline; together they tile the LOB area."""
+        for visible_polygon in visible_polygons:
+            visible_area = self.map_widget.set_polygon(
+                position_list=visible_polygon,
+                fill_color=App.DEFAULT_VALUES['LOB Fill Color'],
+                outline_color=App.DEFAULT_VALUES['LOB Area Outline Color'],
+                border_width=App.DEFAULT_VALUES['Border Width'],
+                command=self.polygon_click,
+                data="LOB Terrain-Masked Area\n"+lob_description)
+            self._append_object(visible_area,"LOB")
+        for hidden_polygon in hidden_polygons:
+            hidden_area = self.map_widget.set_polygon(
+                position_list=hidden_polygon,
+                fill_color=None,
+                outline_color=App.DEFAULT_VALUES['LOB Area Outline Color'],
+                border_width=App.DEFAULT_VALUES['Border Width'],
+                command=self.polygon_click,
+                data="LOB Terrain-Hidden Area\n"+lob_description)
+            self._append_object(hidden_area,"LOB")
+
+    def _get_probability_sensors(self) -> list[dict]:
+        """Collect the EWTs with a complete LOB as inputs for the probability surface."""
+        sensors = []
+        for n in (1,2,3):
+            if getattr(self,f'sensor{n}_lob_polygon') is None or getattr(self,f'sensor{n}_grid_azimuth_val') is None or getattr(self,f'sensor{n}_power_received_dBm_val') is None: continue
+            sensors.append(self._get_lob_report(n))
+        return sensors
+
+    def _get_lob_report(self, n: int) -> dict:
+        """Collect the LOB report of EWT n as an input for the targeting engine."""
+        return {
+            'coord': getattr(self,f'sensor{n}_coord'),
+            'bearing': getattr(self,f'sensor{n}_grid_azimuth_val'),
+            'bearing_error': getattr(self,f'sensor{n}_error'),
+            'power_received_dBm': getattr(self,f'sensor{n}_power_received_dBm_val'),
+            'receiver_gain_dBi': getattr(self,f'sensor{n}_receiver_gain_dBi'),
+            'receiver_height_m': getattr(self,f'sensor{n}_receiver_height_m_val')
+        }
+
+    def plot_probability_surface(self, bayesian_surface: dict = None) -> None:
+        """Plot the credible regions of the target probability surface and save its heatmap overlay; a Bayesian surface the FIX fallback already solved is reused."""
+        if self.probability_surface == 'Off': return
+        from coords import convert_coords_to_mgrs, format_readable_mgrs
+        from probability import PROBABILITY_CREDIBLE_LEVELS, get_bayesian_probability_surface, get_credible_region_polygons, get_monte_carlo_probability_surface, get_probability_overlay_filename, save_probability_overlay
+        sensors = self._get_probability_sensors()
+        if not sensors: return
+        if self.probability_surface == 'Bayesian Grid':
+            surface = bayesian_surface or get_bayesian_probability_surface(sensors,self.frequency_MHz_val,self.min_wattage_val,self.max_wattage_val,self.transmitter_gain_dBi_val,self.path_loss_coeff_val)
+            surface['num_samples'] = surface['density'].size
+        else:
+            surface = get_monte_carlo_probability_surface(sensors,self.frequency_MHz_val,self.min_wattage_val,self.max_wattage_val,self.transmitter_gain_dBi_val,self.path_loss_coeff_val)
+        if not surface['consistent']:
+            self.logger_gui.warning(f"The {len(sensors)} EWT LOBs do not overlap; the probability surface shows each LOB separately")
+        # draw the credible regions outermost first, in heatmap colors
+        for level, color in zip(PROBABILITY_CREDIBLE_LEVELS,['yellow','orange','red']):
+            region_polygons, region_acres = get_credible_region_polygons(surface,level)
+            for region_polygon in region_polygons:
+                probability_region = self.map_widget.set_polygon(
+                    position_list=region_polygon,
+                    fill_color=color,
+                    outline_color=color,
+                    border_width=1,
+                    command=self.polygon_click,
+                    data=f"Probability Region\n{level:.0%} credible region of a {self.probability_surface} surface from {len(sensors)} EWT(s): {region_acres:,.0f} acres, most likely at {format_readable_mgrs(convert_coords_to_mgrs(surface['peak_coord']))}")
+                self._append_object(probability_region,"PROB")
+        overlay_path = save_probability_overlay(surface['density'],surface['bounds'],get_probability_overlay_filename())
+        self.logger_gui.info(f"{self.probability_surface} probability surface from {surface['num_samples']:,} {'cells' if self.probability_surface == 'Bayesian Grid' else 'samples'} peaks at {format_readable_mgrs(convert_coords_to_mgrs(surface['peak_coord']))}; heatmap saved to {overlay_path}")
+
+    def _get_terrain_distance_band(self,
+                                   sensor_coord: list[float],
+                                   azimuth: float,
+                                   receiver_gain_dBi: float,
+                                   power_received_dBm: float,
+                                   receiver_height_m: float,
+                                   min_distance_km: float,
+                                   max_distance_km: float
+                                   ) -> tuple[float, float]:
+        """Solve the LOB distance band with the knife-edge terrain model; returns the log-distance band if the model is off, unavailable or finds no match."""
+        if self.propagation_model != 'Knife-Edge Terrain': return min_distance_km, max_distance_km
+        from dted import get_lob_distance_band
+        try:
+            band = get_lob_distance_band(sensor_coord,azimuth,self.frequency_MHz_val,self.min_wattage_val,self.max_wattage_val,self.transmitter_gain_dBi_val,receiver_gain_dBi,power_received_dBm,receiver_height_m,self.transmitter_height_m_val)
+        except FileNotFoundError as e:
+            self.logger_gui.warning(f"Knife-edge terrain model unavailable: {e}")
+            return min_distance_km, max_distance_km
+        if band['min_distance_m'] is None:
+            self.logger_gui.warning(f"Knife-edge terrain model found no range matching {power_received_dBm} dBm at bearing {int(azimuth)}°")
+            return min_distance_km, max_distance_km
+        self.logger_gui.info(f"Knife-edge terrain model distance band at bearing {int(azimuth)}°: {self._generate_sensor_distance_text(band['min_distance_m'])} to {self._generate_sensor_distance_text(band['max_distance_m'])}")
+        return band['min_distance_m']/1000, max(band['max_distance_m'],band['min_distance_m']+10)/1000
+
     def _generate_sensor_distance_text(self,
                                        distance : float,
                                        bearing: int = None
@@ -3788,18 +3736,39 @@ class App(customtkinter.CTk):
         except TclError:
             entry_object.insert('end', self.selection_get(selection='CLIPBOARD'))
 
-    def _safe_plot_callback(self,elevation_data, sensor_coord, nearside_km, target_coord, farside_km):
-        from dted import plot_elevation_profile
-        plot_elevation_profile(elevation_data, sensor_coord, nearside_km, target_coord, farside_km)
+    def _safe_plot_callback(self,elevation_data, sensor_coord, nearside_km, target_coord, farside_km, sensor_height_m=2):
+        from dted import DTEDTileCache, plot_elevation_profile
+        plot_elevation_profile(elevation_data, sensor_coord, nearside_km, target_coord, farside_km, self.frequency_MHz_val, sensor_height_m, self.transmitter_height_m_val)
         self.logger_gui.info(f"Elevation Profile Plotted.")
+        cache_stats = DTEDTileCache.get_stats()
+        self.logger_gui.info(f"DTED tile cache: {cache_stats['tiles']} tiles ({cache_stats['bytes']/1048576:,.1f} of {cache_stats['max_bytes']/1048576:,.0f} MB), {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['evictions']} evictions")
 
     def _show_info(self,msg,box_title: str ='Warning Message',icon: str ='warning') -> None:
         from CTkMessagebox import CTkMessagebox
         CTkMessagebox(title=box_title, message=msg, icon=icon,option_1='Ackowledged')
 
+    def _prefetch_dted(self) -> None:
+        """Queue the DTED cells around the map position and active EWTs for background loading, then reschedule."""
+        from dted import DTEDPrefetcher
+        from coords import convert_mgrs_to_coords
+        coords = [self.map_widget.get_position(), self.MAP_POSITIION]
+        for sensor_mgrs in [self.sensor1_mgrs.get(), self.sensor2_mgrs.get(), self.sensor3_mgrs.get()]:
+            try:
+                coords.append(convert_mgrs_to_coords(sensor_mgrs) if sensor_mgrs.strip() else None)
+            except Exception:
+                # partially typed MGRS
+                pass
+        try:
+            DTEDPrefetcher.prefetch(coords)
+        except Exception as e:
+            self.logger_gui.warning(f"DTED prefetch failed: {e}")
+        self.after(App.DTED_PREFETCH_INTERVAL_MS, self._prefetch_dted)
+
     def destroy(self):
         self.logger_gui.info("Application closing")
         LoggerManager.clear_cache()
+        from dted import DTEDPrefetcher
+        DTEDPrefetcher.shutdown()
         super().destroy()
 
     def on_closing(self):
@@ -0,0 +1,444 @@
+import os
+from datetime import datetime
+
+import numpy as np
+
+from coords import get_geodesic_destinations, get_geodesic_inverse
+from map import SQUARE_METERS_PER_ACRE
+
+EARTH_RADIUS_M = 6371000.0
+# probability grid cells along the longer side of the surface
+PROBABILITY_GRID_SIZE = 200
+# highest-density regions drawn on the map, innermost last
+PROBABILITY_CREDIBLE_LEVELS = (0.95, 0.8, 0.5)
+# Monte Carlo samples per EWT
+MONTE_CARLO_SAMPLES = 100_000
+# farthest emitter range considered by the grid-likelihood solver
+BAYESIAN_MAX_RANGE_M = 100000
+# credible region returned with a grid-likelihood fix
+BAYESIAN_CREDIBLE_LEVEL = 0.9
+
+
+def sample_lob_emitter_locations(
+    sensor_coord: list[float],
+    bearing: float,
+    bearing_error: float,
+    power_received_dBm: float,
+    receiver_gain_dBi: float,
+    frequency_MHz: float,
+    min_P_t_watts: float,
+    max_P_t_watts: float,
+    G_t: float = 0,
+    path_loss_coeff: float = 4,
+    path_loss_coeff_spread: float = 0.5,
+    power_noise_dB: float = 2.0,
+    num_samples: int = MONTE_CARLO_SAMPLES,
+    rng: np.random.Generator = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Draws Monte Carlo emitter locations for one EWT LOB.
+
+    ERP is sampled uniformly in dBm between the minimum and maximum ERP, the
+    path-loss coefficient uniformly within +/- path_loss_coeff_spread (never
+    below free space), the bearing from a normal distribution whose +/-
+    bearing_error wedge (the sensor error) holds about 95% of the samples, and
+    the received power with normal noise of power_noise_dB. Every sample is
+    pushed through the ew.py log-distance model and projected from the sensor.
+
+    Returns:
+        tuple: (lats, lons) arrays of num_samples emitter locations.
+    """
+    from ew import convert_watts_to_dBm_array, get_emission_distance_array
+    assert 0 < min_P_t_watts <= max_P_t_watts, "Transmitter power range must be positive and ordered."
+    rng = np.random.default_rng() if rng is None else rng
+    erp_dBm = rng.uniform(*convert_watts_to_dBm_array([min_P_t_watts, max_P_t_watts]), num_samples)
+    erp_watts = 10 ** (erp_dBm / 10) / 1000
+    path_loss_coeffs = np.maximum(rng.uniform(path_loss_coeff - path_loss_coeff_spread, path_loss_coeff + path_loss_coeff_spread, num_samples), 2)
+    bearings = (bearing + rng.normal(0, bearing_error / 2, num_samples)) % 360
+    received_power_dBm = power_received_dBm + rng.normal(0, power_noise_dB, num_samples)
+    distances_km = get_emission_distance_array(
+        erp_watts, frequency_MHz, G_t, receiver_gain_dBi, received_power_dBm,
+        0, 0, 0, path_loss_coeffs, pure_pathLoss=True
+    )
+    return get_geodesic_destinations(sensor_coord[0], sensor_coord[1], bearings, distances_km * 1000, 'sphere')
+
+
+def _gaussian_smoothing_matrix(size: int, sigma_cells: float) -> np.ndarray:
+    offsets = np.arange(size)
+    weights = np.exp(-0.5 * ((offsets[:, None] - offsets[None, :]) / sigma_cells) ** 2)
+    return weights / weights.sum(axis=0, keepdims=True)
+
+
+def _get_grid(bounds: tuple[float, float, float, float], grid_size: int) -> tuple[int, int, tuple, float]:
+    """Returns (rows, cols, bounds, cell_m) of a grid of square cells covering the bounds (south, west, north, east)."""
+    south, west, north, east = bounds
+    meters_per_degree = np.radians(1) * EARTH_RADIUS_M
+    cos_lat = np.cos(np.radians((north + south) / 2))
+    height_m = max((north - south) * meters_per_degree, 1.0)
+    width_m = max((east - west) * meters_per_degree * cos_lat, 1.0)
+    cell_m = max(height_m, width_m) / grid_size
+    rows = max(int(np.ceil(height_m / cell_m)), 1)
+    cols = max(int(np.ceil(width_m / cell_m)), 1)
+    north = south + rows * cell_m / meters_per_degree
+    east = west + cols * cell_m / (meters_per_degree * cos_lat)
+    return rows, cols, (float(south), float(west), float(north), float(east)), cell_m
+
+
+def _get_grid_centers(rows: int, cols: int, bounds: tuple[float, float, float, float]) -> tuple[np.ndarray, np.ndarray]:
+    """Returns north-up (rows, cols) arrays of the cell center latitudes and longitudes."""
+    south, west, north, east = bounds
+    lats = north - (np.arange(rows) + 0.5) * (north - south) / rows
+    lons = west + (np.arange(cols) + 0.5) * (east - west) / cols
+    return np.broadcast_to(lats[:, None], (rows, cols)), np.broadcast_to(lons[None, :], (rows, cols))
+
+
+def _get_credible_bounds(density: np.ndarray, bounds: tuple[float, float, float, float], level: float) -> tuple:
+    """Returns the bounds of the credible region of a surface, padded by a cell on every side."""
+    south, west, north, east = bounds
+    rows, cols = density.shape
+    row_index, col_index = np.nonzero(get_credible_region_mask(density, level))
+    cell_lat = (north - south) / rows
+    cell_lon = (east - west) / cols
+    return (
+        north - (row_index.max() + 2) * cell_lat, west + (col_index.min() - 1) * cell_lon,
+        north - (row_index.min() - 1) * cell_lat, west + (col_index.max() + 2) * cell_lon,
+    )
+
+
+def _get_peak_coord(density: np.ndarray, bounds: tuple[float, float, float, float]) -> list[float]:
+    """Returns the [lat, lon] center of the most probable cell of a north-up surface."""
+    south, west, north, east = bounds
+    rows, cols = density.shape
+    peak_row, peak_col = np.unravel_index(np.argmax(density), density.shape)
+    return [
+        float(north - (peak_row + 0.5) * (north - south) / rows),
+        float(west + (peak_col + 0.5) * (east - west) / cols),
+    ]
+
+
+def _bin_samples(
+    sample_sets: list[tuple[np.ndarray, np.ndarray]],
+    bounds: tuple[float, float, float, float],
+    grid_size: int,
+    smoothing_cells: float,
+    combine: str
+) -> dict:
+    """Histograms each set of samples on a grid of square cells over the bounds, smooths them and combines them ("product" or "sum")."""
+    rows, cols, (south, west, north, east), cell_m = _get_grid(bounds, grid_size)
+    densities = []
+    for lats, lons in sample_sets:
+        histogram, _, _ = np.histogram2d(lats, lons, bins=[rows, cols], range=[[south, north], [west, east]])
+        if smoothing_cells > 0:
+            # Scott's rule bandwidth of the samples on the grid, never below smoothing_cells
+            row_counts, col_counts = histogram.sum(axis=1), histogram.sum(axis=0)
+            num_inside = max(histogram.sum(), 1.0)
+            row_std = np.sqrt(np.sum(row_counts * (np.arange(rows) - np.sum(row_counts * np.arange(rows)) / num_inside) ** 2) / num_inside)
+            col_std = np.sqrt(np.sum(col_counts * (np.arange(cols) - np.sum(col_counts * np.arange(cols)) / num_inside) ** 2) / num_inside)
+            histogram = (
+                _gaussian_smoothing_matrix(rows, max(smoothing_cells, row_std * num_inside ** (-1 / 6)))
+                @ histogram @
+                _gaussian_smoothing_matrix(cols, max(smoothing_cells, col_std * num_inside ** (-1 / 6))).T
+            )
+        densities.append(histogram / max(histogram.sum(), 1e-300))
+    density = np.prod(densities, axis=0) if combine == "product" else np.sum(densities, axis=0)
+    return {
+        "density": np.flipud(density),
+        "bounds": (south, west, north, east),
+        "cell_area_m2": float(cell_m ** 2),
+    }
+
+
+def get_probability_surface(
+    sample_sets: list[tuple[np.ndarray, np.ndarray]],
+    grid_size: int = PROBABILITY_GRID_SIZE,
+    smoothing_cells: float = 1.5
+) -> dict:
+    """
+    Bins emitter location samples into a 2D probability surface.
+
+    Each EWT's samples are histogrammed on a common grid of square cells,
+    smoothed, and multiplied together, since all of them locate the same
+    emitter. The grid first covers the overlap of the EWTs' sample clouds and
+    is then rebuilt around the region holding nearly all of the probability,
+    so a small overlap is still resolved finely. When the clouds do not
+    overlap the surface is the sum of the EWTs' densities over their union.
+
+    Args:
+        sample_sets (list): One (lats, lons) pair of sample arrays per EWT.
+        grid_size (int): Number of cells along the longer side of the grid.
+        smoothing_cells (float): Minimum Gaussian smoothing radius (sigma) in cells; the radius
+            otherwise follows Scott's rule for the samples on the grid. 0 disables smoothing.
+
+    Returns:
+        dict: "density" (north-up array summing to 1), "bounds" (south, west, north, east),
+            "cell_area_m2", "peak_coord" [lat, lon] and "consistent" (False when the EWTs disagree).
+    """
+    assert sample_sets, "At least one set of samples is required."
+    # robust bounds of each cloud, ignoring the extreme tails
+    cloud_bounds = np.array([
+        [*np.percentile(lats, [0.5, 99.5]), *np.percentile(lons, [0.5, 99.5])]
+        for lats, lons in sample_sets
+    ])
+    south, north = cloud_bounds[:, 0].max(), cloud_bounds[:, 1].min()
+    west, east = cloud_bounds[:, 2].max(), cloud_bounds[:, 3].min()
+    consistent = bool(south < north and west < east)
+    surface = None
+    if consistent:
+        surface = _bin_samples(sample_sets, (south, west, north, east), grid_size, smoothing_cells, "product")
+        consistent = surface["density"].sum() > 0
+    if consistent and len(sample_sets) > 1:
+        # zoom in on the cells that hold nearly all of the joint probability
+        zoomed_bounds = _get_credible_bounds(surface["density"], surface["bounds"], 0.999)
+        zoomed = _bin_samples(sample_sets, zoomed_bounds, grid_size, smoothing_cells, "product")
+        if zoomed["density"].sum() > 0:
+            surface = zoomed
+    if not consistent:
+        union_bounds = (cloud_bounds[:, 0].min(), cloud_bounds[:, 2].min(), cloud_bounds[:, 1].max(), cloud_bounds[:, 3].max())
+        surface = _bin_samples(sample_sets, union_bounds, grid_size, smoothing_cells, "sum")
+    density = surface["density"] / max(surface["density"].sum(), 1e-300)
+    return {
+        "density": density,
+        "bounds": surface["bounds"],
+        "cell_area_m2": surface["cell_area_m2"],
+        "peak_coord": _get_peak_coord(density, surface["bounds"]),
+        "consistent": bool(consistent),
+    }
+
+
+def get_monte_carlo_probability_surface(
+    sensors: list[dict],
+    frequency_MHz: float,
+    min_P_t_watts: float,
+    max_P_t_watts: float,
+    G_t: float = 0,
+    path_loss_coeff: float = 4,
+    path_loss_coeff_spread: float = 0.5,
+    power_noise_dB: float = 2.0,
+    num_samples: int = MONTE_CARLO_SAMPLES,
+    grid_size: int = PROBABILITY_GRID_SIZE,
+    seed: int = None
+) -> dict:
+    """
+    Returns the Monte Carlo probability surface of the emitter location for 1, 2 or 3 EWTs.
+
+    Args:
+        sensors (list[dict]): One dict per EWT with "coord" [lat, lon], "bearing",
+            "bearing_error" (sensor error in degrees), "power_received_dBm" and
+            "receiver_gain_dBi".
+        frequency_MHz (float): Emitter frequency.
+        min_P_t_watts (float): Minimum ERP in watts.
+        max_P_t_watts (float): Maximum ERP in watts.
+        G_t (float): Transmitter antenna gain in dBi.
+        path_loss_coeff (float): Center of the sampled path-loss coefficients.
+        path_loss_coeff_spread (float): Half-width of the sampled path-loss coefficients.
+        power_noise_dB (float): Standard deviation of the received-power noise.
+        num_samples (int): Samples per EWT.
+        grid_size (int): Number of cells along the longer side of the grid.
+        seed (int, optional): Random seed for repeatable surfaces.
+
+    Returns:
+        dict: The get_probability_surface result, plus "num_samples" in total.
+    """
+    assert 1 <= len(sensors) <= 3, "Between 1 and 3 EWTs are required."
+    rng = np.random.default_rng(seed)
+    sample_sets = [
+        sample_lob_emitter_locations(
+            sensor["coord"], sensor["bearing"], sensor["bearing_error"], sensor["power_received_dBm"],
+            sensor["receiver_gain_dBi"], frequency_MHz, min_P_t_watts, max_P_t_watts, G_t,
+            path_loss_coeff, path_loss_coeff_spread, power_noise_dB, num_samples, rng
+        )
+        for sensor in sensors
+    ]
+    surface = get_probability_surface(sample_sets, grid_size)
+    surface["num_samples"] = num_samples * len(sensors)
+    return surface
+
+
+def _normal_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (Abramowitz and Stegun 7.1.26 erf, absolute error below 1.5e-7)."""
+    z = np.abs(x) / np.sqrt(2)
+    t = 1 / (1 + 0.3275911 * z)
+    erf = 1 - t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429)))) * np.exp(-z ** 2)
+    return 0.5 * (1 + np.sign(x) * erf)
+
+
+def _get_log_likelihood(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    sensors: list[dict],
+    frequency_MHz: float,
+    min_P_t_watts: float,
+    max_P_t_watts: float,
+    G_t: float,
+    path_loss_coeff: float,
+    path_loss_coeff_spread: float,
+    power_noise_dB: float
+) -> np.ndarray:
+    """Returns the summed bearing and received-power log likelihoods of every grid cell."""
+    from ew import convert_watts_to_dBm_array, theoretical_received_power
+    min_erp_dBm, max_erp_dBm = convert_watts_to_dBm_array([min_P_t_watts, max_P_t_watts])
+    log_likelihood = np.zeros(lats.shape)
+    for sensor in sensors:
+        # bearing: normal error whose +/- sensor error wedge holds about 95% of the probability
+        bearing_sigma = max(sensor["bearing_error"], 0.1) / 2
+        bearings, distances_m = get_geodesic_inverse(sensor["coord"][0], sensor["coord"][1], lats, lons, 'sphere')
+        bearing_offset = (bearings - sensor["bearing"] + 180) % 360 - 180
+        log_likelihood -= 0.5 * (bearing_offset / bearing_sigma) ** 2
+        # received power: uniform ERP between its bounds, blurred by the measurement noise and the path-loss coefficient spread
+        distances_km = np.maximum(distances_m / 1000, 1e-3)
+        # received power of a 1 mW (0 dBm) ERP, offset by the ERP bounds below
+        predicted_dBm = theoretical_received_power(1e-3, frequency_MHz, G_t, sensor["receiver_gain_dBi"], distances_km, path_loss_coeff)
+        # the path loss per unit of path-loss coefficient spreads the prediction
+        distance_loss_dB = 10 * (np.log10(frequency_MHz) + np.log10(distances_km))
+        power_sigma = np.sqrt(power_noise_dB ** 2 + (distance_loss_dB * path_loss_coeff_spread) ** 2 / 3)
+        power_sigma = np.maximum(power_sigma, 0.1)
+        upper = (sensor["power_received_dBm"] - (predicted_dBm + min_erp_dBm)) / power_sigma
+        lower = (sensor["power_received_dBm"] - (predicted_dBm + max_erp_dBm)) / power_sigma
+        erp_width = max_erp_dBm - min_erp_dBm
+        if erp_width > 1e-6:
+            power_likelihood = (_normal_cdf(upper) - _normal_cdf(lower)) / erp_width
+        else:
+            power_likelihood = np.exp(-0.5 * upper ** 2) / power_sigma
+        log_likelihood += np.log(np.maximum(power_likelihood, 1e-300))
+    return log_likelihood
+
+
+def get_bayesian_probability_surface(
+    sensors: list[dict],
+    frequency_MHz: float,
+    min_P_t_watts: float,
+    max_P_t_watts: float,
+    G_t: float = 0,
+    path_loss_coeff: float = 4,
+    path_loss_coeff_spread: float = 0.5,
+    power_noise_dB: float = 2.0,
+    grid_size: int = PROBABILITY_GRID_SIZE,
+    credible_level: float = BAYESIAN_CREDIBLE_LEVEL
+) -> dict:
+    """
+    Returns the grid-likelihood (Bayesian) fix of the emitter location for any number of LOBs.
+
+    Every cell of a local grid around the EWTs gets the product of each EWT's
+    bearing likelihood (normal, from the sensor error) and received-power
+    likelihood (the ew.py log-distance model with ERP uniform in dBm between
+    its bounds, measurement noise and path-loss coefficient spread) under a
+    uniform prior. The grid first covers the overlap of the LOB wedges (or their
+    union when they do not overlap) and is then rebuilt around the credible
+    region, so there is always a MAP estimate, even for a single LOB or LOBs
+    that never cross.
+
+    Args:
+        sensors (list[dict]): One dict per LOB with "coord" [lat, lon], "bearing",
+            "bearing_error" (sensor error in degrees), "power_received_dBm" and
+            "receiver_gain_dBi".
+        frequency_MHz (float): Emitter frequency.
+        min_P_t_watts (float): Minimum ERP in watts.
+        max_P_t_watts (float): Maximum ERP in watts.
+        G_t (float): Transmitter antenna gain in dBi.
+        path_loss_coeff (float): Path-loss coefficient.
+        path_loss_coeff_spread (float): Half-width of the uniform uncertainty in the path-loss coefficient.
+        power_noise_dB (float): Standard deviation of the received-power measurement.
+        grid_size (int): Number of cells along the longer side of the grid.
+        credible_level (float): Probability held by the returned credible region.
+
+    Returns:
+        dict: "density" (north-up array summing to 1), "bounds" (south, west, north, east),
+            "cell_area_m2", "peak_coord" (the MAP estimate [lat, lon]), "consistent"
+            (False when the LOB wedges do not overlap), "credible_level",
+            "credible_polygons" (exterior [lat, lon] lists, largest first) and "credible_acres".
+    """
+    from ew import get_emission_distance_array
+    assert len(sensors) >= 1, "At least one LOB is required."
+    assert 0 < min_P_t_watts <= max_P_t_watts, "Transmitter power range must be positive and ordered."
+    likelihood_args = (sensors, frequency_MHz, min_P_t_watts, max_P_t_watts, G_t, path_loss_coeff, path_loss_coeff_spread, power_noise_dB)
+    # bounding box of each LOB wedge out to its longest plausible range
+    wedge_bounds = []
+    for sensor in sensors:
+        max_range_m = min(float(get_emission_distance_array(
+            max_P_t_watts, frequency_MHz, G_t, sensor["receiver_gain_dBi"], sensor["power_received_dBm"] - 3 * power_noise_dB,
+            0, 0, 0, max(path_loss_coeff - path_loss_coeff_spread, 2), pure_pathLoss=True
+        )) * 1000, BAYESIAN_MAX_RANGE_M)
+        bearings = sensor["bearing"] + np.array([-2, -1, 0, 1, 2]) * max(sensor["bearing_error"], 0.1)
+        lats, lons = get_geodesic_destinations(sensor["coord"][0], sensor["coord"][1], bearings % 360, max_range_m, 'sphere')
+        lats = np.append(lats, sensor["coord"][0]); lons = np.append(lons, sensor["coord"][1])
+        wedge_bounds.append([lats.min(), lons.min(), lats.max(), lons.max()])
+    wedge_bounds = np.array(wedge_bounds)
+    bounds = (wedge_bounds[:, 0].max(), wedge_bounds[:, 1].max(), wedge_bounds[:, 2].min(), wedge_bounds[:, 3].min())
+    consistent = bool(bounds[0] < bounds[2] and bounds[1] < bounds[3])
+    if not consistent:
+        bounds = (wedge_bounds[:, 0].min(), wedge_bounds[:, 1].min(), wedge_bounds[:, 2].max(), wedge_bounds[:, 3].max())
+
+    def solve(bounds: tuple) -> dict:
+        rows, cols, bounds, cell_m = _get_grid(bounds, grid_size)
+        log_likelihood = _get_log_likelihood(*_get_grid_centers(rows, cols, bounds), *likelihood_args)
+        density = np.exp(log_likelihood - log_likelihood.max())
+        return {"density": density / density.sum(), "bounds": bounds, "cell_area_m2": float(cell_m ** 2)}
+
+    surface = solve(bounds)
+    # zoom in on the cells that hold nearly all of the posterior
+    surface = solve(_get_credible_bounds(surface["density"], surface["bounds"], 0.999))
+    surface["peak_coord"] = _get_peak_coord(surface["density"], surface["bounds"])
+    surface["consistent"] = consistent
+    surface["credible_level"] = credible_level
+    credible_polygons, surface["credible_acres"] = get_credible_region_polygons(surface, credible_level)
+    surface["credible_polygons"] = sorted(credible_polygons, key=len, reverse=True)
+    return surface
+
+
+def get_credible_region_mask(density: np.ndarray, level: float) -> np.ndarray:
+    """Returns the smallest set of cells (highest density first) holding the given fraction of the probability."""
+    assert 0 < level <= 1, "Credible level must be between 0 and 1."
+    flat = density.ravel()
+    order = np.argsort(flat)[::-1]
+    cumulative = np.cumsum(flat[order])
+    count = min(int(np.searchsorted(cumulative, level * cumulative[-1])) + 1, flat.size)
+    mask = np.zeros(flat.size, dtype=bool)
+    mask[order[:count]] = True
+    return mask.reshape(density.shape)
+
+
+def get_credible_region_polygons(surface: dict, level: float) -> tuple[list, float]:
+    """Returns the exterior coordinates of the credible region polygons of a surface and the region's area in acres."""
+    import shapely
+    density = surface["density"]
+    south, west, north, east = surface["bounds"]
+    rows, cols = density.shape
+    mask = get_credible_region_mask(density, level)
+    cell_lat = (north - south) / rows
+    cell_lon = (east - west) / cols
+    # merge each row's contiguous cells into one box before the union
+    edges = np.diff(np.pad(mask, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)
+    # run corners as (lon, lat) boxes, row 0 is the northern edge
+    boxes = shapely.box(
+        west + run_starts * cell_lon, north - (run_rows + 1) * cell_lat,
+        west + run_ends * cell_lon, north - run_rows * cell_lat
+    )
+    region = shapely.union_all(boxes)
+    polygons = [region] if region.geom_type == "Polygon" else list(getattr(region, "geoms", []))
+    exteriors = [[[lat, lon] for lon, lat in polygon.exterior.coords] for polygon in polygons if not polygon.is_empty]
+    return exteriors, int(mask.sum()) * surface["cell_area_m2"] / SQUARE_METERS_PER_ACRE
+
+
+def get_probability_overlay_filename() -> str:
+    date_str = datetime.now().strftime('%Y-%m-%d')
+    logs_dir = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), '..', 'logs', 'probability', date_str)
+    )
+    os.makedirs(logs_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Hh%Mm%Ss')
+    return os.path.join(logs_dir, f"probability_surface_{date_str}_{timestamp}.png")
+
+
+def save_probability_overlay(density: np.ndarray, bounds: tuple[float, float, float, float], file_path: str, cmap: str = "hot_r", max_opacity: float = 0.75) -> str:
+    """Writes a probability surface as a north-up RGBA heatmap PNG (opacity grows with density) with a world file (.pgw) placing it at the surface bounds, and returns the PNG path."""
+    import matplotlib
+    import matplotlib.pyplot as plt
+    from utilities import write_world_file
+    scaled = density / max(float(density.max()), 1e-300)
+    overlay = matplotlib.colormaps[cmap](scaled)
+    overlay[..., 3] = max_opacity * np.sqrt(scaled)
+    plt.imsave(file_path, overlay)
+    write_world_file(file_path, bounds, density.shape)
+    return file_path
@@ -0,0 +1,242 @@
+import numpy as np
+
+from coords import convert_coords_to_mgrs, get_bearing_between_coordinates, get_coords_from_LOBs, get_distance_between_coords
+from map import SQUARE_METERS_PER_ACRE, LocalPlane, check_for_intersection, get_intersections, get_lines, get_polygon_area_m2, organize_polygon_points
+
+# sensor error (degrees) of LOB reports without one
+TARGETING_SENSOR_ERROR = 6
+# candidate FIX points are nudged this far toward their center before the point-in-CUT tests
+FIX_BUFFER_ADJUSTMENT_M = 5
+
+
+def is_complete_report(report: dict) -> bool:
+    """Returns True if a LOB report has a sensor position, a bearing and a received power."""
+    return report is not None and None not in (report.get("coord"), report.get("bearing"), report.get("power_received_dBm"))
+
+
+def get_lob_distance_band(report: dict,
+                          frequency_MHz: float,
+                          min_P_t_watts: float,
+                          max_P_t_watts: float,
+                          G_t: float = 0,
+                          t_h: float = 2,
+                          temp_f: float = 75,
+                          path_loss_coeff: float = 4) -> tuple[float, float]:
+    """Returns the (min, max) log-distance emitter range of a LOB report in km, from the minimum and maximum ERP."""
+    from ew import get_emission_distance
+    return tuple(
+        get_emission_distance(P_t_watts, frequency_MHz, G_t, report.get("receiver_gain_dBi", 0), report["power_received_dBm"],
+                              t_h, report.get("receiver_height_m", 2), temp_f, path_loss_coeff, weather_coeff=4/3, pure_pathLoss=True)
+        for P_t_watts in (min_P_t_watts, max_P_t_watts)
+    )
+
+
+def get_sensor_distance(sensor_coord: list[float], target_coord: list[float]) -> tuple[int, int]:
+    """Returns the whole-meter distance and whole-degree bearing from a sensor to a target."""
+    return int(get_distance_between_coords(sensor_coord, target_coord)), int(get_bearing_between_coordinates(sensor_coord, target_coord))
+
+
+def get_lob(report: dict,
+            min_distance_m: float,
+            max_distance_m: float,
+            plane: LocalPlane) -> dict:
+    """
+    Returns the wedge, lines and target of one LOB report.
+
+    Args:
+        report (dict): "coord" [lat, lon], "bearing" and optionally "bearing_error" (degrees).
+        min_distance_m, max_distance_m (float): Emitter distance band along the LOB.
+        plane (LocalPlane): Local plane shared by every LOB of the calculation.
+
+    Returns:
+        dict: "sensor_coord", "polygon" (ordered wedge), "near_center_coord", "far_center_coord",
+            "center_coords", "target_coord" (middle of the band), "target_mgrs", "error_acres",
+            "distance_m" and "bearing_deg" (sensor to target), the plane lines "center_line",
+            "right_bound", "left_bound" and "backstop", and the plane "center_segment".
+    """
+    sensor_coord = report["coord"]
+    _, near_right, near_left, near_center, far_right, far_left, far_center, center_coords = get_coords_from_LOBs(
+        sensor_coord, report["bearing"], report.get("bearing_error", TARGETING_SENSOR_ERROR), min_distance_m, max_distance_m)
+    plane_points = plane.to_plane([sensor_coord, near_right, far_right, near_left, far_left, far_center])
+    backstop, center_line, right_bound, left_bound = get_lines(plane_points[[2, 0, 1, 3]], plane_points[[4, 5, 2, 4]])
+    corners = plane_points[[1, 2, 4, 3]]
+    order = organize_polygon_points(corners)
+    target_coord = [float(np.average([near_center[0], far_center[0]])), float(np.average([near_center[1], far_center[1]]))]
+    distance_m, bearing_deg = get_sensor_distance(sensor_coord, target_coord)
+    return {
+        "sensor_coord": sensor_coord,
+        "polygon": [[near_right, far_right, far_left, near_left][i] for i in order],
+        "near_center_coord": near_center,
+        "far_center_coord": far_center,
+        "center_coords": center_coords,
+        "target_coord": target_coord,
+        "target_mgrs": convert_coords_to_mgrs(target_coord),
+        "error_acres": get_polygon_area_m2(corners[order]) / SQUARE_METERS_PER_ACRE,
+        "distance_m": distance_m,
+        "bearing_deg": bearing_deg,
+        "center_line": center_line,
+        "right_bound": right_bound,
+        "left_bound": left_bound,
+        "backstop": backstop,
+        "center_segment": plane_points[[0, 5]].tolist(),
+    }
+
+
+def check_lob_intersection(lob1: dict, lob2: dict) -> bool:
+    """Returns True if the center lines of two LOBs cross."""
+    if lob1 is None or lob2 is None: return False
+    return check_for_intersection(*lob1["center_segment"], *lob2["center_segment"])
+
+
+def get_cut(lob1: dict, lob2: dict, plane: LocalPlane) -> dict:
+    """Returns the "target_coord" (center-line intersection), "target_mgrs", "polygon" and "error_acres" of a CUT of two LOBs."""
+    points = get_intersections([lob1["center_line"], lob1["right_bound"], lob1["right_bound"], lob1["left_bound"], lob1["left_bound"]],
+                               [lob2["center_line"], lob2["right_bound"], lob2["left_bound"], lob2["left_bound"], lob2["right_bound"]])
+    target_coord = plane.to_coords(points[0])[0]
+    corners = points[1:][organize_polygon_points(points[1:])]
+    return {
+        "target_coord": target_coord,
+        "target_mgrs": convert_coords_to_mgrs(target_coord),
+        "polygon": plane.to_coords(corners),
+        "error_acres": get_polygon_area_m2(corners) / SQUARE_METERS_PER_ACRE,
+    }
+
+
+def get_fix(lobs: list[dict], plane: LocalPlane) -> dict:
+    """
+    Returns the FIX of three or more LOBs.
+
+    The candidate points are the corners of every pairwise CUT, nudged
+    FIX_BUFFER_ADJUSTMENT_M toward their center; the FIX is the polygon of
+    those inside every CUT. With fewer than three such points the FIX falls
+    back on the triangle of the pairwise center-line intersections
+    ("method" "lob_centers" instead of "cut_overlap").
+
+    Returns:
+        dict: "target_coord" (polygon center), "target_mgrs", "polygon",
+            "error_acres" and "method". None if no candidate point lies
+            inside every CUT.
+    """
+    import shapely
+    from shapely.geometry import Polygon
+    assert len(lobs) >= 3, "At least three LOBs are required for a fix."
+    pairs = [(first, second) for first in range(len(lobs)) for second in range(first + 1, len(lobs))]
+    # right-right, right-left, left-right and left-left bounds of each LOB pair
+    bounds = [("right_bound", "right_bound"), ("right_bound", "left_bound"), ("left_bound", "right_bound"), ("left_bound", "left_bound")]
+    cut_corners = get_intersections([lobs[first][i] for first, _ in pairs for i, _ in bounds],
+                                    [lobs[second][j] for _, second in pairs for _, j in bounds]).reshape(len(pairs), 4, 2)
+    candidates = cut_corners.reshape(-1, 2)
+    offsets = candidates.mean(axis=0) - candidates
+    offset_distances = np.hypot(offsets[:, 0], offsets[:, 1])
+    candidates = candidates + FIX_BUFFER_ADJUSTMENT_M * offsets / np.where(offset_distances > 0, offset_distances, 1)[:, None]
+    cut_polygons = [Polygon(corners[organize_polygon_points(corners)]) for corners in cut_corners]
+    in_cuts = np.logical_and.reduce([shapely.contains_xy(cut_polygon, candidates[:, 0], candidates[:, 1]) for cut_polygon in cut_polygons])
+    fix_points = candidates[in_cuts]
+    if len(fix_points) == 0: return None
+    method = "cut_overlap"
+    fix_points = fix_points[organize_polygon_points(fix_points)]
+    if len(fix_points) < 3:
+        method = "lob_centers"
+        fix_points = get_intersections([lobs[first]["center_line"] for first, _ in pairs], [lobs[second]["center_line"] for _, second in pairs])
+    target_coord = plane.to_coords(fix_points.mean(axis=0))[0]
+    return {
+        "target_coord": target_coord,
+        "target_mgrs": convert_coords_to_mgrs(target_coord),
+        "polygon": plane.to_coords(fix_points),
+        "error_acres": get_polygon_area_m2(fix_points) / SQUARE_METERS_PER_ACRE,
+        "method": method,
+    }
+
+
+def get_targets(reports: list[dict],
+                frequency_MHz: float,
+                min_P_t_watts: float,
+                max_P_t_watts: float,
+                G_t: float = 0,
+                t_h: float = 2,
+                temp_f: float = 75,
+                path_loss_coeff: float = 4,
+                distance_bands_km: list = None,
+                bayesian_fallback: bool = False) -> dict:
+    """
+    Returns the LOB, CUT and FIX targets of a set of LOB reports, as the EWT panel computes them.
+
+    Every complete report (see is_complete_report) gets a LOB; reports with
+    only a "coord" are sensor positions and None marks an unused sensor slot.
+    LOBs whose center lines cross form CUTs, and three or more LOBs that all
+    cross form a FIX (from the CUT overlap, else the Bayesian grid fix when
+    bayesian_fallback is set, else the pairwise CUTs stand). The primary
+    target is the FIX, else the CUT with the least error, else the LOB with
+    the least error. LOBs that form a CUT, and CUTs under a FIX drawn from
+    their overlap, are not given their own target "marker".
+
+    Args:
+        reports (list[dict]): "coord" [lat, lon], "bearing", "bearing_error",
+            "power_received_dBm", "receiver_gain_dBi" and "receiver_height_m".
+        frequency_MHz, min_P_t_watts, max_P_t_watts, G_t, t_h, temp_f, path_loss_coeff:
+            Emitter and propagation parameters of get_lob_distance_band.
+        distance_bands_km (list): Optional (min, max) km per report, e.g. from the
+            knife-edge terrain model, replacing the log-distance bands.
+        bayesian_fallback (bool): Solve the Bayesian grid fix when the CUTs do not overlap.
+
+    Returns:
+        dict: "target_class" ("1 LOB", "2 LOBs", "3 LOBs", "CUT" or "FIX"), "target_coord",
+            "target_mgrs", "target_error_acres", "targets" (every LOB, CUT and FIX with its
+            "class", "reports" indices, "target_coord", "target_mgrs", "error_acres",
+            "polygon" and "marker"), "lobs" (per report, None for positions), "distance_bands_km",
+            "distances_m" and "bearings_deg" (sensor to primary target, per report, None for
+            unused slots) and "surface" (the Bayesian probability surface if the fallback
+            solved it, else None).
+    """
+    assert any(is_complete_report(report) for report in reports), "At least one complete LOB report is required."
+    plane = LocalPlane([report["coord"] for report in reports if report is not None])
+    lobs, bands = [], []
+    for index, report in enumerate(reports):
+        if not is_complete_report(report):
+            lobs.append(None); bands.append(None)
+            continue
+        band = distance_bands_km[index] if distance_bands_km is not None and distance_bands_km[index] is not None else \
+            get_lob_distance_band(report, frequency_MHz, min_P_t_watts, max_P_t_watts, G_t, t_h, temp_f, path_loss_coeff)
+        bands.append(tuple(band))
+        lobs.append(get_lob(report, band[0] * 1000, band[1] * 1000, plane))
+    lob_indices = [index for index, lob in enumerate(lobs) if lob is not None]
+    crossing_pairs = [(first, second) for i, first in enumerate(lob_indices) for second in lob_indices[i + 1:] if check_lob_intersection(lobs[first], lobs[second])]
+    cut_reports = {index for pair in crossing_pairs for index in pair}
+    targets = [{"class": "LOB", "reports": [index], "polygon": lobs[index]["polygon"], "target_coord": lobs[index]["target_coord"],
+                "target_mgrs": lobs[index]["target_mgrs"], "error_acres": lobs[index]["error_acres"], "marker": index not in cut_reports}
+               for index in lob_indices]
+    cuts = [{"class": "CUT", "reports": [first, second], **get_cut(lobs[first], lobs[second], plane), "marker": True} for first, second in crossing_pairs]
+    targets += cuts
+    fix, surface = None, None
+    if len(lob_indices) >= 3 and len(crossing_pairs) == len(lob_indices) * (len(lob_indices) - 1) // 2:
+        fix = get_fix([lobs[index] for index in lob_indices], plane)
+        if fix is None and bayesian_fallback:
+            from probability import get_bayesian_probability_surface
+            surface = get_bayesian_probability_surface([reports[index] for index in lob_indices], frequency_MHz, min_P_t_watts, max_P_t_watts, G_t, path_loss_coeff)
+            if surface["credible_polygons"]:
+                fix = {"target_coord": list(surface["peak_coord"]), "target_mgrs": convert_coords_to_mgrs(surface["peak_coord"]),
+                       "polygon": surface["credible_polygons"][0], "error_acres": surface["credible_acres"], "method": "bayesian"}
+        if fix is not None:
+            targets.append({"class": "FIX", "reports": lob_indices, **fix, "marker": True})
+            # a FIX drawn from the CUT overlap replaces the CUT markers
+            for cut in cuts: cut["marker"] = fix["method"] == "lob_centers"
+    if fix is not None:
+        target_class, primary = "FIX", targets[-1]
+    elif cuts:
+        target_class, primary = "CUT", min(cuts, key=lambda cut: cut["error_acres"])
+    else:
+        target_class = f'{len(lob_indices)} {"LOB" if len(lob_indices) == 1 else "LOBs"}'
+        primary = min(targets, key=lambda lob: lob["error_acres"])
+    sensor_distances = [(None, None) if report is None else get_sensor_distance(report["coord"], primary["target_coord"]) for report in reports]
+    return {
+        "target_class": target_class,
+        "target_coord": primary["target_coord"],
+        "target_mgrs": primary["target_mgrs"],
+        "target_error_acres": primary["error_acres"],
+        "targets": targets,
+        "lobs": lobs,
+        "distance_bands_km": bands,
+        "distances_m": [distance for distance, _ in sensor_distances],
+        "bearings_deg": [bearing for _, bearing in sensor_distances],
+        "surface": surface,
+    }
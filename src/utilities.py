@@ -164,6 +164,19 @@ def read_json(filepath: str) -> dict:
         json_data = json.load(json_file)
     return json_data
 
+def write_world_file(image_path: str, bounds: tuple, shape: tuple) -> str:
+    """Writes the world file (.pgw for .png) that georeferences a north-up image covering bounds (south, west, north, east) and returns its path."""
+    south, west, north, east = bounds
+    rows, cols = shape[:2]
+    lon_size = (east - west) / cols
+    lat_size = (north - south) / rows
+    root, extension = os.path.splitext(image_path)
+    world_path = f"{root}.{extension[1:2]}{extension[-1:]}w"
+    # pixel sizes, rotation terms, then the center of the top-left pixel
+    with open(world_path, 'w', encoding='utf-8') as world_file:
+        world_file.write("\n".join(f"{value:.12f}" for value in (lon_size, 0, 0, -lat_size, west + lon_size / 2, north - lat_size / 2)) + "\n")
+    return world_path
+
 def generate_DTG(timezone='LOCAL') -> str:
     """Generate the current date-time group (DTG) in DDTTTTXMMMYYYY format."""
     import calendar, datetime
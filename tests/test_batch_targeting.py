@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Ensure src/ is in the system path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import batch_targeting
+from utilities import read_csv, read_json, write_csv
+conf = read_json(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "config_files", "conf.json"))
+
+
+def log_row(sensors: list[int], **overrides) -> dict:
+    """A targeting log row as written by the GUI's log_target_data."""
+    row = {"DTG_LOCAL": "181200LOCT2026", "FREQ_MHz": f'{conf["DEFAULT_FREQUENCY_MHZ"]:,.2f}', "MIN_ERP_W": f'{conf["DEFAULT_MIN_ERP_W"]:,.3f}',
+           "MAX_ERP_W": f'{conf["DEFAULT_MAX_ERP_W"]:,.3f}', "PATH_LOSS_COEFF": "4", "TGT_MGRS": "32UQV0137458661", "TGT_MGRS_ACTUAL": ""}
+    for n in (1, 2, 3):
+        logged = n in sensors
+        row[f"EWT_{n}_MGRS"] = conf[f"DEFAULT_SENSOR_{n}_MGRS"] if logged else ""
+        row[f"EWT_{n}_LOB_DEGREES"] = conf[f"DEFAULT_SENSOR_{n}_LOB"] if logged else ""
+        row[f"EWT_{n}_PWR_REC_DbM"] = conf[f"DEFAULT_SENSOR_{n}_PWR_RECEIVED"] if logged else ""
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def log_files(tmp_path):
+    write_csv(str(tmp_path / "EW-targeting-log-2026-10-18.csv"), [log_row([1, 2, 3]), log_row([1, 2]), log_row([2]), log_row([1], FREQ_MHz="")])
+    reports = [{"mgrs": conf[f"DEFAULT_SENSOR_{n}_MGRS"], "bearing": conf[f"DEFAULT_SENSOR_{n}_LOB"], "power_received_dBm": conf[f"DEFAULT_SENSOR_{n}_PWR_RECEIVED"]} for n in (1, 2, 3)]
+    with open(tmp_path / "engagements.jsonl", "w") as file:
+        file.write(json.dumps({"id": "A1", "frequency_MHz": 34.25, "min_erp_w": 0.005, "max_erp_w": 50, "reports": reports[1:]}) + "\n")
+    # ignored by the directory scan
+    write_csv(str(tmp_path / "other.csv"), [log_row([1])])
+    return tmp_path
+
+
+def test_run_batch(log_files):
+    jobs = batch_targeting.read_jobs([str(log_files)])
+    assert [(job["source"], job["row"]) for job in jobs] == [("EW-targeting-log-2026-10-18.csv", row) for row in (1, 2, 3, 4)] + [("engagements.jsonl", 1)]
+    results = batch_targeting.run_batch(jobs, workers=2, chunksize=2)
+    assert results == batch_targeting.run_batch(jobs)
+    assert [result.get("TGT_CLASS") for result in results] == ["FIX", "CUT", "1 LOB", None, "CUT"]
+    assert [result.get("TGT_MGRS") for result in results] == ["32UQV0137358661", "32UQV0143358602", "32UQV0175958557", None, "32UQV0127358624"]
+    assert results[0]["EWT_2_DIST2TGT_KM"] == 1.719 and results[0]["LOGGED_TGT_MGRS"] == "32UQV0137458661"
+    assert results[2]["EWT_2_LOB_TGT_MGRS"] == "32UQV0175958557" and "EWT_1_LOB_TGT_MGRS" not in results[2]
+    assert results[3]["ERROR"].startswith("AssertionError") and results[4]["ID"] == "A1"
+
+
+def test_cli(log_files):
+    src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+    for output in ("results.csv", "results.jsonl"):
+        completed = subprocess.run([sys.executable, os.path.join(src_dir, "batch_targeting.py"), str(log_files), "--workers", "2", "--output", str(log_files / output)],
+                                   check=True, capture_output=True, text=True)
+        assert "rows/s" in completed.stdout and "1 FIX" in completed.stdout and "1 failed" in completed.stdout
+    rows = read_csv(str(log_files / "results.csv"))
+    assert [row["TGT_CLASS"] for row in rows] == ["FIX", "CUT", "1 LOB", "", "CUT"]
+    with open(log_files / "results.jsonl") as file:
+        records = [json.loads(line) for line in file]
+    assert rows[0]["TGT_LATLON"] == ", ".join(str(x) for x in records[0]["TGT_LATLON"])
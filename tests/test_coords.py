@@ -0,0 +1,157 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure src/ is in the system path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import coords
+
+
+def stepped_lob_coords(sensor_coord, azimuth, sensor_error, min_lob_length, max_lob_length):
+    """The original get_coords_from_LOBs walk, kept as the reference for the closed form."""
+    center_coord_list = []
+    running_left = list(sensor_coord); running_center = list(sensor_coord); running_right = list(sensor_coord)
+    lob_length = 0
+    interval_meters = 30
+    while interval_meters > max_lob_length and interval_meters > 10:
+        interval_meters -= 10
+    near_right = []; near_left = []
+    while lob_length <= max_lob_length:
+        running_left = coords.adjust_coordinate(running_left, (azimuth - sensor_error) % 360, interval_meters)
+        running_right = coords.adjust_coordinate(running_right, (azimuth + sensor_error) % 360, interval_meters)
+        running_center = coords.adjust_coordinate(running_center, azimuth, interval_meters)
+        center_coord_list.append(running_center)
+        if lob_length > min_lob_length:
+            if near_right == []: near_right = list(running_right)
+            if near_left == []: near_left = list(running_left)
+        lob_length += interval_meters
+    center = np.mean([near_right, near_left, running_right, running_left], axis=0)
+    near_center = np.mean([near_right, near_left], axis=0)
+    return center, near_right, near_left, near_center, running_right, running_left, running_center, center_coord_list
+
+
+@pytest.mark.parametrize("sensor_coord", [[49.5, 11.3], [-60.0, 151.0], [0.0, -75.2], [70.0, 20.0]])
+@pytest.mark.parametrize("azimuth", [0, 45, 89.9, 180, 271.5, 359.5])
+@pytest.mark.parametrize("lob_lengths", [(0, 20), (100, 3000), (1500, 20000), (5000, 60000)])
+def test_get_coords_from_LOBs_matches_stepped(sensor_coord, azimuth, lob_lengths):
+    expected = stepped_lob_coords(sensor_coord, azimuth, 6, *lob_lengths)
+    actual = coords.get_coords_from_LOBs(sensor_coord, azimuth, 6, *lob_lengths)
+    for expected_coord, actual_coord in zip(expected[:7], actual[:7]):
+        assert coords.get_distances_between_coords(list(expected_coord), *actual_coord) < 0.25
+    assert len(actual[7]) == len(expected[7])
+    expected_line, actual_line = np.array(expected[7]), np.array(actual[7])
+    distances_m = np.hypot(
+        (actual_line[:, 0] - expected_line[:, 0]) * 111195,
+        (actual_line[:, 1] - expected_line[:, 1]) * 111195 * np.cos(np.radians(expected_line[:, 0]))
+    )
+    assert distances_m.max() < 0.25
+
+
+def test_get_lob_coords():
+    lob = coords.get_lob_coords([49.5, 11.3], 45, 6, 1500, 20000, center_line_spacing_m=7)
+    assert coords.get_distance_between_coords([49.5, 11.3], lob["near_right_coord"]) == pytest.approx(1500, rel=2e-3)
+    assert coords.get_distance_between_coords([49.5, 11.3], lob["far_center_coord"]) == pytest.approx(20000, rel=2e-3)
+    assert coords.get_bearing_between_coordinates([49.5, 11.3], lob["far_left_coord"]) == pytest.approx(39, abs=0.1)
+    # the center line ends exactly at the far center
+    assert lob["center_line"].shape == (2858, 2)
+    assert np.allclose(lob["center_line"][-1], lob["far_center_coord"], rtol=0, atol=1e-12)
+    assert coords.get_lob_coords([49.5, 11.3], 45, 6, 1500, 20000)["center_line"] is None
+
+
+def test_get_rhumb_line_destinations_east_west():
+    lats, lons = coords.get_rhumb_line_destinations([49.5, 11.3], [90, 270], [10000, 10000])
+    expected = [coords.adjust_coordinate([49.5, 11.3], a, 10000) for a in (90, 270)]
+    assert np.allclose(np.column_stack([lats, lons]), expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("model", ["wgs84", "sphere"])
+def test_geodesic_round_trip(model):
+    rng = np.random.default_rng(0)
+    lats, lons = rng.uniform(-80, 80, 1000), rng.uniform(-180, 180, 1000)
+    azimuths, distances_m = rng.uniform(0, 360, 1000), rng.uniform(10, 200_000, 1000)
+    new_lats, new_lons = coords.get_geodesic_destinations(lats, lons, azimuths, distances_m, model)
+    new_azimuths, new_distances_m = coords.get_geodesic_inverse(lats, lons, new_lats, new_lons, model)
+    assert np.allclose(new_distances_m, distances_m, rtol=0, atol=1e-6)
+    assert np.allclose((new_azimuths - azimuths + 180) % 360 - 180, 0, rtol=0, atol=1e-7)
+
+
+def test_geodesic_models_agree_with_references():
+    import haversine
+    from pyproj import Geod
+    coord1, coord2 = [49.5, 11.3], [49.62, 11.05]
+    azimuth, distance_m = coords.get_geodesic_inverse(*coord1, *coord2)
+    expected_azimuth, _, expected_distance_m = Geod(ellps="WGS84").inv(coord1[1], coord1[0], coord2[1], coord2[0])
+    assert float(distance_m) == pytest.approx(expected_distance_m, abs=1e-6)
+    assert float(azimuth) == pytest.approx(expected_azimuth % 360, abs=1e-9)
+    _, sphere_distance_m = coords.get_geodesic_inverse(*coord1, *coord2, model="sphere")
+    assert float(sphere_distance_m) == pytest.approx(haversine.haversine(coord1, coord2, unit=haversine.Unit.METERS), abs=1e-6)
+    # the scalar helpers are the spherical model
+    assert coords.get_distance_between_coords(coord1, coord2) == pytest.approx(float(sphere_distance_m), abs=1e-6)
+    assert coords.get_bearing_between_coordinates(coord1, coord2) == pytest.approx(float(coords.get_geodesic_inverse(*coord1, *coord2, model="sphere")[0]), abs=1e-9)
+
+
+def test_get_pairwise_geodesics():
+    sensors = [[49.5, 11.3], [49.6, 11.2], [49.4, 11.0]]
+    targets = [[49.55, 11.25], [49.7, 11.5]]
+    azimuths, distances_m = coords.get_pairwise_geodesics(sensors, targets, "sphere")
+    assert azimuths.shape == distances_m.shape == (3, 2)
+    for i, sensor in enumerate(sensors):
+        for j, target in enumerate(targets):
+            assert distances_m[i, j] == pytest.approx(coords.get_distance_between_coords(sensor, target), abs=1e-6)
+            assert azimuths[i, j] == pytest.approx(coords.get_bearing_between_coordinates(sensor, target), abs=1e-9)
+
+
+def test_mgrs_batch_matches_scalar():
+    import mgrs
+    rng = np.random.default_rng(0)
+    lats, lons = rng.uniform(-80, 84, 500), rng.uniform(-180, 180, 500)
+    grids = coords.convert_coords_to_mgrs_batch(lats, lons)
+    assert grids == [str(mgrs.MGRS().toMGRS(lat, lon, MGRSPrecision=5)).strip() for lat, lon in zip(lats, lons)]
+    assert coords.convert_coords_to_mgrs_batch(lats[:3], lons[:3], precision=3) == [coords.convert_coords_to_mgrs([float(lat), float(lon)], 3) for lat, lon in zip(lats[:3], lons[:3])]
+    decoded_lats, decoded_lons = coords.convert_mgrs_to_coords_batch(grids)
+    expected = np.array([coords.convert_mgrs_to_coords(grid) for grid in grids])
+    assert np.array_equal(np.column_stack([decoded_lats, decoded_lons]), expected)
+    assert coords.convert_mgrs_to_coords_batch([])[0].size == 0
+
+
+def test_mgrs_cache():
+    coords._convert_coords_to_mgrs_cached.cache_clear()
+    grid = coords.convert_coords_to_mgrs([49.5, 11.3])
+    assert coords.convert_coords_to_mgrs([49.5, 11.3]) == grid
+    assert coords._convert_coords_to_mgrs_cached.cache_info().hits == 1
+    assert coords._convert_coords_to_mgrs_cached.cache_info().maxsize == coords.MGRS_CACHE_SIZE
+    # callers get their own list, not the cached tuple
+    readable_grid = coords.format_readable_mgrs(grid)
+    coord = coords.convert_mgrs_to_coords(readable_grid)
+    coord.append(0)
+    assert len(coords.convert_mgrs_to_coords(readable_grid)) == 2
+    assert coords._get_mgrs_converter() is coords._get_mgrs_converter()
+
+
+@pytest.mark.parametrize("precision", [0, 1, 3, 5])
+def test_mgrs_array_matches_mgrs(precision):
+    import mgrs
+    converter = mgrs.MGRS()
+    rng = np.random.default_rng(precision)
+    # half-degree global grid (poles included), Norway and Svalbard zones, equator and zone edges
+    grid_lats, grid_lons = np.meshgrid(np.arange(-90, 90.01, 0.5), np.arange(-180, 180.01, 0.5), indexing="ij")
+    edge_lats = np.repeat([0.0, -1e-10, 1e-10, 56, 63.99999, 64, 72, 84, -80, 84.00001], 46)
+    edge_lons = np.tile(np.arange(-3, 43), 10) + np.tile([0, 1e-9], 230)
+    lats = np.r_[grid_lats.ravel(), rng.uniform(54, 84, 20_000), rng.uniform(-80, 84, 20_000), edge_lats]
+    lons = np.r_[grid_lons.ravel(), rng.uniform(-2, 44, 20_000), rng.uniform(-180, 180, 20_000), edge_lons]
+    grids = coords.convert_coords_to_mgrs_array(lats, lons, precision)
+    expected = [str(converter.toMGRS(lat, lon, MGRSPrecision=precision)).strip() for lat, lon in zip(lats.tolist(), lons.tolist())]
+    assert grids.tolist() == expected
+
+
+def test_utm_array():
+    from pyproj import Proj
+    zones, hemispheres, eastings, northings = coords.convert_coords_to_utm_array([38.9, -33.9, 60.0, 78.0], [-77.0, 151.2, 5.0, 10.0])
+    assert zones.tolist() == [18, 56, 32, 33]
+    assert hemispheres.tolist() == ["N", "S", "N", "N"]
+    for zone, lat, lon, easting, northing in zip(zones, [38.9, -33.9], [-77.0, 151.2], eastings, northings):
+        expected = Proj(proj="utm", zone=int(zone), south=lat < 0, ellps="WGS84")(lon, lat)
+        assert [easting, northing] == pytest.approx(expected, abs=1e-3)
+    assert coords.convert_coords_to_mgrs_array([[49.5, 0.0]], [[11.3, 0.0]]).shape == (1, 2)
@@ -28,3 +28,469 @@ def test_get_elevation(coord, expected, monkeypatch):
 def test_get_elevation_invalid_inputs(coord):
     with pytest.raises(AssertionError):
         get_elevation(coord)
+
+
+def write_dted_file(file_path, lat, lon, data):
+    """Writes a DTED file covering the 1x1 degree cell with its SW corner at (lat, lon)."""
+    import numpy as np
+    import rasterio
+    import rasterio.shutil
+    from rasterio.io import MemoryFile
+    from rasterio.transform import from_origin
+    rows, cols = data.shape
+    x_res = 1 / (cols - 1)
+    y_res = 1 / (rows - 1)
+    transform = from_origin(lon - x_res / 2, lat + 1 + y_res / 2, x_res, y_res)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with MemoryFile() as memfile:
+        with memfile.open(driver="GTiff", width=cols, height=rows, count=1, dtype="int16", crs="EPSG:4326", transform=transform) as ds:
+            ds.write(data.astype(np.int16), 1)
+        with memfile.open() as ds:
+            rasterio.shutil.copy(ds, file_path, driver="DTED")
+
+
+@pytest.fixture
+def dted_directory(tmp_path, monkeypatch):
+    """Temporary DTED tree with two adjacent level 0 cells: n49/e011 and n49/e012 (partly below sea level)."""
+    import numpy as np
+    import dted
+    rows, cols = np.mgrid[0:121, 0:121]
+    write_dted_file(str(tmp_path / "e011" / "n49.dt2"), 49, 11, rows * 10 + cols)
+    write_dted_file(str(tmp_path / "e012" / "n49.dt2"), 49, 12, rows * 10 - cols - 300)
+    monkeypatch.setattr(dted, "DTED_DIRECTORY", str(tmp_path))
+    dted.DTEDTileCache.clear_cache()
+    yield tmp_path
+    dted.DTEDTileCache.clear_cache()
+
+
+def test_get_elevation_matches_rasterio(dted_directory):
+    import rasterio
+    import dted
+    coord = [49.2462, 11.7753]
+    with rasterio.open(dted.get_dted_file(*coord)) as ds:
+        row, col = ds.index(coord[1], coord[0])
+        expected = ds.read(1)[row, col]
+    assert dted.get_elevation(coord) == expected
+
+
+def test_tile_cache_counters(dted_directory):
+    import dted
+    dted.get_elevation([49.2, 11.7])
+    dted.get_elevation([49.3, 11.8])
+    dted.get_elevation([49.3, 12.8])
+    stats = dted.DTEDTileCache.get_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 1
+    assert stats["tiles"] == 2
+    assert stats["bytes"] == 2 * 121 * 121 * 2
+
+
+def test_tile_cache_evicts_least_recently_used(dted_directory):
+    import dted
+    original_max_bytes = dted.DTEDTileCache.max_bytes
+    try:
+        dted.DTEDTileCache.set_max_bytes(121 * 121 * 2)
+        dted.get_elevation([49.2, 11.7])
+        dted.get_elevation([49.2, 12.7])
+        dted.get_elevation([49.2, 11.7])
+        stats = dted.DTEDTileCache.get_stats()
+        assert stats["tiles"] == 1
+        assert stats["evictions"] == 2
+        assert stats["misses"] == 3
+    finally:
+        dted.DTEDTileCache.set_max_bytes(original_max_bytes)
+
+
+def test_get_elevation_missing_file(dted_directory):
+    import dted
+    with pytest.raises(FileNotFoundError):
+        dted.get_elevation([10.5, 10.5])
+
+
+def test_get_elevations_matches_get_elevation(dted_directory):
+    import numpy as np
+    import dted
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(49.0, 49.999, 200)
+    lons = rng.uniform(11.0, 12.999, 200)
+    elevations = dted.get_elevations(lats, lons)
+    assert elevations.shape == (200,)
+    assert all(elevations[i] == dted.get_elevation([float(lats[i]), float(lons[i])]) for i in range(200))
+    assert dted.get_elevations(lats.reshape(20, 10), lons.reshape(20, 10)).shape == (20, 10)
+
+
+def test_get_elevations_missing_cell(dted_directory):
+    import numpy as np
+    import dted
+    with pytest.raises(FileNotFoundError):
+        dted.get_elevations(np.array([49.5, 49.5]), np.array([11.5, 13.5]))
+
+
+def test_get_dted_file_negative_coordinates():
+    import dted
+    assert dted.get_dted_file(31.88, -81.61).endswith(os.path.join("w082", "n31.dt2"))
+    assert dted.get_dted_file(-0.5, 0.5).endswith(os.path.join("e000", "s01.dt2"))
+
+
+def test_get_elevation_profile(dted_directory):
+    import dted
+    profile = dted.get_elevation_profile([49.2, 11.7], [49.25, 12.3])
+    assert len(profile) > 50
+    assert profile[0][3] == 0
+    assert all(profile[i][3] < profile[i + 1][3] for i in range(len(profile) - 1))
+    assert all(p[2] == dted.get_elevation([p[0], p[1]]) for p in dted.get_elevation_profile([49.2, 11.7], [49.25, 12.3], method="nearest"))
+
+
+def test_get_elevations_interpolation(dted_directory):
+    import numpy as np
+    import dted
+    rng = np.random.default_rng(1)
+    lats = rng.uniform(49.01, 49.99, 500)
+    lons = rng.uniform(11.01, 11.99, 500)
+    # The n49/e011 fixture is the plane rows * 10 + cols, which both interpolators reproduce exactly
+    expected = (50 - lats) * 120 * 10 + (lons - 11) * 120
+    assert np.allclose(dted.get_elevations(lats, lons, method="bilinear"), expected)
+    assert np.allclose(dted.get_elevations(lats, lons, method="bicubic"), expected)
+    assert dted.get_elevations(lats, lons).dtype == np.int16
+    # On the posts, interpolation returns the stored values across both tiles
+    post_lats = np.array([49.75, 49.5, 49.0, 49.25])
+    post_lons = np.array([11.0, 11.5, 12.0 + 60 / 120, 12.25])
+    for method in ["bilinear", "bicubic"]:
+        assert np.allclose(dted.get_elevations(post_lats, post_lons, method), dted.get_elevations(post_lats, post_lons))
+    with pytest.raises(AssertionError):
+        dted.get_elevations(lats, lons, method="cubic")
+
+
+def test_get_elevation_profile_arrays_native_spacing(dted_directory):
+    import numpy as np
+    import dted
+    from coords import get_distance_between_coords
+    start, end = [49.5, 11.2], [49.6, 12.9]
+    spacing_m = dted.get_dted_post_spacing_m(49.5, 11.5)
+    lats, lons, elevations, distances_km = dted.get_elevation_profile_arrays(start, end)
+    total_km = get_distance_between_coords(start, end, 'km')
+    assert len(lats) == int(np.ceil(total_km * 1000 / spacing_m)) + 1
+    assert np.allclose([lats[0], lons[0], lats[-1], lons[-1]], start + end)
+    assert np.isclose(distances_km[-1], total_km)
+    assert np.all(np.diff(distances_km) <= spacing_m / 1000 + 1e-9)
+    np.testing.assert_array_equal(elevations, dted.get_elevations(lats, lons, method="bilinear"))
+    # the great-circle path bows north of the straight lat/lon line in the northern hemisphere
+    assert lats[len(lats) // 2] > (start[0] + end[0]) / 2
+
+
+def test_get_elevation_profile_missing_cell(dted_directory):
+    import dted
+    with pytest.raises(FileNotFoundError):
+        dted.get_elevation_profile([49.5, 12.5], [49.5, 13.5])
+
+
+def test_open_dted_memmap_matches_rasterio(dted_directory):
+    import numpy as np
+    import dted
+    for file_path in [dted.get_dted_file(49.5, 11.5), dted.get_dted_file(49.5, 12.5)]:
+        memmap_tile = dted.open_dted_memmap(file_path)
+        rasterio_tile = dted.read_dted_rasterio(file_path)
+        assert isinstance(memmap_tile.elevation, np.memmap) or isinstance(memmap_tile.elevation.base, np.memmap)
+        rows, cols = np.indices(rasterio_tile.elevation.shape)
+        np.testing.assert_array_equal(memmap_tile.read(rows, cols), rasterio_tile.elevation)
+        np.testing.assert_array_equal(memmap_tile.read_array(), rasterio_tile.elevation)
+        np.testing.assert_allclose(memmap_tile.transform, rasterio_tile.transform, atol=1e-9)
+    assert dted.open_dted_memmap(dted.get_dted_file(49.5, 12.5)).read(np.array([0]), np.array([120]))[0] == -420
+
+
+def test_load_tile_falls_back_to_rasterio(tmp_path):
+    import numpy as np
+    import rasterio
+    import dted
+    from rasterio.transform import from_origin
+    file_path = str(tmp_path / "n49.dt2")
+    with rasterio.open(file_path, "w", driver="GTiff", width=4, height=4, count=1, dtype="int16", crs="EPSG:4326", transform=from_origin(11, 50, 0.25, 0.25)) as ds:
+        ds.write(np.arange(16, dtype=np.int16).reshape(4, 4), 1)
+    with pytest.raises(ValueError):
+        dted.open_dted_memmap(file_path)
+    tile = dted.DTEDTileCache.load_tile(file_path)
+    assert not tile.signed_magnitude
+    assert tile.read(*tile.index(49.1, 11.9)) == 15
+
+
+def test_get_dted_file_prefers_highest_level(dted_directory):
+    import dted
+    (dted_directory / "e013").mkdir()
+    (dted_directory / "e013" / "n49.dt0").write_bytes(b"")
+    assert dted.get_dted_file(49.5, 13.5).endswith("n49.dt0")
+    (dted_directory / "e013" / "n49.dt1").write_bytes(b"")
+    dted.DTEDCatalog.refresh()
+    assert dted.get_dted_file(49.5, 13.5).endswith("n49.dt1")
+
+
+@pytest.fixture
+def ridge_dted_directory(tmp_path, monkeypatch):
+    """Temporary DTED cell n49/e011: flat 100 m terrain with a 600 m north-south ridge at 11.5E."""
+    import numpy as np
+    import dted
+    data = np.full((121, 121), 100)
+    data[:, 60] = 600
+    write_dted_file(str(tmp_path / "e011" / "n49.dt2"), 49, 11, data)
+    monkeypatch.setattr(dted, "DTED_DIRECTORY", str(tmp_path))
+    dted.DTEDTileCache.clear_cache()
+    yield tmp_path
+    dted.DTEDTileCache.clear_cache()
+
+
+def test_get_great_circle_paths_matches_single_path():
+    import numpy as np
+    import dted
+    from coords import get_distance_between_coords
+    fractions = np.linspace(0, 1, 11)
+    lats, lons, distances_m = dted.get_great_circle_paths([49.2, 11.1], np.array([49.8, 49.2]), np.array([11.9, 11.1]), fractions)
+    assert lats.shape == (2, 11)
+    expected_lats, expected_lons = dted.get_great_circle_points([49.2, 11.1], [49.8, 11.9], fractions)
+    assert np.allclose(lats[0], expected_lats) and np.allclose(lons[0], expected_lons)
+    assert np.allclose([lats[1], lons[1]], [[49.2] * 11, [11.1] * 11])
+    assert np.isclose(distances_m[0] / 1000, get_distance_between_coords([49.2, 11.1], [49.8, 11.9], 'km'), rtol=1e-3)
+    assert distances_m[1] == 0
+
+
+def test_get_line_of_sight_terrain(ridge_dted_directory):
+    import numpy as np
+    import dted
+    sensor = [49.5, 11.1]
+    target_lats = np.array([49.5, 49.55, 49.5, 49.4])
+    target_lons = np.array([11.2, 11.18, 11.6, 11.9])
+    visible = dted.get_line_of_sight(sensor, target_lats, target_lons)
+    assert visible.tolist() == [True, True, False, False]
+    # a tall enough mast clears the ridge
+    assert dted.get_line_of_sight(sensor, target_lats, target_lons, sensor_height_m=2000).all()
+    clearance = dted.get_line_of_sight_clearance(sensor, target_lats.reshape(2, 2), target_lons.reshape(2, 2))
+    assert clearance.shape == (2, 2)
+    assert np.array_equal(clearance.ravel() >= 0, visible)
+
+
+def test_get_line_of_sight_earth_curvature(ridge_dted_directory):
+    import numpy as np
+    import dted
+    # over flat terrain the 4/3-earth radio horizon for two 2 m antennas is about 11.7 km
+    sensor = [49.1, 11.05]
+    target_lats = np.array([49.1 + 8 / 111.2, 49.1 + 20 / 111.2])
+    target_lons = np.array([11.05, 11.05])
+    assert dted.get_line_of_sight(sensor, target_lats, target_lons).tolist() == [True, False]
+    assert dted.get_line_of_sight(sensor, target_lats, target_lons, target_height_m=50).all()
+    # a weaker refraction model shortens the horizon
+    assert dted.get_line_of_sight(sensor, target_lats, target_lons, target_height_m=15)[1]
+    assert not dted.get_line_of_sight(sensor, target_lats, target_lons, target_height_m=15, weather_coeff=1.0)[1]
+
+
+def test_get_fresnel_clearance(ridge_dted_directory):
+    import numpy as np
+    import dted
+    sensor = [49.5, 11.1]
+    target_lats = np.array([49.5, 49.5])
+    target_lons = np.array([11.2, 11.6])
+    fresnel = dted.get_fresnel_clearance(sensor, target_lats, target_lons, 1000)
+    # 2 m antennas over flat ground sit well inside the zone; the ridge blocks the path outright
+    assert fresnel["obstructed"].tolist() == [True, True]
+    assert 0 < fresnel["clearance_percent"][0] < 60 and fresnel["clearance_percent"][1] < 0
+    assert np.isclose(fresnel["obstruction_lons"][1], 11.5, atol=0.01) and np.isclose(fresnel["obstruction_lats"][1], 49.5, atol=0.01)
+    assert 0 < fresnel["obstruction_distances_m"][0] < 7500
+    assert not dted.get_fresnel_clearance(sensor, target_lats[:1], target_lons[:1], 1000, sensor_height_m=200, target_height_m=200)["obstructed"][0]
+    # agrees with the Fresnel-aware line of sight test
+    clearance = dted.get_fresnel_clearance(sensor, target_lats.reshape(1, 2), target_lons.reshape(1, 2), 1000, fresnel_zone_fraction=0.3)
+    assert clearance["clearance_percent"].shape == (1, 2)
+    los = dted.get_line_of_sight(sensor, target_lats, target_lons, frequency_MHz=1000, fresnel_zone_fraction=0.3)
+    assert np.array_equal(~clearance["obstructed"].ravel(), los)
+
+
+def test_deygout_diffraction_loss():
+    import numpy as np
+    from ew import deygout_diffraction_loss, knife_edge_diffraction_loss
+    assert np.isclose(knife_edge_diffraction_loss(0.0), 6.0, atol=0.1)
+    assert knife_edge_diffraction_loss(-1.0) == 0 and knife_edge_diffraction_loss(2.0) > knife_edge_diffraction_loss(1.0)
+    distances_m = np.arange(0, 10001, 100.0)
+    elevations_m = np.full(distances_m.size, 100.0)
+    # tall masts clear flat ground; a ridge that grazes the sight line costs about 6 dB
+    assert np.allclose(deygout_diffraction_loss(distances_m, elevations_m, 100, 100, 150), 0)
+    elevations_m[50] = 200
+    loss = deygout_diffraction_loss(distances_m, elevations_m, 100, 100, 150)
+    assert np.allclose(loss[:51], 0) and np.isclose(loss[-1], 6.0, atol=0.5)
+    elevations_m[50] = 400
+    assert np.all(deygout_diffraction_loss(distances_m, elevations_m, 100, 100, 150)[51:] > loss[51:])
+
+
+def test_get_lob_distance_band(ridge_dted_directory):
+    import numpy as np
+    import dted
+    from ew import theoretical_received_power
+    sensor = [49.5, 11.1]
+    profile = dted.get_lob_diffraction_profile(sensor, 90, 40000, 150, 10, 10)
+    distances_m = profile["distances_m"]
+    behind_ridge = distances_m > 29000
+    assert profile["diffraction_loss_dB"][behind_ridge].min() > profile["diffraction_loss_dB"][~behind_ridge].max()
+    # the measured power of a 5 W emitter 5 km out is matched there, and not behind the ridge
+    index = np.argmin(np.abs(distances_m - 5000))
+    received_power_dBm = float(theoretical_received_power(5, 150, 0, 0, distances_m[index] / 1000) - profile["diffraction_loss_dB"][index])
+    band = dted.get_lob_distance_band(sensor, 90, 150, 4, 6, 0, 0, received_power_dBm, 10, 10, max_distance_m=40000)
+    assert band["matches"][np.argmin(np.abs(band["distances_m"] - distances_m[index]))]
+    assert band["min_distance_m"] < 5000 < band["max_distance_m"] < 29000
+    assert dted.get_lob_distance_band(sensor, 90, 150, 4, 6, 0, 0, 50.0)["min_distance_m"] is None
+
+
+def test_get_viewshed(ridge_dted_directory, tmp_path):
+    import numpy as np
+    import dted
+    from coords import convert_coords_to_mgrs
+    sensor = [49.5, 11.45]
+    visible, (south, west, north, east) = dted.get_viewshed(convert_coords_to_mgrs(sensor), sensor_height_m=2, radius_m=8000)
+    assert visible.dtype == bool and visible.shape[0] % 2 == 1 and visible.shape[1] % 2 == 1
+    assert south < sensor[0] < north and west < sensor[1] < east
+    lats = np.linspace(north, south, visible.shape[0] + 1)[:-1] - (north - south) / visible.shape[0] / 2
+    lons = np.linspace(west, east, visible.shape[1] + 1)[:-1] + (east - west) / visible.shape[1] / 2
+    grid_lons, grid_lats = np.meshgrid(lons, lats)
+    # the ridge hides the terrain behind it, the near side is in view
+    assert visible[np.isclose(grid_lons, 11.425) & np.isclose(grid_lats, 49.5)].all()
+    assert not visible[(grid_lons > 11.51) & (np.abs(grid_lats - 49.5) < 0.02)].any()
+    # the radial sweep agrees with the exact line-of-sight engine almost everywhere
+    in_radius = np.hypot((grid_lats - sensor[0]) * 111195, (grid_lons - sensor[1]) * 111195 * np.cos(np.radians(49.5))) <= 7500
+    exact = dted.get_line_of_sight(sensor, grid_lats[in_radius], grid_lons[in_radius], target_height_m=2, method="nearest")
+    assert np.mean(exact == visible[in_radius]) > 0.95
+    overlay_path = dted.save_viewshed_overlay(visible, (south, west, north, east), str(tmp_path / "viewshed.png"))
+    from PIL import Image
+    with Image.open(overlay_path) as image:
+        assert image.size == (visible.shape[1], visible.shape[0]) and image.mode == "RGBA"
+    # the world file puts the center of the top-left post at the first grid coordinate
+    world = np.loadtxt(tmp_path / "viewshed.pgw")
+    assert np.allclose(world, [lons[1] - lons[0], 0, 0, lats[1] - lats[0], lons[0], lats[0]])
+
+
+def test_get_terrain_masked_polygons(ridge_dted_directory):
+    from shapely.geometry import Polygon
+    from map import get_terrain_masked_polygons
+    sensor = [49.5, 11.4]
+    polygon = [[49.48, 11.42], [49.52, 11.42], [49.52, 11.58], [49.48, 11.58]]
+    visible_polygons, hidden_polygons, visible_fraction = get_terrain_masked_polygons(sensor, polygon)
+    # only the half of the box in front of the ridge at 11.5E is visible
+    assert 0.45 < visible_fraction < 0.55
+    assert len(visible_polygons) == 1 and all(lon < 11.51 for _, lon in visible_polygons[0])
+    assert len(hidden_polygons) == 1 and all(lon > 11.49 for _, lon in hidden_polygons[0])
+    # the visible and hidden outlines tile the box, and the fraction is measured on them
+    visible_area = sum(Polygon(x).area for x in visible_polygons)
+    assert visible_area + sum(Polygon(x).area for x in hidden_polygons) == pytest.approx(Polygon(polygon).area)
+    assert visible_area / Polygon(polygon).area == pytest.approx(visible_fraction)
+    # a 34 MHz first Fresnel zone is not cleared by 2 m antennas over flat ground
+    assert get_terrain_masked_polygons(sensor, polygon, frequency_MHz=34.25)[2] < visible_fraction
+
+
+def test_get_polygon_outlines():
+    from shapely.geometry import Polygon
+    from map import get_polygon_outlines
+    holes = [[(1, 1), (1, 2), (2, 2), (2, 1)], [(6, 6), (6, 8), (8, 8), (8, 6)], [(1, 6), (1, 7), (2, 7), (2, 6)]]
+    polygon = Polygon([(0, 0), (0, 10), (10, 10), (10, 0)], holes)
+    outlines = get_polygon_outlines(polygon)
+    # the outlines are drawn filled, so the holes must be cut out of them
+    assert len(outlines) > 1 and sum(Polygon(x).area for x in outlines) == pytest.approx(polygon.area)
+    assert get_polygon_outlines(Polygon([(0, 0), (0, 1), (1, 1)])) == [[(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (0.0, 0.0)]]
+
+
+def test_dted_catalog(dted_directory):
+    import json
+    import numpy as np
+    import dted
+    (dted_directory / "e011" / "n49.dt0").write_bytes(b"")
+    dted.DTEDCatalog.refresh()
+    cells = dted.DTEDCatalog.get_cells()
+    assert set(cells) == {(49, 11), (49, 12)}
+    assert cells[(49, 11)]["levels"] == [2, 0] and cells[(49, 11)]["file"] == "e011/n49.dt2"
+    assert cells[(49, 12)]["bounds"] == [49, 12, 50, 13]
+    assert dted.DTEDCatalog.get_coverage_bounds() == (49.0, 11.0, 50.0, 13.0)
+    assert dted.DTEDCatalog.get_file(49.5, 11.5) == dted.get_dted_file(49.5, 11.5)
+    assert dted.DTEDCatalog.get_file(48.5, 11.5) is None
+    assert dted.DTEDCatalog.is_path_covered([49.2, 11.7], [49.25, 12.3])
+    assert dted.DTEDCatalog.get_missing_cells_along_path([49.5, 12.5], [49.5, 13.5]) == [(49, 13)]
+    assert dted.DTEDCatalog.get_missing_cells(np.array([49.5, 48.5, 48.2]), np.array([11.5, 11.5, 11.9])) == [(48, 11)]
+    # the manifest is reused until a tile is added or removed
+    manifest_path = dted_directory / dted.DTEDCatalog.MANIFEST_FILENAME
+    manifest = json.loads(manifest_path.read_text())
+    assert len(manifest["cells"]) == 2
+    manifest["cells"] = manifest["cells"][:1]
+    manifest_path.write_text(json.dumps(manifest))
+    dted.DTEDCatalog.load()
+    assert len(dted.DTEDCatalog.get_cells()) == 1
+    (dted_directory / "e013").mkdir()
+    (dted_directory / "e013" / "n49.dt1").write_bytes(b"")
+    dted.DTEDCatalog.load()
+    assert set(dted.DTEDCatalog.get_cells()) == {(49, 11), (49, 12), (49, 13)}
+
+
+def test_downsample_elevation():
+    import numpy as np
+    import dted
+    rows, cols = np.mgrid[0:121, 0:121]
+    plane = rows * 10 + cols
+    coarse = dted.downsample_elevation(plane, 4)
+    assert coarse.shape == (31, 31) and coarse.dtype == np.int16
+    # a box filter leaves a plane unchanged away from the edges
+    assert np.array_equal(coarse[1:-1, 1:-1], plane[4:-4:4, 4:-4:4])
+    assert dted.downsample_elevation(plane, 16).shape == (8, 8)
+
+
+def test_dted_pyramid(dted_directory):
+    import numpy as np
+    import dted
+    written = dted.build_dted_pyramid(49.5, 11.5, factors=(4,))
+    assert written == [dted.get_dted_pyramid_file(49, 11, 4)]
+    assert dted.build_dted_pyramid(49.5, 11.5, factors=(4,)) == []
+    # level 0 posts are ~926 m apart, so x4 (~3.7 km) serves 5 km but not 1 km requests
+    assert dted.get_dted_pyramid_factor(49.5, 11.5, 5000) == 4
+    assert dted.get_dted_pyramid_factor(49.5, 11.5, 1000) == 1
+    assert dted.get_dted_pyramid_factor(49.5, 12.5, 5000) == 1
+    assert dted.get_dted_file_for_resolution(49.5, 11.5, 5000).endswith("n49_x4.npz")
+    # pyramid posts line up with the DTED posts they were sampled from
+    lats = 50 - np.arange(1, 30) * 4 / 120
+    lons = 11 + np.arange(1, 30) * 4 / 120
+    np.testing.assert_array_equal(dted.get_elevations(lats, lons, resolution_m=5000), dted.get_elevations(lats, lons))
+    visible, _ = dted.get_viewshed(dted.convert_coords_to_mgrs([49.5, 11.5]), radius_m=20000, resolution_m=5000)
+    assert visible.shape == (13, 19)
+
+
+def test_dted_container(dted_directory):
+    import shutil
+    import numpy as np
+    import dted
+    rng = np.random.default_rng(2)
+    lats = rng.uniform(49.0, 49.999, 300)
+    lons = rng.uniform(11.0, 12.999, 300)
+    expected = dted.get_elevations(lats, lons)
+    index = dted.build_dted_container()
+    assert sorted(index["cells"]) == ["e011/n49.dt2", "e012/n49.dt2"]
+    # a rebuild repacks the loose files even while the old container is catalogued and mapped
+    dted.DTEDCatalog.refresh()
+    assert "#" in dted.get_dted_file(49.5, 12.5)
+    np.testing.assert_array_equal(dted.get_elevations(lats, lons), expected)
+    assert dted.build_dted_container()["cells"] == index["cells"]
+    assert dted.DTEDTileCache.get_stats()["tiles"] == 0
+    # only the container is shipped
+    shutil.rmtree(dted_directory / "e011")
+    shutil.rmtree(dted_directory / "e012")
+    dted.DTEDTileCache.clear_cache()
+    dted.DTEDCatalog.load()
+    file_path = dted.get_dted_file(49.5, 12.5)
+    assert file_path.endswith("dted_container.bin#e012/n49.dt2")
+    assert isinstance(dted.DTEDTileCache.get_tile(file_path).elevation, np.memmap)
+    np.testing.assert_array_equal(dted.get_elevations(lats, lons), expected)
+    assert dted.get_dted_post_spacing_m(49.5, 11.5) > 0
+    with pytest.raises(FileNotFoundError):
+        dted.get_elevations(np.array([48.5]), np.array([11.5]))
+
+
+def test_dted_prefetcher(dted_directory):
+    import dted
+    assert set(dted.DTEDPrefetcher.get_cells_within_radius([49.5, 11.95], 10)) == {(49, 11), (49, 12)}
+    assert (49, -180) in dted.DTEDPrefetcher.get_cells_within_radius([49.5, 179.99], 5)
+    futures = dted.DTEDPrefetcher.prefetch([[49.5, 11.95], None], radius_km=10)
+    assert len(futures) == 2
+    for future in futures:
+        future.result(timeout=10)
+    assert dted.DTEDTileCache.contains(dted.get_dted_file(49.5, 11.5))
+    assert dted.DTEDTileCache.contains(dted.get_dted_file(49.5, 12.5))
+    # resident tiles are not queued again
+    assert dted.DTEDPrefetcher.prefetch([[49.5, 11.95]], radius_km=10) == []
+    dted.DTEDPrefetcher.shutdown(wait=True)
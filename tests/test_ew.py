@@ -0,0 +1,44 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure src/ is in the system path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import ew
+
+
+def test_convert_watts_to_dBm_array():
+    watts = np.array([[0.001, 1], [5, 100]])
+    assert np.allclose(ew.convert_watts_to_dBm_array(watts), [[ew.convert_watts_to_dBm(float(w)) for w in row] for row in watts])
+    with pytest.raises(AssertionError):
+        ew.convert_watts_to_dBm_array([1, -1])
+
+
+def test_get_emission_distance_array_matches_scalar():
+    rng = np.random.default_rng(0)
+    P_t_watts = rng.uniform(0.5, 50, 40)
+    path_loss_coeff = rng.choice([2, 3, 3.5, 4, 4.5, 5], 40)
+    R_s = rng.uniform(-110, -50, 40)
+    t_h = rng.uniform(1, 30, 40)
+    for pure_pathLoss in [True, False]:
+        expected = [
+            ew.get_emission_distance(P, 150, 2, 0, R, h, 2, 70, n, pure_pathLoss=pure_pathLoss)
+            for P, R, h, n in zip(P_t_watts, R_s, t_h, path_loss_coeff)
+        ]
+        actual = ew.get_emission_distance_array(P_t_watts, 150, 2, 0, R_s, t_h, 2, 70, path_loss_coeff, pure_pathLoss=pure_pathLoss)
+        assert np.allclose(actual, expected, rtol=1e-12)
+
+
+def test_get_emission_distance_array_broadcasts():
+    P_t_watts = np.linspace(1, 10, 4)[:, None, None]
+    path_loss_coeff = np.array([2, 3, 4])[None, :, None]
+    R_s = np.linspace(-100, -60, 5)[None, None, :]
+    distances = ew.get_emission_distance_array(P_t_watts, 150, 0, 0, R_s, 2, 2, 70, path_loss_coeff)
+    assert distances.shape == (4, 3, 5)
+    assert distances[1, 2, 3] == pytest.approx(ew.get_emission_distance(float(P_t_watts[1, 0, 0]), 150, 0, 0, float(R_s[0, 0, 3]), 2, 2, 70, 4))
+    # more power reaches further, a stronger signal is closer
+    assert np.all(np.diff(distances, axis=0) >= 0) and np.all(np.diff(distances, axis=2) <= 0)
+    ducting = ew.emission_optical_maximum_distance_with_ducting_array([2, 10], 2, 150, 70)
+    assert np.allclose(ducting, [ew.emission_optical_maximum_distance_with_ducting(h, 2, 150, 70) for h in [2, 10]])
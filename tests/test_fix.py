@@ -0,0 +1,90 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure src/ is in the system path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import fix
+from coords import adjust_coordinates, convert_coords_to_enu, convert_enu_to_coords, get_distances_between_coords
+
+
+def make_reports(target, sensor_lats, sensor_lons, bearing_noise_deg=None, bearing_error=4):
+    from pyproj import Geod
+    # true WGS84 azimuths from each sensor to the target
+    bearings, _, _ = Geod(ellps="WGS84").inv(sensor_lons, sensor_lats, np.full(len(sensor_lats), target[1]), np.full(len(sensor_lats), target[0]))
+    if bearing_noise_deg is not None:
+        bearings = bearings + bearing_noise_deg
+    return [{"coord": [lat, lon], "bearing": float(b) % 360, "bearing_error": bearing_error} for lat, lon, b in zip(sensor_lats, sensor_lons, bearings)]
+
+
+@pytest.mark.parametrize("origin", [[49.6, 11.3], [-33.8, 151.0], [0.0, 179.9]])
+def test_enu_round_trip(origin):
+    lats = np.array([49.5, 49.7, -33.9, 0.01])
+    lons = np.array([11.1, 11.5, 151.2, -179.99])
+    east, north, up = convert_coords_to_enu(origin, lats, lons)
+    new_lats, new_lons = convert_enu_to_coords(origin, east, north, up)
+    assert np.allclose(new_lats, lats, rtol=0, atol=1e-9)
+    assert np.allclose((new_lons - lons + 180) % 360 - 180, 0, rtol=0, atol=1e-9)
+
+
+def test_enu_north_offset():
+    east, north, up = convert_coords_to_enu([49.6, 11.3], 49.7, 11.3)
+    # 0.1 degree of WGS84 meridian arc near 49.6N is about 11,122 m
+    assert abs(east) < 1e-6 and north == pytest.approx(11122, abs=5) and up < 0
+
+
+def test_stansfield_fix_exact_bearings():
+    target = [49.55, 11.25]
+    reports = make_reports(target, [49.5, 49.62, 49.58], [11.1, 11.2, 11.4])
+    result = fix.get_stansfield_fix(reports)
+    assert result["converged"] and result["consistent"]
+    assert get_distances_between_coords(target, result["coord"][0], result["coord"][1]) < 0.5
+    assert np.all(np.abs(result["residuals_deg"]) < 1e-3)
+    assert result["semi_major_m"] >= result["semi_minor_m"] > 0
+    assert len(result["ellipse_coords"]) == fix.FIX_ELLIPSE_POINTS
+
+
+def test_stansfield_fix_many_noisy_reports():
+    rng = np.random.default_rng(0)
+    target = [49.55, 11.25]
+    sensor_lats, sensor_lons = adjust_coordinates(target, rng.uniform(0, 360, 300), rng.uniform(5000, 20000, 300))
+    # sensor error of 4 degrees holds about 95% of the bearings
+    reports = make_reports(target, sensor_lats, sensor_lons, rng.normal(0, 2, 300))
+    result = fix.get_stansfield_fix(reports)
+    distance_m = get_distances_between_coords(target, result["coord"][0], result["coord"][1])
+    assert result["converged"] and distance_m < result["semi_major_m"]
+    # reduced chi-square near one when the bearings match the stated sensor error
+    assert 0.7 < result["chi_square"] / (len(reports) - 2) < 1.3
+
+
+def test_stansfield_fix_power_ranges():
+    target = [49.55, 11.25]
+    # the near sensor is received 20 dB stronger than the two far ones
+    reports = make_reports(target, [49.5, 49.62, 49.58], [11.1, 11.4, 11.2], np.array([1.5, -1.5, 1.0]))
+    for report, power_dBm in zip(reports, [-85, -85, -65]):
+        report.update(power_received_dBm=power_dBm, receiver_gain_dBi=0)
+    power_kwargs = dict(frequency_MHz=150, min_P_t_watts=1, max_P_t_watts=10)
+    # the powers only weight the first pass
+    first_pass = fix.get_stansfield_fix(reports, max_iterations=1, **power_kwargs)
+    assert not np.allclose(first_pass["coord"], fix.get_stansfield_fix(reports, max_iterations=1)["coord"], rtol=0, atol=1e-6)
+    with_power = fix.get_stansfield_fix(reports, **power_kwargs)
+    without_power = fix.get_stansfield_fix(reports)
+    assert with_power["converged"] and np.allclose(with_power["coord"], without_power["coord"], rtol=0, atol=1e-5)
+    # the array entry point takes the powers as an ndarray
+    lats, lons = np.array([report["coord"] for report in reports]).T
+    from_arrays = fix.get_stansfield_fix_from_arrays(
+        lats, lons, [report["bearing"] for report in reports], 4, power_received_dBm=np.array([-85, -85, -65.]), **power_kwargs
+    )
+    assert from_arrays["coord"] == pytest.approx(with_power["coord"], abs=1e-9)
+
+
+def test_stansfield_fix_degenerate():
+    reports = [{"coord": [49.5, 11.1], "bearing": 90, "bearing_error": 4}, {"coord": [49.5, 11.1], "bearing": 270, "bearing_error": 4}]
+    assert fix.get_stansfield_fix(reports) is None
+    # LOBs that diverge only meet behind the sensors
+    reports = make_reports([49.55, 11.25], [49.5, 49.62], [11.1, 11.2])
+    for report in reports:
+        report["bearing"] = (report["bearing"] + 180) % 360
+    assert not fix.get_stansfield_fix(reports)["consistent"]
@@ -39,9 +39,9 @@ def expected_values():
             "expected_sensor1_distance": "1.89km at 129°",
             "expected_sensor2_distance": "N/A",
             "expected_sensor3_distance": "N/A",
-            "expected_target_error": "446 acres",
+            "expected_target_error": "292 acres",
             "expected_target_class": "(1 LOB)",
-            "expected_target_coord": [49.24437525321693, 11.77266110324632],
+            "expected_target_coord": [49.244375253216745, 11.772661068297834],
             "expected_target_mgrs": "32UQV0179358322"
         },
         "LOB_EWT2": {
@@ -50,9 +50,9 @@ def expected_values():
             "expected_sensor1_distance": "N/A",
             "expected_sensor2_distance": "2.11km at 99°",
             "expected_sensor3_distance": "N/A",
-            "expected_target_error": "564 acres",
+            "expected_target_error": "370 acres",
             "expected_target_class": "(1 LOB)",
-            "expected_target_coord": [49.24649727522025, 11.772304238438442],
+            "expected_target_coord": [49.246497275220094, 11.772304224854427],
             "expected_target_mgrs": "32UQV0175958557"
         },
         "LOB_EWT3": {
@@ -61,9 +61,9 @@ def expected_values():
             "expected_sensor1_distance": "N/A",
             "expected_sensor2_distance": "N/A",
             "expected_sensor3_distance": "2.38km at 74°",
-            "expected_target_error": "714 acres",
+            "expected_target_error": "468 acres",
             "expected_target_class": "(1 LOB)",
-            "expected_target_coord": [49.24829283849336, 11.771573744236349],
+            "expected_target_coord": [49.24829283849324, 11.771573766629693],
             "expected_target_mgrs": "32UQV0169858754"
         },
         "CUT_EWT1_EWT2": {
@@ -72,9 +72,9 @@ def expected_values():
             "expected_sensor1_distance": "1.43km at 129°",
             "expected_sensor2_distance": "1.78km at 99°",
             "expected_sensor3_distance": "N/A",
-            "expected_target_error": "100 acres",
+            "expected_target_error": "66 acres",
             "expected_target_class": "(CUT)",
-            "expected_target_coord": [49.247009833868965, 11.767851178576054],
+            "expected_target_coord": [49.24701284295923, 11.76785159582333],
             "expected_target_mgrs": "32UQV0143358602"
         },
         "CUT_EWT1_EWT3": {
@@ -83,9 +83,9 @@ def expected_values():
             "expected_sensor1_distance": "1.35km at 129°",
             "expected_sensor2_distance": "N/A",
             "expected_sensor3_distance": "2.04km at 74°",
-            "expected_target_error": "58 acres",
+            "expected_target_error": "38 acres",
             "expected_target_class": "(CUT)",
-            "expected_target_coord": [49.24748873637496, 11.766976917051867],
+            "expected_target_coord": [49.247492551986014, 11.76697575667525],
             "expected_target_mgrs": "32UQV0136758653"
         },
         "CUT_EWT2_EWT3": {
@@ -94,21 +94,21 @@ def expected_values():
             "expected_sensor1_distance": "N/A",
             "expected_sensor2_distance": "1.62km at 99°",
             "expected_sensor3_distance": "1.94km at 74°",
-            "expected_target_error": "159 acres",
+            "expected_target_error": "104 acres",
             "expected_target_class": "(CUT)",
-            "expected_target_coord": [49.24726059841342, 11.765672634976104],
+            "expected_target_coord": [49.24726399365996, 11.765669224123718],
             "expected_target_mgrs": "32UQV0127358624"
         },
         "Fix": {
-            "expected_target_grid": "32UQV 01374 58661",
+            "expected_target_grid": "32UQV 01373 58661",
             "expected_label_target_grid": "TARGET GRID (FIX)",
             "expected_sensor1_distance": "1.35km at 129°",
             "expected_sensor2_distance": "1.72km at 98°",
             "expected_sensor3_distance": "2.05km at 74°",
-            "expected_target_error": "53 acres",
+            "expected_target_error": "35 acres",
             "expected_target_class": "(FIX)",
-            "expected_target_coord": [49.247557821821765, 11.76706972332321],
-            "expected_target_mgrs": "32UQV0137458661"
+            "expected_target_coord": [49.24756049749352, 11.767068351739683],
+            "expected_target_mgrs": "32UQV0137358661"
         },
         "2_LOBs": {
             "expected_target_grid": "32UPV 98804 60644\n32UQV 01759 58557",
@@ -116,9 +116,9 @@ def expected_values():
             "expected_sensor1_distance": "1.89km at 310°",
             "expected_sensor2_distance": "2.11km at 99°",
             "expected_sensor3_distance": "N/A",
-            "expected_target_error": "564 acres",
+            "expected_target_error": "370 acres",
             "expected_target_class": "(2 LOBs)",
-            "expected_target_coord": "49.266214054206486, 11.732785386721917 | 49.24649727522025, 11.772304238438442",
+            "expected_target_coord": "49.26621405420667, 11.732785351738894 | 49.246497275220094, 11.772304224854427",
             "expected_target_mgrs": "32UPV9880460644, 32UQV0175958557"            
         },
         "3_LOBs": {
@@ -127,9 +127,9 @@ def expected_values():
             "expected_sensor1_distance": "1.89km at 310°",
             "expected_sensor2_distance": "2.11km at 99°",
             "expected_sensor3_distance": "2.38km at 255°",
-            "expected_target_error": "714 acres",
+            "expected_target_error": "468 acres",
             "expected_target_class": "(3 LOBs)",
-            "expected_target_coord": "49.266214054206486, 11.732785386721917 | 49.24649727522025, 11.772304238438442 | 49.237196232557714, 11.70813997293801",
+            "expected_target_coord": "49.26621405420667, 11.732785351738894 | 49.246497275220094, 11.772304224854427 | 49.23719623255784, 11.708139995320025",
             "expected_target_mgrs": "32UPV9880460644, 32UQV0175958557, 32UPV9712757354"            
         }
     }
@@ -0,0 +1,68 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure src/ is in the system path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import map
+from coords import get_geodesic_destinations, get_geodesic_inverse
+
+
+def test_local_plane_round_trip():
+    coords = [[60.2, 11.0], [60.25, 11.45], [60.4, 11.2]]
+    plane = map.LocalPlane(coords)
+    assert plane.origin == pytest.approx([np.mean([60.2, 60.25, 60.4]), np.mean([11.0, 11.45, 11.2])])
+    points = plane.to_plane(coords)
+    assert points.shape == (3, 2)
+    assert np.abs(np.array(plane.to_coords(points)) - coords).max() < 1e-10
+    # distances from the origin are geodesic
+    _, distances_m = get_geodesic_inverse(*plane.origin, np.array(coords)[:, 0], np.array(coords)[:, 1])
+    np.testing.assert_allclose(np.hypot(points[:, 0], points[:, 1]), distances_m, rtol=1e-12)
+
+
+@pytest.mark.parametrize("lat", [0, 35, 60, 75])
+def test_polygon_area(lat):
+    # 10 km x 10 km square
+    lats, lons = get_geodesic_destinations(lat, 10, [45, 135, 225, 315], 5000 * np.sqrt(2))
+    square = np.column_stack([lats, lons]).tolist()
+    assert map.get_polygon_area(square) == pytest.approx(1e8 / map.SQUARE_METERS_PER_ACRE, rel=1e-3)
+    assert map.get_polygon_area(map.organize_polygon_coords(square[::-1])) == pytest.approx(map.get_polygon_area(square))
+
+
+def test_organize_polygon():
+    rng = np.random.default_rng(0)
+    angles = rng.permutation(np.linspace(0, 2 * np.pi, 12, endpoint=False))
+    points = np.column_stack([np.sin(angles), np.cos(angles)]) * rng.uniform(50, 100, (12, 1))
+    ordered = points[map.organize_polygon_points(points)]
+    bearings = np.arctan2(ordered[:, 0], ordered[:, 1]) % (2 * np.pi)
+    assert np.all(np.diff(bearings) > 0)
+    coords = [[49.5 + 0.01 * y / 100, 11.3 + 0.01 * x / 100] for x, y in points]
+    assert sorted(map.organize_polygon_coords(coords)) == sorted(coords)
+
+
+def test_intersections():
+    rng = np.random.default_rng(1)
+    p1s, p2s, p3s, p4s = (rng.uniform(-1000, 1000, (50, 2)) for _ in range(4))
+    L1s, L2s = map.get_lines(p1s, p2s), map.get_lines(p3s, p4s)
+    np.testing.assert_array_equal(L1s, [map.get_line(p1, p2) for p1, p2 in zip(p1s, p2s)])
+    np.testing.assert_allclose(map.get_intersections(L1s, L2s), [map.get_intersection(L1, L2) for L1, L2 in zip(L1s, L2s)])
+    parallel = map.get_intersections(map.get_line([0, 0], [1, 1]), map.get_line([0, 1], [1, 2]))
+    assert parallel.shape == (1, 2) and np.isnan(parallel).all()
+
+
+def test_lob_intersection_in_plane():
+    # geodesic LOBs from two sensors intersect at the target to well under a meter
+    rng = np.random.default_rng(2)
+    for _ in range(50):
+        target = [rng.uniform(-70, 70), rng.uniform(-170, 170)]
+        sensor_lats, sensor_lons = get_geodesic_destinations(*target, rng.uniform(0, 360, 2), rng.uniform(5000, 40000, 2))
+        azimuths, _ = get_geodesic_inverse(sensor_lats, sensor_lons, *target)
+        far_lats, far_lons = get_geodesic_destinations(sensor_lats, sensor_lons, azimuths, 60000)
+        plane = map.LocalPlane(np.column_stack([sensor_lats, sensor_lons]).tolist())
+        starts = plane.to_plane(np.column_stack([sensor_lats, sensor_lons]))
+        ends = plane.to_plane(np.column_stack([far_lats, far_lons]))
+        lines = map.get_lines(starts, ends)
+        fix_coord = plane.to_coords(map.get_intersections(lines[0], lines[1]))[0]
+        assert get_geodesic_inverse(*fix_coord, *target)[1] < 1
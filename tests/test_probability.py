@@ -0,0 +1,108 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure src/ is in the system path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import probability
+from coords import adjust_coordinate, adjust_coordinates, get_bearing_between_coordinates
+
+
+def make_sensor(coord, bearing, power_received_dBm=-88):
+    return {"coord": coord, "bearing": bearing, "bearing_error": 6, "power_received_dBm": power_received_dBm, "receiver_gain_dBi": 0}
+
+
+def test_adjust_coordinates_matches_scalar():
+    azimuths = np.array([0, 45, 129.5, 270, 359])
+    shifts_m = np.array([10, 500, 2500, 12000, 40000])
+    lats, lons = adjust_coordinates([49.5, 11.1], azimuths, shifts_m)
+    expected = [adjust_coordinate([49.5, 11.1], float(a), float(d)) for a, d in zip(azimuths, shifts_m)]
+    assert np.allclose(np.column_stack([lats, lons]), expected, rtol=0, atol=1e-12)
+
+
+def test_sample_lob_emitter_locations():
+    from ew import get_emission_distance
+    rng = np.random.default_rng(0)
+    lats, lons = probability.sample_lob_emitter_locations([49.5, 11.1], 90, 6, -88, 0, 150, 1, 10, path_loss_coeff=3, power_noise_dB=0, path_loss_coeff_spread=0, num_samples=20_000, rng=rng)
+    bearings = np.array([get_bearing_between_coordinates([49.5, 11.1], [lat, lon]) for lat, lon in zip(lats[:2000], lons[:2000])])
+    # the +/- sensor error wedge holds about 95% of the samples
+    assert 0.9 < np.mean(np.abs(bearings - 90) <= 6) < 0.99
+    distances_km = np.hypot((lats - 49.5) * 111.19, (lons - 11.1) * 111.19 * np.cos(np.radians(49.5)))
+    assert distances_km.min() >= 0.99 * get_emission_distance(1, 150, 0, 0, -88, 2, 2, 70, 3, pure_pathLoss=True)
+    assert distances_km.max() <= 1.01 * get_emission_distance(10, 150, 0, 0, -88, 2, 2, 70, 3, pure_pathLoss=True)
+
+
+def test_monte_carlo_probability_surface_cut():
+    sensors = [make_sensor([49.5, 11.1], 90), make_sensor([49.6, 11.3], 180)]
+    surface = probability.get_monte_carlo_probability_surface(sensors, 150, 1, 10, path_loss_coeff=3, seed=0)
+    assert surface["consistent"] and surface["num_samples"] == 200_000
+    assert np.isclose(surface["density"].sum(), 1)
+    south, west, north, east = surface["bounds"]
+    assert south < surface["peak_coord"][0] < north and west < surface["peak_coord"][1] < east
+    # the LOBs cross near 49.5N 11.3E
+    assert np.allclose(surface["peak_coord"], [49.5, 11.3], atol=0.02)
+    polygons, acres = probability.get_credible_region_polygons(surface, 0.5)
+    assert len(polygons) == 1
+    assert acres < probability.get_credible_region_polygons(surface, 0.95)[1]
+    # a repeatable seed gives the same surface
+    assert np.array_equal(surface["density"], probability.get_monte_carlo_probability_surface(sensors, 150, 1, 10, path_loss_coeff=3, seed=0)["density"])
+
+
+def test_monte_carlo_probability_surface_disjoint_lobs():
+    sensors = [make_sensor([49.5, 11.1], 270), make_sensor([49.5, 11.3], 90)]
+    surface = probability.get_monte_carlo_probability_surface(sensors, 150, 1, 10, path_loss_coeff=3, num_samples=10_000, seed=0)
+    assert not surface["consistent"] and np.isclose(surface["density"].sum(), 1)
+    with pytest.raises(AssertionError):
+        probability.get_monte_carlo_probability_surface(sensors * 2, 150, 1, 10)
+
+
+def test_get_credible_region_mask():
+    density = np.array([[0.1, 0.4], [0.3, 0.2]])
+    assert probability.get_credible_region_mask(density, 0.5).tolist() == [[False, True], [True, False]]
+    assert probability.get_credible_region_mask(density, 1.0).all()
+
+
+def test_save_probability_overlay(tmp_path):
+    import matplotlib.pyplot as plt
+    density = np.zeros((20, 30))
+    density[5, 7] = 1
+    file_path = probability.save_probability_overlay(density, (49.0, 11.0, 49.2, 11.6), str(tmp_path / "surface.png"))
+    image = plt.imread(file_path)
+    assert image.shape == (20, 30, 4)
+    assert image[5, 7, 3] > 0.5 and image[0, 0, 3] == 0
+    assert np.allclose(np.loadtxt(tmp_path / "surface.pgw"), [0.02, 0, 0, -0.01, 11.01, 49.195])
+
+
+def test_array_distance_and_bearing_match_scalar():
+    from coords import get_bearings_between_coordinates, get_distance_between_coords, get_distances_between_coords
+    lats = np.array([49.6, 49.2, 50.5, 49.5])
+    lons = np.array([11.1, 10.4, 12.9, 11.1])
+    assert np.allclose(get_distances_between_coords([49.5, 11.1], lats, lons), [get_distance_between_coords([49.5, 11.1], [lat, lon]) for lat, lon in zip(lats, lons)])
+    assert np.allclose(get_distances_between_coords([49.5, 11.1], lats, lons, 'km'), [get_distance_between_coords([49.5, 11.1], [lat, lon], 'km') for lat, lon in zip(lats, lons)])
+    assert np.allclose(get_bearings_between_coordinates([49.5, 11.1], lats[:3], lons[:3]), [get_bearing_between_coordinates([49.5, 11.1], [lat, lon]) for lat, lon in zip(lats[:3], lons[:3])])
+
+
+@pytest.mark.parametrize("num_sensors", [1, 2, 3, 4])
+def test_bayesian_probability_surface(num_sensors):
+    sensors = [make_sensor([49.5, 11.1], 90), make_sensor([49.6, 11.3], 180), make_sensor([49.4, 11.4], 315), make_sensor([49.5, 11.6], 270)][:num_sensors]
+    surface = probability.get_bayesian_probability_surface(sensors, 150, 1, 10, path_loss_coeff=3)
+    assert np.isclose(surface["density"].sum(), 1) and surface["consistent"]
+    assert surface["credible_polygons"] and surface["credible_acres"] > 0 and surface["credible_level"] == 0.9
+    if num_sensors == 1:
+        # a lone LOB puts the MAP estimate on its bearing
+        assert np.isclose(surface["peak_coord"][0], 49.5, atol=0.01) and surface["peak_coord"][1] > 11.1
+    else:
+        # the LOBs cross near 49.5N 11.3E
+        assert np.allclose(surface["peak_coord"], [49.5, 11.3], atol=0.02)
+
+
+def test_bayesian_probability_surface_always_solves():
+    # LOBs pointing away from each other still give a MAP estimate and credible region
+    sensors = [make_sensor([49.5, 11.1], 270), make_sensor([49.5, 11.3], 90)]
+    surface = probability.get_bayesian_probability_surface(sensors, 150, 1, 10, path_loss_coeff=3)
+    assert not surface["consistent"]
+    assert np.isfinite(surface["peak_coord"]).all() and surface["credible_polygons"]
+    more_lobs = probability.get_bayesian_probability_surface(sensors + [make_sensor([49.4, 11.2], 0)], 150, 1, 1)
+    assert np.isclose(more_lobs["density"].sum(), 1)
@@ -0,0 +1,123 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure src/ is in the system path for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+import targeting
+from coords import convert_mgrs_to_coords, get_geodesic_destinations, get_geodesic_inverse
+from map import LocalPlane, get_polygon_area
+from utilities import read_json
+conf = read_json(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "config_files", "conf.json"))
+
+
+def default_report(n: int, flip: bool = False) -> dict:
+    bearing = float(conf[f"DEFAULT_SENSOR_{n}_LOB"])
+    return {
+        "coord": convert_mgrs_to_coords(conf[f"DEFAULT_SENSOR_{n}_MGRS"]),
+        "bearing": (bearing + 180) % 360 if flip else bearing,
+        "power_received_dBm": float(conf[f"DEFAULT_SENSOR_{n}_PWR_RECEIVED"]),
+    }
+
+
+def get_default_targets(reports: list[dict]) -> dict:
+    return targeting.get_targets(reports, float(conf["DEFAULT_FREQUENCY_MHZ"]), float(conf["DEFAULT_MIN_ERP_W"]), float(conf["DEFAULT_MAX_ERP_W"]))
+
+
+@pytest.mark.parametrize("sensors,expected_class,expected_mgrs,expected_acres,expected_distances", [
+    ([1], "1 LOB", "32UQV0179358322", 292, [(1888, 129)]),
+    ([2], "1 LOB", "32UQV0175958557", 370, [(2113, 99)]),
+    ([1, 2], "CUT", "32UQV0143358602", 66, [(1432, 129), (1785, 99)]),
+    ([1, 3], "CUT", "32UQV0136758653", 38, [(1349, 129), (2038, 74)]),
+    ([2, 3], "CUT", "32UQV0127358624", 104, [(1624, 99), (1940, 74)]),
+    ([1, 2, 3], "FIX", "32UQV0137358661", 35, [(1350, 129), (1719, 98), (2046, 74)]),
+])
+def test_default_inputs(sensors, expected_class, expected_mgrs, expected_acres, expected_distances):
+    result = get_default_targets([default_report(n) for n in sensors])
+    assert result["target_class"] == expected_class
+    assert result["target_mgrs"] == expected_mgrs
+    assert round(result["target_error_acres"]) == expected_acres
+    assert list(zip(result["distances_m"], result["bearings_deg"])) == expected_distances
+    assert [target["class"] for target in result["targets"]].count("LOB") == len(sensors)
+
+
+def test_lobs_without_intersection():
+    result = get_default_targets([default_report(1, flip=True), default_report(2), default_report(3, flip=True)])
+    assert result["target_class"] == "3 LOBs"
+    assert [target["target_mgrs"] for target in result["targets"]] == ["32UPV9880460644", "32UQV0175958557", "32UPV9712757354"]
+    # the primary target is the LOB with the least error
+    assert result["target_mgrs"] == "32UPV9880460644"
+    # sensor positions without a LOB are skipped but still ranged to the target
+    result = get_default_targets([{"coord": default_report(1)["coord"]}, default_report(2)])
+    assert result["target_class"] == "1 LOB" and result["lobs"][0] is None and result["distances_m"][0] > 0
+    with pytest.raises(AssertionError):
+        get_default_targets([{"coord": default_report(1)["coord"]}])
+
+
+def test_target_markers():
+    # the EWT panel passes None for an unused EWT slot
+    result = get_default_targets([default_report(1), None, default_report(3)])
+    assert result["target_class"] == "CUT" and result["lobs"][1] is None and result["distances_m"][1] is None
+    assert [(target["class"], target["marker"]) for target in result["targets"]] == [("LOB", False), ("LOB", False), ("CUT", True)]
+    # a FIX from the CUT overlap replaces the CUT markers, a LOB outside every CUT keeps its own
+    result = get_default_targets([default_report(n) for n in (1, 2, 3)])
+    assert [target["marker"] for target in result["targets"]] == [False] * 6 + [True]
+    result = get_default_targets([default_report(1), default_report(2), default_report(3, flip=True)])
+    assert [(target["class"], target["marker"]) for target in result["targets"]] == [("LOB", False), ("LOB", False), ("LOB", True), ("CUT", True)]
+
+
+def test_lob_geometry():
+    report = default_report(1)
+    plane = LocalPlane([report["coord"]])
+    min_distance_km, max_distance_km = targeting.get_lob_distance_band(report, 34.25, 0.005, 50)
+    assert 0 < min_distance_km < max_distance_km
+    lob = targeting.get_lob(report, min_distance_km * 1000, max_distance_km * 1000, plane)
+    assert lob["error_acres"] == pytest.approx(get_polygon_area(lob["polygon"]), rel=1e-6)
+    assert lob["target_coord"] == pytest.approx(np.mean([lob["near_center_coord"], lob["far_center_coord"]], axis=0).tolist())
+    # the plane center line runs from the sensor along the LOB bearing
+    sensor_point, far_point = np.array(lob["center_segment"])
+    assert np.dot(lob["center_line"][:2], sensor_point) == pytest.approx(lob["center_line"][2])
+    assert np.degrees(np.arctan2(*(far_point - sensor_point))) % 360 == pytest.approx(report["bearing"], abs=0.1)
+    assert not targeting.check_lob_intersection(lob, None)
+
+
+def test_fix_of_geodesic_lobs():
+    # LOBs aimed at a known emitter from four sensors
+    target = [49.55, 11.25]
+    sensor_lats, sensor_lons = get_geodesic_destinations(*target, [10, 100, 200, 290], [8000, 9000, 10000, 11000])
+    bearings, _ = get_geodesic_inverse(sensor_lats, sensor_lons, *target)
+    reports = [{"coord": [lat, lon], "bearing": bearing, "bearing_error": 2} for lat, lon, bearing in zip(sensor_lats, sensor_lons, bearings)]
+    plane = LocalPlane([report["coord"] for report in reports])
+    lobs = [targeting.get_lob(report, 5000, 15000, plane) for report in reports]
+    fix = targeting.get_fix(lobs, plane)
+    assert fix["method"] == "cut_overlap"
+    # the wedges are drawn as rhumb lines, which bow off the geodesic bearings over 10 km
+    assert get_geodesic_inverse(*fix["target_coord"], *target)[1] < 100
+    # LOBs that miss each other's CUTs have no FIX
+    reports[3]["bearing"] = (reports[3]["bearing"] + 25) % 360
+    assert targeting.get_fix([targeting.get_lob(report, 5000, 15000, plane) for report in reports], plane) is None
+
+
+def test_bayesian_fallback():
+    # three LOBs that cross pairwise without a common overlap
+    target = [49.55, 11.25]
+    sensor_lats, sensor_lons = get_geodesic_destinations(*target, [10, 130, 250], [8000, 9000, 10000])
+    bearings, _ = get_geodesic_inverse(sensor_lats, sensor_lons, *target)
+    reports = [{"coord": [lat, lon], "bearing": bearing, "bearing_error": 2, "power_received_dBm": -80, "receiver_gain_dBi": 0, "receiver_height_m": 2}
+               for lat, lon, bearing in zip(sensor_lats, sensor_lons, bearings)]
+    reports[2]["bearing"] = (reports[2]["bearing"] + 15) % 360
+    result = targeting.get_targets(reports, 100, 1, 10, distance_bands_km=[(5, 15)] * 3)
+    assert result["target_class"] == "CUT" and result["surface"] is None
+    result = targeting.get_targets(reports, 100, 1, 10, distance_bands_km=[(5, 15)] * 3, bayesian_fallback=True)
+    assert result["target_class"] == "FIX" and result["targets"][-1]["method"] == "bayesian"
+    # the solved surface is returned for the probability overlay
+    assert result["target_coord"] == list(result["surface"]["peak_coord"])
+
+
+def test_import_without_tk():
+    src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+    code = "import sys, targeting; assert not {'tkinter', 'customtkinter', 'tkintermapview'} & set(sys.modules), sorted(sys.modules)"
+    subprocess.run([sys.executable, "-c", code], cwd=src_dir, check=True)